@@ -1,12 +1,33 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 import os
+import logging
+from collections.abc import Mapping
 from logic.wasuk_bot_logic import WasukBotLogic
+from logic.deadline_executor import DeadlineExecutor
+from logic.metrics import METRICS
+from logic.kakao_response import KakaoResponse, encode_response, dumps
+from logic.structured_logging import get_logger, log_event
 
 app = Flask(__name__)
+logger = get_logger("webhook")
 
 # 챗봇 로직 초기화
 bot_logic = WasukBotLogic()
 
+# 카카오 5초 제한 안에 응답하도록 제한 시간을 두고 처리 (넘기면 콜백으로 전달)
+pipeline = DeadlineExecutor(
+    bot_logic.process_message,
+    deadline=float(os.environ.get('WEBHOOK_DEADLINE', 3.5)),
+    max_workers=int(os.environ.get('WEBHOOK_WORKERS', 8))
+)
+
+# /batch 한 번에 처리할 최대 발화 수
+BATCH_MAX_SIZE = int(os.environ.get('BATCH_MAX_SIZE', 1000))
+
+# 무거운 모듈(QA 색인, OpenAI 클라이언트 등)은 첫 요청 전에 백그라운드에서 미리 준비
+if os.environ.get('WARMUP', '1') != '0':
+    bot_logic.start_warm_up()
+
 @app.route('/webhook', methods=['POST'])
 def webhook():
     """
@@ -14,7 +35,8 @@ def webhook():
     """
     try:
         # 요청 데이터 파싱
-        data = request.get_json()
+        with METRICS.span("json_parse"):
+            data = request.get_json()
         
         if not data:
             return jsonify({"error": "요청 데이터가 없습니다."}), 400
@@ -22,22 +44,30 @@ def webhook():
         # 사용자 메시지 추출
         user_message = data.get('userRequest', {}).get('utterance', '')
         user_id = data.get('userRequest', {}).get('user', {}).get('id', 'default')
+        # 콜백이 활성화된 스킬이면 카카오가 1분간 유효한 콜백 URL을 함께 보냄
+        callback_url = data.get('userRequest', {}).get('callbackUrl')
         
         if not user_message:
             return jsonify({"error": "사용자 메시지가 없습니다."}), 400
         
-        print(f"사용자 ID: {user_id}")
-        print(f"사용자 메시지: {user_message}")
+        # 챗봇 로직으로 메시지 처리 (제한 시간 초과 시 콜백으로 전달)
+        with METRICS.span("webhook"):
+            response, deferred = pipeline.run(user_message, user_id, callback_url)
         
-        # 챗봇 로직으로 메시지 처리
-        response = bot_logic.process_message(user_message, user_id)
+        # 성공 로그는 샘플링하고 메시지/응답은 잘라서 기록 (로그 쓰기는 별도 스레드)
+        log_event(
+            logger, "webhook.response", sampled=True,
+            user_id=user_id,
+            message=user_message,
+            deferred=deferred,
+            response=_response_text(response)
+        )
         
-        print(f"챗봇 응답: {response}")
-        
-        return jsonify(response)
+        # 응답 틀의 미리 인코딩한 조각에 답변 텍스트만 끼워 바로 바이트로 보냄
+        return Response(encode_response(response), mimetype='application/json')
         
     except Exception as e:
-        print(f"웹훅 처리 중 오류: {e}")
+        log_event(logger, "webhook.error", level=logging.ERROR, exc_info=True, error=str(e))
         return jsonify({
             "version": "2.0",
             "template": {
@@ -51,15 +81,67 @@ def webhook():
             }
         }), 500
 
+@app.route('/batch', methods=['POST'])
+def batch():
+    """
+    여러 발화를 한 번에 처리하는 엔드포인트 (관리자 대시보드, QA 회귀 테스트용)
+    """
+    try:
+        data = request.get_json()
+        utterances = data.get('utterances') if isinstance(data, dict) else None
+        
+        if not utterances or not isinstance(utterances, list) or not all(isinstance(u, str) for u in utterances):
+            return jsonify({"error": "utterances에 발화 목록이 필요합니다."}), 400
+        
+        if len(utterances) > BATCH_MAX_SIZE:
+            return jsonify({"error": f"한 번에 최대 {BATCH_MAX_SIZE}개까지 처리할 수 있습니다."}), 400
+        
+        with METRICS.span("batch"):
+            results = bot_logic.process_batch(utterances)
+        
+        return Response(dumps({"count": len(results), "results": results}), mimetype='application/json')
+    
+    except Exception as e:
+        log_event(logger, "batch.error", level=logging.ERROR, exc_info=True, error=str(e))
+        return jsonify({"error": str(e)}), 500
+
+def _response_text(response: Mapping) -> str:
+    """카카오톡 응답에서 로그에 남길 답변 텍스트를 꺼냅니다."""
+    if isinstance(response, KakaoResponse):
+        return response.text
+    outputs = response.get('template', {}).get('outputs') or [{}]
+    text = outputs[0].get('simpleText', {}).get('text')
+    # 콜백으로 넘긴 경우에는 "생각 중" 안내 텍스트
+    return text if text is not None else response.get('data', {}).get('text', '')
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    """헬스 체크 엔드포인트"""
+    """헬스 체크 엔드포인트 (모듈 준비 여부와 관계없이 바로 응답)"""
     return jsonify({
         "status": "healthy",
         "service": "wasuk_chatbot",
-        "version": "2.0"
+        "version": "2.0",
+        "ready": bot_logic.ready,
+        "components": bot_logic.component_status(),
+        "sessions": bot_logic.conversation_memory.stats()
     })
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus 지표 엔드포인트 (단계별 소요 시간, 의도별 요청 수, 캐시 통계)"""
+    gauges = {
+        "response_cache": bot_logic.response_cache.stats(),
+        "gpt_stream": bot_logic.gpt_stream.stats(),
+        "gpt_flight": bot_logic.gpt_flight.stats(),
+        "sessions": bot_logic.conversation_memory.stats(),
+        "webhook": pipeline.stats()
+    }
+    # 지표 조회만으로 GPT 답변 캐시를 만들지 않음
+    if bot_logic.component_status()["gpt_cache"]:
+        gauges["gpt_cache"] = bot_logic.gpt_cache.stats()
+    body = METRICS.render(gauges)
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
 @app.route('/', methods=['GET'])
 def home():
     """홈페이지"""
@@ -114,11 +196,21 @@ def home():
                 카카오톡 챗봇 메시지 처리
             </div>
             
+            <div class="endpoint">
+                <strong>POST /batch</strong><br>
+                여러 발화 한 번에 처리 (관리자/회귀 테스트용)
+            </div>
+            
             <div class="endpoint">
                 <strong>GET /health</strong><br>
                 서버 상태 확인
             </div>
             
+            <div class="endpoint">
+                <strong>GET /metrics</strong><br>
+                Prometheus 지표 (단계별 응답 시간)
+            </div>
+            
             <h2>🔧 주요 기능</h2>
             <ul>
                 <li>급식 정보 조회</li>
@@ -151,16 +243,16 @@ def test_chat():
         if not user_message:
             return jsonify({"error": "메시지가 없습니다."}), 400
         
-        # 챗봇 로직으로 메시지 처리
+        # 챗봇 로직으로 메시지 처리 (응답 틀 객체는 JSON으로 직렬화할 수 있는 dict로 바꿔 보냄)
         response = bot_logic.process_message(user_message, "test_user")
         
         return jsonify({
             "user_message": user_message,
-            "bot_response": response
+            "bot_response": response.to_dict()
         })
         
     except Exception as e:
-        print(f"테스트 채팅 중 오류: {e}")
+        log_event(logger, "test.error", level=logging.ERROR, exc_info=True, error=str(e))
         return jsonify({"error": str(e)}), 500
 
 if __name__ == '__main__':
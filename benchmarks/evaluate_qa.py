@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+QA 검색 오프라인 평가 스크립트
+
+라벨링된 발화 목록으로 분석기 모드별 적중률과 질의당 지연 시간을 측정합니다.
+
+사용법:
+    python benchmarks/evaluate_qa.py [--modes word char] [--db school_data.db]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from logic.qa_handler import QAHandler
+
+def percentile(values, p):
+    """정렬된 값 목록에서 백분위수를 구합니다."""
+    if not values:
+        return 0.0
+    index = min(int(round(p / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+def evaluate(mode, db_path, samples, repeat):
+    """한 분석기 모드를 평가하고 결과를 반환합니다."""
+    start = time.perf_counter()
+    handler = QAHandler(db_path, analyzer=mode)
+    build_ms = (time.perf_counter() - start) * 1000
+    
+    first_stage_hits = 0
+    total_hits = 0
+    misses = 0
+    positives = 0
+    rejections = 0
+    negatives = 0
+    latencies = []
+    failures = []
+    
+    for sample in samples:
+        utterance = sample["utterance"]
+        expected = set(sample["questions"])
+        
+        for _ in range(repeat):
+            start = time.perf_counter()
+            match, stage = handler.find_match(utterance)
+            latencies.append((time.perf_counter() - start) * 1000)
+        
+        question = match[0] if match else None
+        
+        if not expected:
+            negatives += 1
+            if match is None:
+                rejections += 1
+            else:
+                failures.append((utterance, stage, question))
+            continue
+        
+        positives += 1
+        if match is None:
+            misses += 1
+            failures.append((utterance, stage, question))
+        elif question in expected:
+            total_hits += 1
+            if stage in ("exact", "similar"):
+                first_stage_hits += 1
+        else:
+            failures.append((utterance, stage, question))
+    
+    latencies.sort()
+    return {
+        "mode": mode,
+        "build_ms": build_ms,
+        "first_stage_hit_rate": first_stage_hits / positives if positives else 0.0,
+        "hit_rate": total_hits / positives if positives else 0.0,
+        "miss_rate": misses / positives if positives else 0.0,
+        "rejection_rate": rejections / negatives if negatives else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "failures": failures
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="QA 검색 오프라인 평가")
+    parser.add_argument("--modes", nargs="+", default=["word", "char"], help="평가할 분석기 모드")
+    parser.add_argument("--db", default=os.path.join(ROOT_DIR, "school_data.db"), help="SQLite DB 경로")
+    parser.add_argument("--set", default=os.path.join(ROOT_DIR, "benchmarks", "qa_eval_set.json"),
+                        help="라벨링된 발화 목록 (JSON)")
+    parser.add_argument("--repeat", type=int, default=20, help="발화당 반복 측정 횟수")
+    parser.add_argument("--verbose", action="store_true", help="실패한 발화 출력")
+    args = parser.parse_args()
+    
+    with open(args.set, encoding="utf-8") as f:
+        samples = json.load(f)
+    
+    print(f"📊 QA 검색 평가 (발화 {len(samples)}개, 반복 {args.repeat}회)")
+    print("=" * 80)
+    print(f"{'모드':<6} {'1단계 적중':>10} {'전체 적중':>10} {'미응답':>8} {'거절':>8} "
+          f"{'p50(ms)':>9} {'p95(ms)':>9} {'색인(ms)':>9}")
+    
+    results = [evaluate(mode, args.db, samples, args.repeat) for mode in args.modes]
+    
+    for r in results:
+        print(f"{r['mode']:<6} {r['first_stage_hit_rate']:>10.1%} {r['hit_rate']:>10.1%} "
+              f"{r['miss_rate']:>8.1%} {r['rejection_rate']:>8.1%} "
+              f"{r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['build_ms']:>9.1f}")
+    
+    if args.verbose:
+        for r in results:
+            print(f"\n❌ {r['mode']} 실패 ({len(r['failures'])}건)")
+            for utterance, stage, question in r["failures"]:
+                print(f"   - '{utterance}' -> [{stage}] {question}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
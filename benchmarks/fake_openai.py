@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+부하 테스트용 가짜 OpenAI API 서버
+
+/v1/chat/completions 요청에 정해진 지연 시간 뒤 고정된 답변을 돌려줍니다.
+stream=true 요청에는 토큰 단위 SSE(server-sent events)로 응답합니다.
+
+사용법:
+    python benchmarks/fake_openai.py [--port 8001] [--latency 800] [--token-latency 20]
+    
+    export OPENAI_BASE_URL=http://127.0.0.1:8001/v1
+    export OPENAI_API_KEY=fake
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 가짜 답변 (문장 단위로 잘리는지 확인할 수 있도록 여러 문장)
+DEFAULT_ANSWER = (
+    "안녕하세요! 와석초 챗봇입니다. 문의하신 내용은 학교 홈페이지 공지사항에서 확인하실 수 있어요. "
+    "자세한 사항은 교무실(031-000-0000)로 문의해 주세요. 좋은 하루 보내세요!"
+)
+
+class FakeOpenAIServer:
+    """지연 시간을 설정할 수 있는 가짜 OpenAI Chat Completions 서버 클래스"""
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.8,
+                 token_latency: float = 0.02, answer: str = DEFAULT_ANSWER):
+        # 첫 토큰(비스트리밍이면 전체 응답)까지의 지연 시간 (초)
+        self.latency = latency
+        # 스트리밍 응답에서 토큰 사이의 지연 시간 (초)
+        self.token_latency = token_latency
+        self.answer = answer
+        
+        self.requests = 0
+        self._lock = threading.Lock()
+        
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def base_url(self) -> str:
+        """OPENAI_BASE_URL로 쓸 주소"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+    
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-openai", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """서버를 멈춥니다."""
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def _tokens(self):
+        """답변을 토큰 비슷한 조각(2글자)으로 나눕니다."""
+        return [self.answer[i:i + 2] for i in range(0, len(self.answer), 2)]
+    
+    def _handler_class(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not self.path.endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                
+                with server._lock:
+                    server.requests += 1
+                
+                request = json.loads(body or b"{}")
+                model = request.get("model", "gpt-3.5-turbo")
+                time.sleep(server.latency)
+                
+                if request.get("stream"):
+                    self._stream(model)
+                else:
+                    self._complete(model)
+            
+            def _complete(self, model):
+                payload = json.dumps({
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": server.answer},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                }, ensure_ascii=False).encode("utf-8")
+                
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def _stream(self, model):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                
+                try:
+                    for index, token in enumerate(server._tokens()):
+                        if index:
+                            time.sleep(server.token_latency)
+                        chunk = {
+                            "id": "chatcmpl-fake",
+                            "object": "chat.completion.chunk",
+                            "created": int(time.time()),
+                            "model": model,
+                            "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]
+                        }
+                        self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                        self.wfile.flush()
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # 클라이언트가 문장 단위로 잘라 먼저 연결을 끊은 경우
+                    pass
+                self.close_connection = True
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 OpenAI API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=800, help="첫 토큰까지 지연 시간 (ms)")
+    parser.add_argument("--token-latency", type=float, default=20, help="토큰 사이 지연 시간 (ms)")
+    args = parser.parse_args()
+    
+    server = FakeOpenAIServer(args.host, args.port, args.latency / 1000, args.token_latency / 1000)
+    print(f"🤖 가짜 OpenAI 서버: {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
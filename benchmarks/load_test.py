@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+웹훅 부하 테스트 스크립트
+
+카카오 스킬 웹훅 요청을 실제와 비슷한 발화 비율(load_mix.json)로 /webhook에 보내고
+처리량과 의도별 p50/p95/p99 지연 시간을 측정합니다.
+OpenAI API 대신 지연 시간을 설정할 수 있는 가짜 서버(fake_openai.py)를 사용합니다.
+
+직접 띄우는 챗봇 서버는 요청 처리 스레드 수가 고정된 WSGI 서버입니다. (gunicorn -k gthread --threads N과 같은 조건)
+--threads로 비교할 때는 값마다 요청 처리 스레드와 웹훅 처리 스레드(WEBHOOK_WORKERS)를 모두 N개로 맞춰 다시 띄웁니다.
+gunicorn으로 띄운 서버를 측정하려면 WEBHOOK_WORKERS와 --threads를 같은 값으로 띄우고 --url로 지정합니다.
+
+사용법:
+    python benchmarks/load_test.py [--requests 500] [--concurrency 16] [--openai-latency 800]
+    python benchmarks/load_test.py --threads 1,2,4,8,16   # 처리 스레드 수별 처리량 비교
+    python benchmarks/load_test.py --url http://127.0.0.1:8000/webhook   # 이미 실행 중인 서버 대상
+    WEBHOOK_WORKERS=4 gunicorn -k gthread -w 1 --threads 4 -b 127.0.0.1:8000 app:app   # gunicorn 서버 측정
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from benchmarks.fake_openai import FakeOpenAIServer
+
+DEFAULT_MIX = os.path.join(ROOT_DIR, "benchmarks", "load_mix.json")
+
+def percentile(values, p):
+    """정렬된 값 목록에서 백분위수를 구합니다."""
+    if not values:
+        return 0.0
+    index = min(int(round(p / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+def build_payloads(mix, count, users, seed):
+    """발화 비율에 따라 (의도, 웹훅 요청 본문) 목록을 만듭니다."""
+    rng = random.Random(seed)
+    weights = [entry["weight"] for entry in mix]
+    payloads = []
+    for _ in range(count):
+        entry = rng.choices(mix, weights=weights)[0]
+        payloads.append((entry["intent"], {
+            "intent": {"id": "fallback", "name": "폴백 블록"},
+            "userRequest": {
+                "timezone": "Asia/Seoul",
+                "utterance": rng.choice(entry["utterances"]),
+                "lang": "ko",
+                "user": {"id": f"load-user-{rng.randrange(users)}", "type": "botUserKey", "properties": {}}
+            },
+            "bot": {"id": "wasuk-bot", "name": "와석초 챗봇"},
+            "action": {"name": "webhook", "params": {}, "detailParams": {}}
+        }))
+    return payloads
+
+def start_fake_openai(args, index_dir):
+    """가짜 OpenAI 서버를 띄우고, 이 프로세스에서 불러올 챗봇이 그 서버를 쓰도록 설정합니다."""
+    fake = FakeOpenAIServer(latency=args.openai_latency / 1000,
+                            token_latency=args.token_latency / 1000).start()
+    
+    # app을 불러오기 전에 설정해야 적용됨
+    os.environ.update({
+        "OPENAI_API_KEY": "fake",
+        "OPENAI_BASE_URL": fake.base_url,
+        "RELOAD_INTERVAL": "0",
+        "QA_INDEX_DIR": index_dir,
+        "GPT_CACHE_PATH": "",
+        "WARMUP": "0",
+        "LOG_LEVEL": "WARNING"
+    })
+    if args.no_cache:
+        os.environ["RESPONSE_CACHE_SIZE"] = "0"
+    
+    import app
+    
+    # 요청마다 찍히는 접근 로그가 측정에 섞이지 않도록 끔
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    
+    # 측정 전에 무거운 구성 요소를 미리 준비
+    app.bot_logic.warm_up()
+    return fake
+
+def start_app_server(threads):
+    """
+    요청 처리 스레드가 threads개로 고정된 챗봇 서버를 띄웁니다.
+    
+    werkzeug의 threaded=True는 요청마다 스레드를 새로 만들어 스레드 수에 제한이 없으므로,
+    고정 크기 스레드 풀에서 요청을 처리해 gunicorn gthread 워커 하나와 같은 조건으로 측정합니다.
+    """
+    import app
+    from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+    
+    class RequestHandler(WSGIRequestHandler):
+        # 응답마다 연결을 닫아 유휴 keep-alive 연결이 처리 스레드를 붙잡지 않게 함
+        protocol_version = "HTTP/1.0"
+    
+    class FixedThreadServer(BaseWSGIServer):
+        multithread = True
+        
+        def __init__(self):
+            super().__init__("127.0.0.1", 0, app.app, handler=RequestHandler)
+            self.pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="load-test-app")
+        
+        def process_request(self, request, client_address):
+            self.pool.submit(self._process, request, client_address)
+        
+        def _process(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+        
+        def server_close(self):
+            super().server_close()
+            self.pool.shutdown(wait=True)
+    
+    server = FixedThreadServer()
+    threading.Thread(target=server.serve_forever, name="load-test-accept", daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/webhook", server
+
+def stop_app_server(server):
+    """챗봇 서버를 멈추고 처리 중인 요청이 끝날 때까지 기다립니다."""
+    server.shutdown()
+    server.server_close()
+
+def run_load(url, payloads, concurrency, timeout):
+    """요청을 동시에 보내고 (의도, 지연 시간, 성공 여부) 목록과 전체 소요 시간을 반환합니다."""
+    local = threading.local()
+    
+    def send(item):
+        intent, payload = item
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            response = session.post(url, json=payload, timeout=timeout)
+            ok = response.status_code == 200 and response.json().get("version") == "2.0"
+        except requests.RequestException:
+            ok = False
+        return intent, (time.perf_counter() - start) * 1000, ok
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, payloads))
+    return results, time.perf_counter() - start
+
+def set_worker_threads(count):
+    """챗봇 서버의 웹훅 처리 스레드 수를 바꿉니다. (WEBHOOK_WORKERS를 바꿔 다시 띄운 것과 같음)"""
+    import app
+    from logic.deadline_executor import DeadlineExecutor
+    
+    old = app.pipeline
+    app.pipeline = DeadlineExecutor(app.bot_logic.process_message, deadline=old.deadline,
+                                    max_workers=count, callback_timeout=old.callback_timeout)
+    old.shutdown(wait=True)
+
+def sweep(payloads, thread_counts, args):
+    """스레드 수마다 요청 처리/웹훅 처리 스레드를 그 수로 맞춘 서버를 띄워 처리량과 지연 시간을 비교합니다."""
+    # 캐시 상태가 측정 순서에 따라 달라지지 않도록 한 번 먼저 보내 채워 둠
+    url, server = start_app_server(max(thread_counts))
+    try:
+        run_load(url, payloads, args.concurrency, args.timeout)
+    finally:
+        stop_app_server(server)
+    
+    print(f"\n{'스레드':<6} {'req/s':>8} {'실패':>6} {'p50(ms)':>10} {'p95(ms)':>10} {'p99(ms)':>10}")
+    print("-" * 56)
+    for count in thread_counts:
+        set_worker_threads(count)
+        url, server = start_app_server(count)
+        try:
+            results, elapsed = run_load(url, payloads, args.concurrency, args.timeout)
+        finally:
+            stop_app_server(server)
+        latencies = sorted(latency for _, latency, _ in results)
+        errors = sum(1 for _, _, ok in results if not ok)
+        print(f"{count:<6} {len(results) / elapsed:>8.1f} {errors:>6} "
+              f"{percentile(latencies, 50):>10.1f} {percentile(latencies, 95):>10.1f} "
+              f"{percentile(latencies, 99):>10.1f}")
+
+def report(results, elapsed):
+    """의도별 지연 시간 분포와 처리량을 출력합니다."""
+    by_intent = {}
+    for intent, latency, ok in results:
+        by_intent.setdefault(intent, []).append((latency, ok))
+    by_intent["전체"] = [(latency, ok) for _, latency, ok in results]
+    
+    print(f"\n📊 처리량: {len(results) / elapsed:.1f} req/s ({len(results)}건, {elapsed:.2f}s)")
+    print(f"\n{'의도':<6} {'건수':>6} {'실패':>6} {'p50(ms)':>10} {'p95(ms)':>10} {'p99(ms)':>10} {'최대(ms)':>10}")
+    print("-" * 66)
+    for intent, samples in by_intent.items():
+        latencies = sorted(latency for latency, _ in samples)
+        errors = sum(1 for _, ok in samples if not ok)
+        print(f"{intent:<6} {len(samples):>6} {errors:>6} "
+              f"{percentile(latencies, 50):>10.1f} {percentile(latencies, 95):>10.1f} "
+              f"{percentile(latencies, 99):>10.1f} {latencies[-1]:>10.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="웹훅 부하 테스트")
+    parser.add_argument("--url", help="대상 웹훅 주소 (생략하면 가짜 OpenAI 서버와 챗봇을 직접 띄움)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="발화 비율 파일")
+    parser.add_argument("--requests", type=int, default=500, help="보낼 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--users", type=int, default=200, help="가상 사용자 수")
+    parser.add_argument("--openai-latency", type=float, default=800, help="가짜 OpenAI 첫 토큰 지연 (ms)")
+    parser.add_argument("--token-latency", type=float, default=20, help="가짜 OpenAI 토큰 사이 지연 (ms)")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시를 끄고 측정")
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청 제한 시간 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="요청 순서 난수 시드")
+    parser.add_argument("--threads", help="쉼표로 구분한 서버 스레드 수 목록 (예: 1,2,4,8,16), 값마다 측정해 비교")
+    args = parser.parse_args()
+    
+    thread_counts = [int(value) for value in args.threads.split(",")] if args.threads else None
+    if thread_counts and args.url:
+        parser.error("--threads는 챗봇 서버를 직접 띄울 때만 사용할 수 있습니다")
+    
+    with open(args.mix, 'r', encoding='utf-8') as f:
+        mix = json.load(f)
+    payloads = build_payloads(mix, args.requests, args.users, args.seed)
+    
+    print("🚦 웹훅 부하 테스트")
+    print("=" * 50)
+    
+    index_dir = tempfile.mkdtemp(prefix="wasuk-load-index-")
+    fake = server = None
+    try:
+        url = args.url
+        if url is None:
+            fake = start_fake_openai(args, index_dir)
+            print(f"가짜 OpenAI 지연: {args.openai_latency:.0f}ms + 토큰당 {args.token_latency:.0f}ms")
+            if not thread_counts:
+                # app.py와 같은 기본값 (요청 처리 스레드도 웹훅 처리 스레드 수에 맞춤)
+                threads = int(os.environ.get('WEBHOOK_WORKERS', 8))
+                url, server = start_app_server(threads)
+                print(f"대상: {url} (서버 스레드 {threads}개)")
+        else:
+            print(f"대상: {url}")
+        print(f"요청 {args.requests}건, 동시 {args.concurrency}, 사용자 {args.users}명"
+              f"{', 응답 캐시 끔' if args.no_cache else ''}")
+        
+        if thread_counts:
+            sweep(payloads, thread_counts, args)
+        else:
+            results, elapsed = run_load(url, payloads, args.concurrency, args.timeout)
+            report(results, elapsed)
+        
+        if fake is not None:
+            print(f"\n🤖 OpenAI 호출 수: {fake.requests}")
+    finally:
+        if server is not None:
+            stop_app_server(server)
+        if fake is not None:
+            fake.stop()
+        shutil.rmtree(index_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+핵심 처리 함수 마이크로벤치마크
+
+부하 테스트와 같은 발화 목록(load_mix.json)으로 의도 파악, QA 검색, 급식 조회 함수의
+호출당 지연 시간(p50/p95/p99)을 측정합니다.
+
+사용법:
+    python benchmarks/microbench.py [--iterations 2000] [--db school_data.db]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from logic.intent_detector import IntentDetector
+from logic.qa_handler import QAHandler
+from logic.meal_handler import MealHandler
+
+DEFAULT_MIX = os.path.join(ROOT_DIR, "benchmarks", "load_mix.json")
+
+def percentile(values, p):
+    """정렬된 값 목록에서 백분위수를 구합니다."""
+    if not values:
+        return 0.0
+    index = min(int(round(p / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+def bench(fn, utterances, iterations):
+    """발화 목록을 돌아가며 fn을 호출하고 호출당 지연 시간(µs) 목록을 반환합니다."""
+    # 첫 호출의 지연(캐시 채우기 등)은 제외
+    for utterance in utterances:
+        fn(utterance)
+    
+    latencies = []
+    for i in range(iterations):
+        utterance = utterances[i % len(utterances)]
+        start = time.perf_counter()
+        fn(utterance)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return sorted(latencies)
+
+def main():
+    parser = argparse.ArgumentParser(description="핵심 처리 함수 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=2000, help="함수별 호출 횟수")
+    parser.add_argument("--db", default=os.path.join(ROOT_DIR, "school_data.db"), help="학교 데이터 DB 경로")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="발화 목록 파일")
+    args = parser.parse_args()
+    
+    with open(args.mix, 'r', encoding='utf-8') as f:
+        mix = json.load(f)
+    utterances = {entry["intent"]: entry["utterances"] for entry in mix}
+    all_utterances = [utterance for entry in mix for utterance in entry["utterances"]]
+    
+    print("🔬 핵심 처리 함수 마이크로벤치마크")
+    print("=" * 50)
+    
+    index_dir = tempfile.mkdtemp(prefix="wasuk-bench-index-")
+    try:
+        detector = IntentDetector()
+        qa_handler = QAHandler(args.db, analyzer="char", index_dir=index_dir)
+        meal_handler = MealHandler(args.db)
+        
+        targets = [
+            ("IntentDetector.detect", detector.detect, all_utterances),
+            ("QAHandler.get_answer", qa_handler.get_answer, utterances.get("질문", all_utterances)),
+            ("MealHandler.get_meal_info", meal_handler.get_meal_info, utterances.get("급식", all_utterances))
+        ]
+        
+        print(f"\n{'함수':<28} {'p50(µs)':>10} {'p95(µs)':>10} {'p99(µs)':>10} {'평균(µs)':>10}")
+        print("-" * 72)
+        for name, fn, samples in targets:
+            latencies = bench(fn, samples, args.iterations)
+            print(f"{name:<28} {percentile(latencies, 50):>10.1f} {percentile(latencies, 95):>10.1f} "
+                  f"{percentile(latencies, 99):>10.1f} {sum(latencies) / len(latencies):>10.1f}")
+    finally:
+        shutil.rmtree(index_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
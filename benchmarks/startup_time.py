@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+서버 기동 시간 측정 스크립트
+
+새 프로세스에서 app.py를 불러와 /health 응답까지 걸리는 시간, 백그라운드 준비(warm-up) 시간,
+준비 전/후 첫 요청 지연 시간을 측정합니다.
+
+사용법:
+    python benchmarks/startup_time.py [--runs 5] [--snapshot]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기동 직후 무거운 모듈이 로드되었는지 확인할 라이브러리
+HEAVY_MODULES = ("sklearn", "numpy", "scipy", "openai")
+
+def child(warm_up):
+    """자식 프로세스: 기동 단계별 시간을 JSON으로 출력합니다."""
+    sys.path.append(ROOT_DIR)
+    result = {}
+    
+    start = time.perf_counter()
+    import app
+    result["import_ms"] = (time.perf_counter() - start) * 1000
+    result["heavy_modules"] = [name for name in HEAVY_MODULES if name in sys.modules]
+    
+    client = app.app.test_client()
+    start = time.perf_counter()
+    health = client.get('/health').get_json()
+    result["health_ms"] = (time.perf_counter() - start) * 1000
+    result["ready_at_health"] = health["ready"]
+    
+    if warm_up:
+        start = time.perf_counter()
+        app.bot_logic.warm_up()
+        result["warm_up_ms"] = (time.perf_counter() - start) * 1000
+    
+    payload = {"userRequest": {"utterance": "방과후 신청 방법 알려주세요", "user": {"id": "bench"}}}
+    start = time.perf_counter()
+    client.post('/webhook', json=payload)
+    result["first_request_ms"] = (time.perf_counter() - start) * 1000
+    
+    print(json.dumps(result))
+
+def run_child(warm_up, index_dir):
+    """자식 프로세스를 실행하고 결과를 반환합니다."""
+    env = dict(os.environ)
+    env.update({
+        "WARMUP": "0",
+        "RELOAD_INTERVAL": "0",
+        "QA_INDEX_DIR": index_dir,
+        "GPT_CACHE_PATH": "",
+        "LOG_LEVEL": "WARNING"
+    })
+    args = [sys.executable, os.path.abspath(__file__), "--child"]
+    if warm_up:
+        args.append("--warm-up")
+    
+    output = subprocess.run(
+        args, cwd=ROOT_DIR, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def average(results, key):
+    """여러 실행 결과의 평균을 구합니다."""
+    values = [result[key] for result in results if key in result]
+    return sum(values) / len(values) if values else 0.0
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 기동 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="저장된 QA 색인 스냅샷을 재사용 (기본은 매번 새로 학습)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--warm-up", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        child(args.warm_up)
+        return
+    
+    print("⏱️ 서버 기동 시간 측정")
+    print("=" * 50)
+    
+    shared_index_dir = tempfile.mkdtemp(prefix="wasuk-bench-index-")
+    try:
+        for warm_up in (False, True):
+            results = []
+            for _ in range(args.runs):
+                index_dir = shared_index_dir if args.snapshot else tempfile.mkdtemp(prefix="wasuk-bench-index-")
+                try:
+                    results.append(run_child(warm_up, index_dir))
+                finally:
+                    if not args.snapshot:
+                        shutil.rmtree(index_dir, ignore_errors=True)
+            
+            label = "준비 후 첫 요청" if warm_up else "준비 없이 첫 요청"
+            print(f"\n📊 {label} ({args.runs}회 평균)")
+            print(f"   app 불러오기: {average(results, 'import_ms'):.1f}ms")
+            print(f"   /health 응답: {average(results, 'health_ms'):.1f}ms "
+                  f"(ready={results[-1]['ready_at_health']})")
+            print(f"   기동 직후 로드된 라이브러리: {', '.join(results[-1]['heavy_modules']) or '없음'}")
+            if warm_up:
+                print(f"   warm-up: {average(results, 'warm_up_ms'):.1f}ms")
+            print(f"   첫 요청: {average(results, 'first_request_ms'):.1f}ms")
+    finally:
+        shutil.rmtree(shared_index_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
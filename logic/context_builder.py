@@ -0,0 +1,172 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from .session_store import Turn
+
+# tiktoken이 설치되어 있으면 실제 토큰 수를, 없으면 추정값을 사용
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODING = None
+
+# 메시지 하나에 붙는 역할/구분자 토큰 수 (gpt-3.5-turbo 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 결정적인 의도의 챗봇 응답 대신 넣을 짧은 설명 (None이면 턴 전체를 생략)
+ABBREVIATED_INTENTS = {
+    "급식": "(급식 메뉴를 안내함)",
+    "공지": "(공지사항 검색 결과를 안내함)",
+    "인사": None
+}
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 셉니다.
+    
+    tiktoken이 없으면 ASCII는 4글자당 1토큰, 한글 등 나머지 글자는 1글자당 1토큰으로 추정합니다.
+    
+    Args:
+        text (str): 토큰 수를 셀 텍스트
+    
+    Returns:
+        int: 토큰 수
+    """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+class ContextBuilder:
+    """토큰 예산 안에서 최근 대화와 이전 대화 요약으로 GPT 프롬프트를 구성하는 클래스"""
+    
+    def __init__(self, token_budget: int = 1000, recent_turns: int = 5,
+                 summary_lines: int = 5, abbreviate_chars: int = 80, cache_size: int = 1024):
+        # 프롬프트 전체 토큰 예산 (시스템 프롬프트 포함)
+        self.token_budget = token_budget
+        # 그대로 넣을 최근 대화 수
+        self.recent_turns = recent_turns
+        # 그보다 오래된 대화를 요약해 남길 최대 줄 수
+        self.summary_lines = summary_lines
+        # 대화 내용을 줄여 넣을 때의 최대 글자 수
+        self.abbreviate_chars = abbreviate_chars
+        self.cache_size = cache_size
+        
+        # 사용자 ID -> (마지막으로 요약한 턴 시각, 요약 줄 목록)
+        self._summaries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def build(self, system_prompt: str, user_id: str, history: List[Turn],
+              user_input: str) -> Tuple[List[Dict], int]:
+        """
+        GPT에 보낼 메시지 목록을 토큰 예산 안에서 구성합니다.
+        
+        Args:
+            system_prompt (str): 시스템 프롬프트
+            user_id (str): 사용자 ID
+            history (List[Turn]): 오래된 것부터 정렬된 대화 기록
+            user_input (str): 현재 사용자 입력
+        
+        Returns:
+            Tuple[List[Dict], int]: (메시지 목록, 추정 토큰 수)
+        """
+        recent = history[-self.recent_turns:] if self.recent_turns > 0 else []
+        older = history[:len(history) - len(recent)]
+        
+        # 시스템 프롬프트와 현재 입력은 예산과 관계없이 항상 포함
+        tokens = (count_tokens(system_prompt) + count_tokens(user_input)
+                  + 2 * MESSAGE_OVERHEAD_TOKENS)
+        
+        # 최근 대화는 새로운 것부터 예산이 허락하는 만큼 포함
+        recent_messages = []
+        for turn in reversed(recent):
+            pair = self._turn_messages(turn)
+            cost = sum(count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in pair)
+            if tokens + cost > self.token_budget:
+                break
+            recent_messages = pair + recent_messages
+            tokens += cost
+        
+        # 남은 예산으로 이전 대화 요약 추가
+        summary = self._summary(user_id, older)
+        if summary:
+            cost = count_tokens(summary)
+            if tokens + cost <= self.token_budget:
+                system_prompt = f"{system_prompt}\n\n{summary}"
+                tokens += cost
+        
+        messages = [{"role": "system", "content": system_prompt}]
+        messages.extend(recent_messages)
+        messages.append({"role": "user", "content": user_input})
+        return messages, tokens
+    
+    def _turn_messages(self, turn: Turn) -> List[Dict]:
+        """대화 한 턴을 메시지로 바꿉니다. (결정적인 의도의 응답은 줄이거나 생략)"""
+        if turn.intent in ABBREVIATED_INTENTS:
+            abbreviated = ABBREVIATED_INTENTS[turn.intent]
+            if abbreviated is None:
+                return []
+            bot = abbreviated
+        elif turn.intent == "질문":
+            bot = self._abbreviate(turn.bot)
+        else:
+            bot = turn.bot
+        
+        return [
+            {"role": "user", "content": turn.user},
+            {"role": "assistant", "content": bot}
+        ]
+    
+    def _abbreviate(self, text: str) -> str:
+        """긴 텍스트를 abbreviate_chars 글자로 줄입니다."""
+        text = " ".join(text.split())
+        if len(text) <= self.abbreviate_chars:
+            return text
+        return text[:self.abbreviate_chars].rstrip() + "…"
+    
+    def _summary_line(self, turn: Turn) -> str:
+        """요약에 넣을 한 줄을 만듭니다."""
+        if turn.intent in ABBREVIATED_INTENTS:
+            return f"- 사용자: {self._abbreviate(turn.user)} ({turn.intent})"
+        return f"- 사용자: {self._abbreviate(turn.user)} / 챗봇: {self._abbreviate(turn.bot)}"
+    
+    def _summary(self, user_id: str, older: List[Turn]) -> str:
+        """
+        최근 대화보다 오래된 턴을 요약합니다.
+        
+        요약은 사용자별로 캐시하고, 새로 밀려난 턴만 덧붙입니다.
+        """
+        if not older or self.summary_lines <= 0:
+            return ""
+        
+        with self._lock:
+            cached = self._summaries.get(user_id)
+        
+        timestamps = [turn.timestamp for turn in older]
+        if cached is not None and cached[0] in timestamps:
+            # 지난번 요약 이후에 밀려난 턴만 추가
+            lines = list(cached[1])
+            new_turns = older[timestamps.index(cached[0]) + 1:]
+        else:
+            # 처음이거나 대화가 새로 시작되었으면 다시 만듦
+            lines = []
+            new_turns = older
+        
+        lines.extend(
+            self._summary_line(turn) for turn in new_turns
+            if ABBREVIATED_INTENTS.get(turn.intent, "") is not None
+        )
+        lines = lines[-self.summary_lines:]
+        
+        with self._lock:
+            self._summaries[user_id] = (older[-1].timestamp, lines)
+            self._summaries.move_to_end(user_id)
+            while len(self._summaries) > self.cache_size:
+                self._summaries.popitem(last=False)
+        
+        if not lines:
+            return ""
+        return "이전 대화 요약:\n" + "\n".join(lines)
\ No newline at end of file
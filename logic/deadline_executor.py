@@ -0,0 +1,137 @@
+import concurrent.futures
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple
+import requests
+from .kakao_response import encode_response
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("callback")
+
+class DeadlineExecutor:
+    """응답 제한 시간 안에 끝나지 않은 메시지 처리를 카카오 콜백으로 넘기는 실행기 클래스"""
+    
+    def __init__(self, process_fn: Callable[[str, str], Dict], deadline: float = 3.5,
+                 max_workers: int = 8, callback_timeout: float = 10.0):
+        # (사용자 메시지, 사용자 ID) -> 카카오톡 응답
+        self.process_fn = process_fn
+        # 웹훅 응답 제한 시간 (카카오는 5초 안에 응답해야 함)
+        self.deadline = deadline
+        # 콜백 URL로 최종 답변을 보낼 때의 HTTP 제한 시간
+        self.callback_timeout = callback_timeout
+        
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="wasuk-worker"
+        )
+        
+        # 여러 웹훅 스레드가 함께 세므로 잠금으로 보호
+        self.deferred = 0
+        self.timed_out = 0
+        self._stats_lock = threading.Lock()
+    
+    def run(self, user_input: str, user_id: str,
+            callback_url: Optional[str] = None) -> Tuple[Dict, bool]:
+        """
+        제한 시간 안에 메시지를 처리합니다.
+        
+        제한 시간을 넘기면 콜백 URL이 있을 때는 "생각 중" 응답을 즉시 돌려주고
+        최종 답변은 처리가 끝나는 대로 콜백 URL로 보냅니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+            user_id (str): 사용자 ID
+            callback_url (Optional[str]): 카카오 콜백 URL (userRequest.callbackUrl)
+        
+        Returns:
+            Tuple[Dict, bool]: (카카오톡 응답, 콜백으로 넘겼는지 여부)
+        """
+        future = self._pool.submit(self.process_fn, user_input, user_id)
+        
+        try:
+            return future.result(timeout=self.deadline), False
+        except concurrent.futures.TimeoutError:
+            pass
+        
+        if callback_url:
+            with self._stats_lock:
+                self.deferred += 1
+            future.add_done_callback(lambda done: self._deliver(callback_url, done))
+            return self._thinking_response(), True
+        
+        # 콜백을 쓸 수 없으면 지금은 안내 메시지로 응답 (처리는 백그라운드에서 끝나지만 그 결과는 버려짐)
+        with self._stats_lock:
+            self.timed_out += 1
+        return self._timeout_response(), False
+    
+    def _deliver(self, callback_url: str, future: concurrent.futures.Future):
+        """처리가 끝난 답변을 콜백 URL로 보냅니다."""
+        try:
+            response = future.result()
+        except Exception as e:
+            log_event(logger, "callback.process_error", level=logging.ERROR, error=str(e))
+            response = self._error_response()
+        
+        try:
+            result = requests.post(
+                callback_url,
+                data=encode_response(response),
+                headers={"Content-Type": "application/json"},
+                timeout=self.callback_timeout
+            )
+            if result.status_code >= 400:
+                log_event(logger, "callback.rejected", level=logging.WARNING, status=result.status_code)
+        except Exception as e:
+            log_event(logger, "callback.error", level=logging.ERROR, error=str(e))
+    
+    def _thinking_response(self) -> Dict:
+        """콜백을 사용할 때 즉시 보내는 응답입니다."""
+        return {
+            "version": "2.0",
+            "useCallback": True,
+            "data": {
+                "text": "답변을 준비하고 있어요. 잠시만 기다려 주세요! 🤔"
+            }
+        }
+    
+    def _timeout_response(self) -> Dict:
+        """콜백 없이 제한 시간을 넘겼을 때의 응답입니다."""
+        return {
+            "version": "2.0",
+            "template": {
+                "outputs": [
+                    {
+                        "simpleText": {
+                            "text": "답변 준비가 늦어지고 있어요. 잠시 후 같은 질문을 다시 보내 주세요."
+                        }
+                    }
+                ]
+            }
+        }
+    
+    def _error_response(self) -> Dict:
+        """처리 중 오류가 났을 때 콜백으로 보내는 응답입니다."""
+        return {
+            "version": "2.0",
+            "template": {
+                "outputs": [
+                    {
+                        "simpleText": {
+                            "text": "죄송합니다. 시스템에 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+                        }
+                    }
+                ]
+            }
+        }
+    
+    def stats(self) -> Dict[str, int]:
+        """콜백 전환/제한 시간 초과 횟수를 반환합니다."""
+        with self._stats_lock:
+            return {
+                "deferred": self.deferred,
+                "timed_out": self.timed_out
+            }
+    
+    def shutdown(self, wait: bool = True):
+        """작업 스레드를 정리합니다."""
+        self._pool.shutdown(wait=wait)
\ No newline at end of file
@@ -0,0 +1,131 @@
+import logging
+import re
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("gpt")
+
+# 문장 끝 (마침표/물음표/느낌표/말줄임표 + 닫는 따옴표·괄호, 뒤에 공백이나 줄바꿈)
+_SENTENCE_END = re.compile(r'[.!?。…]+["\'”’)\]]*(?=\s)')
+
+class StreamCollector:
+    """GPT 스트리밍 응답을 받아 글자 수/시간 예산에 맞춰 문장 단위로 자르는 클래스"""
+    
+    def __init__(self, char_budget: int = 300, time_budget: float = 3.0):
+        # 이 글자 수를 넘으면 문장이 끝나는 곳에서 중단
+        self.char_budget = char_budget
+        # 이 시간(초)이 지나면 문장이 끝나는 곳에서 중단
+        self.time_budget = time_budget
+        
+        self._lock = threading.Lock()
+        self.streams = 0
+        self.truncated = 0
+        self._first_token_total = 0.0
+        self._generation_total = 0.0
+    
+    def collect(self, stream: Iterable) -> Tuple[str, Dict]:
+        """
+        스트리밍 응답을 예산 안에서 모읍니다.
+        
+        Args:
+            stream (Iterable): chat.completions.create(stream=True)가 돌려준 청크 스트림
+        
+        Returns:
+            Tuple[str, Dict]: (답변, 시간 정보)
+                시간 정보: first_token (첫 토큰까지 초), total (전체 초),
+                chars (글자 수), truncated (예산 때문에 또는 스트림이 끊겨서 잘랐는지 여부)
+        
+        Raises:
+            Exception: 완성된 문장을 하나도 받기 전에 스트림이 끊긴 경우 (받은 문장이 있으면 거기까지 반환)
+        """
+        start = time.perf_counter()
+        first_token: Optional[float] = None
+        parts = []
+        length = 0
+        truncated = False
+        text = None
+        
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                
+                now = time.perf_counter()
+                if first_token is None:
+                    first_token = now - start
+                
+                parts.append(delta)
+                length += len(delta)
+                
+                # 예산을 넘겼으면 마지막 문장 끝에서 자름 (문장 끝이 아직 없으면 계속 받음)
+                if length >= self.char_budget or now - start >= self.time_budget:
+                    text = "".join(parts)
+                    cut = self._last_sentence_end(text)
+                    if cut:
+                        text = text[:cut]
+                        truncated = True
+                        break
+                    text = None
+        except Exception as e:
+            # 스트림이 중간에 끊기면 완성된 문장까지만 답변으로 사용
+            text = "".join(parts)
+            cut = self._last_sentence_end(text + " ")
+            if not cut:
+                raise
+            log_event(logger, "gpt.stream_interrupted", level=logging.WARNING, error=str(e), chars=cut)
+            text = text[:cut]
+            truncated = True
+        finally:
+            self._close(stream)
+        
+        if text is None:
+            text = "".join(parts)
+        text = text.strip()
+        
+        timing = {
+            "first_token": first_token,
+            "total": time.perf_counter() - start,
+            "chars": len(text),
+            "truncated": truncated
+        }
+        
+        with self._lock:
+            self.streams += 1
+            if truncated:
+                self.truncated += 1
+            self._first_token_total += first_token or 0.0
+            self._generation_total += timing["total"]
+        
+        return text, timing
+    
+    def _last_sentence_end(self, text: str) -> int:
+        """마지막 문장이 끝나는 위치를 반환합니다. (없으면 0)"""
+        cut = 0
+        for match in _SENTENCE_END.finditer(text):
+            cut = match.end()
+        return cut
+    
+    def _close(self, stream):
+        """남은 토큰을 받지 않도록 스트림 연결을 닫습니다."""
+        try:
+            if hasattr(stream, "close"):
+                stream.close()
+            elif hasattr(stream, "response"):
+                stream.response.close()
+        except Exception as e:
+            log_event(logger, "gpt.stream_close_error", level=logging.WARNING, error=str(e))
+    
+    def stats(self) -> Dict[str, float]:
+        """스트리밍 시간 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "streams": self.streams,
+                "truncated": self.truncated,
+                "avg_first_token": self._first_token_total / self.streams if self.streams else 0.0,
+                "avg_total": self._generation_total / self.streams if self.streams else 0.0
+            }
\ No newline at end of file
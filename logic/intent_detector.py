@@ -1,13 +1,33 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+from .keyword_matcher import KeywordMatcher
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("intent")
+
+# 저장소 루트의 의도 사전 (학교 데이터에 맞춘 키워드는 코드 대신 이 파일에서 관리)
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'intent_lexicon.json')
+
+# 다른 의도의 키워드가 없을 때만 선택하는 의도
+# ("안녕하세요 오늘 급식 뭐예요?"는 인사말이 요청보다 길어도 급식 질문)
+FALLBACK_INTENTS = frozenset({"인사"})
+
 class IntentDetector:
     """사용자 메시지의 의도를 파악하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, lexicon_path: Optional[str] = None):
         # 의도별 키워드 정의
         self.intent_keywords = {
             "급식": [
                 "급식", "밥", "메뉴", "식단", "점심", "아침", "저녁", 
                 "오늘 뭐 먹어", "내일 뭐 먹어", "급식 메뉴", "식단 알려줘"
             ],
+            "공지": [
+                "공지", "공지사항", "가정통신문", "통신문", "안내장"
+            ],
             "질문": [
                 "전학", "학교", "규칙", "시험", "방과후", "도서관", "운동장",
                 "어떻게", "절차", "신청", "발급", "연락", "상담", "신고",
@@ -19,6 +39,112 @@ class IntentDetector:
                 "잘가", "잘 있어", "재미있어", "좋아", "싫어"
             ]
         }
+        self._default_keywords = self.intent_keywords
+        
+        # 운영 중 키워드를 바꿀 수 있는 JSON 사전 파일 ({"의도": ["키워드", ...]})
+        self.lexicon_path = lexicon_path
+        self._lexicon_mtime: Optional[float] = None
+        self._reload_lock = threading.Lock()
+        # 오토마톤이 교체될 때마다 증가
+        self.version = 0
+        
+        self._state = self._build_matcher(self.intent_keywords)
+        if lexicon_path:
+            self.reload_if_changed()
+    
+    def _build_matcher(self, intent_keywords: Dict[str, List[str]]) -> Tuple:
+        """intent_keywords로부터 키워드 오토마톤을 만듭니다."""
+        # 키워드 -> 의도 목록 (같은 키워드가 여러 의도에 속할 수 있음)
+        keyword_intents: Dict[str, List[str]] = {}
+        for intent, keywords in intent_keywords.items():
+            for keyword in keywords:
+                intents = keyword_intents.setdefault(keyword.lower(), [])
+                if intent not in intents:
+                    intents.append(intent)
+        
+        intent_priority = {intent: i for i, intent in enumerate(intent_keywords)}
+        return keyword_intents, intent_priority, KeywordMatcher(keyword_intents)
+    
+    def reload_if_changed(self) -> bool:
+        """
+        사전 파일이 바뀌었으면 키워드를 다시 읽어 오토마톤을 교체합니다.
+        사전에 있는 의도는 기본 키워드를 대체하고, 새 의도는 뒤에 추가됩니다.
+        
+        Returns:
+            bool: 오토마톤이 교체되었으면 True
+        """
+        if not self.lexicon_path:
+            return False
+        
+        with self._reload_lock:
+            try:
+                mtime = os.stat(self.lexicon_path).st_mtime
+            except OSError:
+                return False
+            
+            if mtime == self._lexicon_mtime:
+                return False
+            
+            try:
+                with open(self.lexicon_path, encoding="utf-8") as f:
+                    lexicon = json.load(f)
+                
+                intent_keywords = dict(self._default_keywords)
+                for intent, keywords in lexicon.items():
+                    intent_keywords[intent] = [str(keyword) for keyword in keywords]
+                
+                state = self._build_matcher(intent_keywords)
+            except Exception as e:
+                # 잘못된 사전 파일이면 기존 키워드를 계속 사용
+                log_event(logger, "intent.lexicon_load_error", level=logging.WARNING, error=str(e))
+                return False
+            
+            self._lexicon_mtime = mtime
+            # 완성된 오토마톤으로 한 번에 교체
+            self.intent_keywords = intent_keywords
+            self._state = state
+            self.version += 1
+            return True
+    
+    def classify(self, user_input: str) -> Dict:
+        """
+        한 번의 스캔으로 모든 의도의 키워드 매칭을 찾아 의도와 신뢰도를 계산합니다.
+        
+        각 의도의 점수는 해당 의도 키워드가 덮는 글자 수이며, 점수가 같으면
+        intent_keywords에 먼저 정의된 의도를 선택합니다. 인사(FALLBACK_INTENTS)는
+        다른 의도의 키워드가 하나도 없을 때만 선택합니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+        
+        Returns:
+            Dict: {"intent": 의도, "confidence": 신뢰도,
+                   "matches": 선택된 의도의 (시작, 끝, 키워드) 목록,
+                   "scores": 의도별 점수}
+        """
+        text = user_input.lower().strip()
+        keyword_intents, intent_priority, matcher = self._state
+        
+        # 의도별 매칭 구간 수집
+        intent_spans: Dict[str, List[Tuple[int, int, str]]] = {}
+        for match in matcher.find_all(text):
+            for intent in keyword_intents[match[2]]:
+                intent_spans.setdefault(intent, []).append(match)
+        
+        if not intent_spans:
+            # 매칭되는 의도가 없으면 "일반" 반환
+            return {"intent": "일반", "confidence": 0.0, "matches": [], "scores": {}}
+        
+        scores = {intent: self._covered_length(spans) for intent, spans in intent_spans.items()}
+        candidates = [name for name in scores if name not in FALLBACK_INTENTS] or list(scores)
+        intent = min(candidates, key=lambda name: (-scores[name], intent_priority[name]))
+        
+        return {
+            "intent": intent,
+            "confidence": self._confidence(text, scores, intent),
+            "matches": intent_spans[intent],
+            "scores": scores
+        }
     
     def detect(self, user_input: str) -> str:
         """
@@ -30,15 +156,7 @@ class IntentDetector:
         Returns:
             str: 의도 ("급식", "질문", "인사", "일반")
         """
-        user_input = user_input.lower().strip()
-        
-        # 각 의도별로 키워드 매칭
-        for intent, keywords in self.intent_keywords.items():
-            if any(keyword in user_input for keyword in keywords):
-                return intent
-        
-        # 매칭되는 의도가 없으면 "일반" 반환
-        return "일반"
+        return self.classify(user_input)["intent"]
     
     def get_confidence_score(self, user_input: str, intent: str) -> float:
         """
@@ -51,16 +169,38 @@ class IntentDetector:
         Returns:
             float: 신뢰도 점수 (0.0 ~ 1.0)
         """
-        user_input = user_input.lower().strip()
-        
         if intent not in self.intent_keywords:
             return 0.0
         
-        keywords = self.intent_keywords[intent]
-        matched_keywords = [kw for kw in keywords if kw in user_input]
+        result = self.classify(user_input)
+        if intent not in result["scores"]:
+            return 0.0
+        
+        return self._confidence(user_input.lower().strip(), result["scores"], intent)
+    
+    def _covered_length(self, spans: List[Tuple[int, int, str]]) -> int:
+        """겹치는 매칭 구간을 합쳐 덮인 글자 수를 계산합니다."""
+        covered = 0
+        end = -1
+        
+        for span_start, span_end, _ in sorted(spans):
+            if span_end <= end:
+                continue
+            covered += span_end - max(span_start, end)
+            end = span_end
+        
+        return covered
+    
+    def _confidence(self, text: str, scores: Dict[str, int], intent: str) -> float:
+        """의도 점수의 비중과 입력 대비 매칭 비율로 신뢰도를 계산합니다."""
+        # 다른 의도와 비교한 점수 비중 (인사가 아닌 의도는 인사 점수와 비교하지 않음)
+        if intent not in FALLBACK_INTENTS:
+            scores = {name: score for name, score in scores.items() if name not in FALLBACK_INTENTS}
+        share = scores[intent] / sum(scores.values())
         
-        # 매칭된 키워드 수 / 전체 키워드 수
-        confidence = len(matched_keywords) / len(keywords)
+        # 공백을 제외한 입력 중 키워드가 덮는 비율
+        length = len(text.replace(" ", "")) or 1
+        coverage = min(scores[intent] / length, 1.0)
         
         # 최소 신뢰도 보장
-        return max(confidence, 0.1) 
\ No newline at end of file
+        return max(share * coverage, 0.1)
\ No newline at end of file
@@ -0,0 +1,185 @@
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# orjson이 설치되어 있으면 빠른 JSON 직렬화를, 없으면 표준 json 모듈을 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# 카카오톡 simpleText 말풍선 하나의 최대 글자 수와 응답 하나에 넣을 수 있는 최대 말풍선 수
+SIMPLE_TEXT_LIMIT = 1000
+MAX_OUTPUTS = 3
+
+# simpleText 말풍선 하나를 텍스트 자리 기준으로 나눈 앞뒤 조각
+_PLACEHOLDER = "\x00"
+_OUTPUT_PREFIX, _OUTPUT_SUFFIX = dumps({"simpleText": {"text": _PLACEHOLDER}}).split(dumps(_PLACEHOLDER))
+
+def _pieces(text: str, limit: int) -> Iterator[str]:
+    """텍스트를 문단(빈 줄)으로 나누고, limit보다 긴 문단은 줄 경계(없으면 글자 수)에서 자릅니다."""
+    for paragraph in text.split("\n\n"):
+        while len(paragraph) > limit:
+            cut = paragraph.rfind("\n", 0, limit + 1)
+            if cut <= 0:
+                cut = limit
+            yield paragraph[:cut]
+            paragraph = paragraph[cut:].lstrip("\n")
+        yield paragraph
+
+def split_text(text: str, limit: int = SIMPLE_TEXT_LIMIT,
+               max_outputs: Optional[int] = MAX_OUTPUTS) -> List[str]:
+    """
+    긴 답변을 문단 경계에서 말풍선 여러 개로 나눕니다.
+    
+    Args:
+        text (str): 답변 텍스트
+        limit (int): 말풍선 하나의 최대 글자 수
+        max_outputs (Optional[int]): 최대 말풍선 수 (넘치면 마지막 말풍선 끝을 "…"로 자름, None이면 제한 없음)
+    
+    Returns:
+        List[str]: 말풍선별 텍스트
+    """
+    if len(text) <= limit:
+        return [text]
+    
+    chunks: List[str] = []
+    current = None
+    for piece in _pieces(text, limit):
+        if current is not None and len(current) + 2 + len(piece) <= limit:
+            current += "\n\n" + piece
+            continue
+        if current is not None:
+            chunks.append(current)
+        current = piece
+    chunks.append(current)
+    
+    if max_outputs is not None and len(chunks) > max_outputs:
+        chunks = chunks[:max_outputs]
+        chunks[-1] = chunks[-1][:limit - 1] + "…"
+    return chunks
+
+class KakaoTemplate:
+    """
+    의도별 카카오톡 응답 틀
+    
+    퀵리플라이와 응답 뼈대를 미리 JSON 바이트 조각으로 만들어 두고,
+    응답마다 답변 텍스트만 끼워 넣습니다. (모든 응답이 공유하므로 바꿀 수 없는 값만 보관)
+    """
+    
+    __slots__ = ("quick_replies", "_prefix", "_suffix")
+    
+    def __init__(self, quick_replies: Tuple[Tuple[str, str], ...]):
+        # (버튼 이름, 보낼 메시지) 목록
+        self.quick_replies: Tuple[Tuple[str, str], ...] = tuple(
+            (label, message) for label, message in quick_replies
+        )
+        
+        # 말풍선 목록 자리를 기준으로 앞뒤를 나눠 미리 인코딩
+        output = {"simpleText": {"text": _PLACEHOLDER}}
+        encoded = dumps(self._skeleton([output]))
+        self._prefix, self._suffix = encoded.split(dumps(output))
+    
+    def _skeleton(self, outputs: List[Dict]) -> Dict:
+        """말풍선 목록으로 응답 dict를 새로 만듭니다."""
+        return {
+            "version": "2.0",
+            "template": {
+                "outputs": outputs,
+                "quickReplies": [
+                    {"messageText": message, "action": "message", "label": label}
+                    for label, message in self.quick_replies
+                ]
+            }
+        }
+    
+    def build(self, text: str) -> "KakaoResponse":
+        """답변 텍스트로 카카오톡 응답을 만듭니다."""
+        return KakaoResponse(self, text)
+    
+    def render(self, text: str) -> bytes:
+        """답변 텍스트를 끼워 넣은 응답 JSON 바이트를 반환합니다. (긴 답변은 말풍선 여러 개)"""
+        outputs = b",".join(_OUTPUT_PREFIX + dumps(chunk) + _OUTPUT_SUFFIX for chunk in split_text(text))
+        return self._prefix + outputs + self._suffix
+    
+    def to_dict(self, text: str) -> Dict:
+        """답변 텍스트를 넣은 응답 dict를 새로 만듭니다. (render와 같은 내용)"""
+        return self._skeleton([{"simpleText": {"text": chunk}} for chunk in split_text(text)])
+
+class KakaoResponse(Mapping):
+    """
+    틀에서 만든 카카오톡 응답
+    
+    틀과 답변 텍스트만 보관하고 to_bytes()로 미리 인코딩한 조각에 텍스트를 끼워 보냅니다.
+    읽기 전용 Mapping이라 response["template"]처럼 읽을 수 있으며, 그때마다 새 dict를 만들어 바이트와 어긋나지 않습니다.
+    """
+    
+    __slots__ = ("_template", "text")
+    
+    def __init__(self, template: KakaoTemplate, text: str):
+        self._template = template
+        self.text = text
+    
+    def to_bytes(self) -> bytes:
+        """응답 JSON 바이트를 반환합니다."""
+        return self._template.render(self.text)
+    
+    def to_dict(self) -> Dict:
+        """응답을 새 dict로 반환합니다."""
+        return self._template.to_dict(self.text)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.to_dict()[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(("version", "template"))
+    
+    def __len__(self) -> int:
+        return 2
+
+# 의도별 퀵리플라이 (버튼 이름, 보낼 메시지)
+DEFAULT_TEMPLATE = KakaoTemplate((
+    ("급식 메뉴", "급식 메뉴 알려줘"),
+    ("학교 규칙", "학교 규칙 알려줘"),
+    ("방과후", "방과후 프로그램 알려줘")
+))
+
+TEMPLATES: Dict[str, KakaoTemplate] = {
+    "급식": KakaoTemplate((
+        ("내일 급식", "내일 급식 알려줘"),
+        ("이번 주 급식", "이번 주 급식 알려줘")
+    )),
+    "공지": KakaoTemplate((
+        ("최근 공지", "최근 공지사항 알려줘"),
+        ("급식 메뉴", "급식 메뉴 알려줘")
+    )),
+    "질문": KakaoTemplate((
+        ("급식 메뉴", "급식 메뉴 알려줘"),
+        ("학교 규칙", "학교 규칙 알려줘")
+    ))
+}
+
+def format_response(text: str, intent: str = "general") -> KakaoResponse:
+    """
+    답변 텍스트를 의도에 맞는 카카오톡 응답으로 만듭니다.
+    
+    Args:
+        text (str): 답변 텍스트
+        intent (str): 파악된 의도 (퀵리플라이 선택용)
+    
+    Returns:
+        KakaoResponse: 카카오톡 응답
+    """
+    return TEMPLATES.get(intent, DEFAULT_TEMPLATE).build(text)
+
+def encode_response(response: Mapping) -> bytes:
+    """카카오톡 응답을 JSON 바이트로 만듭니다. (틀에서 만든 응답은 미리 인코딩한 조각 사용)"""
+    if isinstance(response, KakaoResponse):
+        return response.to_bytes()
+    return dumps(response)
\ No newline at end of file
@@ -0,0 +1,74 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+class KeywordMatcher:
+    """Aho-Corasick 오토마톤 기반 다중 키워드 매칭 클래스"""
+    
+    def __init__(self, keywords: Iterable[str]):
+        # 상태별 전이 테이블, 실패 링크, 출력(해당 상태에서 끝나는 키워드 목록)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        
+        for keyword in keywords:
+            if keyword:
+                self._add(keyword)
+        
+        self._build()
+    
+    def _add(self, keyword: str):
+        """키워드를 트라이에 추가합니다."""
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][ch] = next_state
+            state = next_state
+        
+        if keyword not in self._output[state]:
+            self._output[state] += (keyword,)
+    
+    def _build(self):
+        """BFS로 실패 링크를 계산하고 출력을 병합합니다."""
+        queue = deque(self._goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                
+                self._fail[next_state] = fail
+                self._output[next_state] += self._output[fail]
+    
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        텍스트를 한 번 훑으며 모든 키워드 출현 위치를 찾습니다.
+        
+        Args:
+            text (str): 검색 대상 텍스트
+        
+        Returns:
+            List[Tuple[int, int, str]]: (시작, 끝, 키워드) 목록 (겹치는 매칭 포함)
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        matches = []
+        state = 0
+        
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            
+            for keyword in output[state]:
+                matches.append((i + 1 - len(keyword), i + 1, keyword))
+        
+        return matches
\ No newline at end of file
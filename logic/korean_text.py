@@ -0,0 +1,71 @@
+import re
+from typing import Callable, List
+
+# 단어 끝에서 떼어낼 조사 (긴 것부터 확인)
+KOREAN_PARTICLES = ('에서', '으로', '이', '가', '을', '를', '은', '는', '에', '로', '와', '과', '도', '만', '의')
+
+# 키워드 추출 시 제외할 불용어
+KOREAN_STOP_WORDS = set(KOREAN_PARTICLES) | {'것', '수', '등', '등등'}
+
+# sklearn TfidfVectorizer 기본 토큰 패턴
+_WORD_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+_TERM_PATTERN = re.compile(r'[가-힣a-zA-Z0-9]+')
+_QUESTION_TERM_PATTERN = re.compile(r'[가-힣ㄱ-ㅎa-z0-9]+')
+
+def strip_particle(word: str) -> str:
+    """단어 끝의 조사를 떼어냅니다. (어간이 2글자 이상 남을 때만)"""
+    for particle in KOREAN_PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[:-len(particle)]
+    return word
+
+def normalize_utterance(text: str) -> str:
+    """캐시 키용으로 발화를 정규화합니다. (대소문자, 공백, 끝 문장부호 차이 무시)"""
+    return re.sub(r'\s+', ' ', text.lower()).strip().rstrip('?!.~ ')
+
+def normalize_question(text: str) -> str:
+    """
+    정확한 매칭용으로 질문을 정규화합니다.
+    (대소문자, 띄어쓰기, 문장부호, 단어 끝 조사 차이를 무시해 "방과후 신청은?"과 "방과후신청"이 같아짐)
+    """
+    return "".join(strip_particle(word) for word in _QUESTION_TERM_PATTERN.findall(text.lower()))
+
+def word_analyzer(text: str) -> List[str]:
+    """단어 1~2그램 분석기 (TfidfVectorizer 기본 설정과 동일)"""
+    tokens = _WORD_PATTERN.findall(text.lower())
+    
+    terms = list(tokens)
+    terms.extend(" ".join(tokens[i:i + 2]) for i in range(len(tokens) - 1))
+    return terms
+
+def char_analyzer(text: str, min_n: int = 1, max_n: int = 3) -> List[str]:
+    """조사를 떼어낸 단어 단위 글자 n-그램 분석기 (char_wb 방식)"""
+    terms = []
+    
+    for word in _TERM_PATTERN.findall(text.lower()):
+        word = f" {strip_particle(word)} "
+        for n in range(min_n, max_n + 1):
+            if n > len(word):
+                break
+            terms.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    
+    return terms
+
+ANALYZERS = {
+    "word": word_analyzer,
+    "char": char_analyzer
+}
+
+def get_analyzer(mode: str) -> Callable[[str], List[str]]:
+    """
+    분석기 모드 이름에 해당하는 분석 함수를 반환합니다.
+    
+    Args:
+        mode (str): "word" (단어 n-그램) 또는 "char" (조사 제거 + 글자 n-그램)
+    
+    Returns:
+        Callable[[str], List[str]]: 텍스트를 단어 목록으로 바꾸는 함수
+    """
+    if mode not in ANALYZERS:
+        raise ValueError(f"지원하지 않는 분석기 모드입니다: {mode}")
+    return ANALYZERS[mode]
\ No newline at end of file
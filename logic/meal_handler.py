@@ -1,13 +1,115 @@
+import logging
+import os
 import sqlite3
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from datetime import date as Date, datetime, timedelta
+from typing import Optional, Dict, List, Tuple
+from .kakao_response import MAX_OUTPUTS, split_text
+from .school_db import connect_readonly, default_db_path
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("meal")
+
+# 식사 종류별로 사용자 입력에서 찾을 표현 (먼저 정의된 종류 우선)
+MEAL_TYPE_KEYWORDS = {
+    "조식": ("조식", "아침"),
+    "석식": ("석식", "저녁"),
+    "중식": ("중식", "점심")
+}
+
+# 식사 종류가 없거나 입력에서 찾지 못했을 때의 기본값
+DEFAULT_MEAL_TYPE = "중식"
+
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+def _date_pattern(year_group: int) -> str:
+    """
+    날짜 표현 정규식을 만듭니다. ("2025-05-12", "5월 13일", "5/13", "5.13일")
+    
+    연도가 없으면 "-"와 "."는 뒤에 "일"이 올 때만 월/일 구분으로 봅니다. ("1-2학년"은 날짜가 아님)
+    
+    Args:
+        year_group (int): 전체 정규식 안에서 이 날짜의 연도 그룹 번호 (조건부 그룹에 사용)
+    """
+    return (r'(?:(\d{4})\s*[-./년]\s*)?(\d{1,2})\s*'
+            rf'(?:월|/|(?({year_group})[-.]|[-.](?=\s*\d{{1,2}}\s*일)))\s*(\d{{1,2}})\s*일?')
+
+# 날짜 표현 패턴 (모듈 로드 시 한 번만 컴파일)
+DATE_PATTERN = re.compile(_date_pattern(1))
+# "5월 12일부터 5월 16일까지", "5/12~5/16", "5월 12일부터 16일까지"
+DATE_RANGE_PATTERN = re.compile(
+    _date_pattern(1) + r'\s*(?:부터|~)\s*(?:' + _date_pattern(4) + r'|(\d{1,2})\s*일)'
+)
+# "월요일부터 수요일까지", "월요일~수요일", "월~수"
+WEEKDAY_RANGE_PATTERN = re.compile(
+    r'([월화수목금토일])요일\s*(?:부터|~)\s*([월화수목금토일])(?:요일)?'
+    r'|(?<![\d월])([월화수목금토일])\s*~\s*([월화수목금토일])(?:요일)?'
+)
+WEEKDAY_PATTERN = re.compile(r'([월화수목금토일])요일')
+# "이번 주", "다음 주", "지난주", "이번 달", "다음달"
+PERIOD_PATTERN = re.compile(r'(이번|금|다다음|다음|담|지난|저번)\s*(주|달)')
+# "5월 급식", "2025년 5월 급식" (날짜 없이 월만 있는 경우)
+MONTH_PATTERN = re.compile(r'(?<!\d)(?:(\d{4})\s*년\s*)?(\d{1,2})\s*월(?!\s*\d)(?!요일)')
+
+PERIOD_OFFSETS = {"이번": 0, "금": 0, "다음": 1, "담": 1, "다다음": 2, "지난": -1, "저번": -1}
+WEEK_LABELS = {0: "이번 주", 1: "다음 주", 2: "다다음 주", -1: "지난 주"}
+RELATIVE_DAYS = (("오늘", 0), ("내일", 1), ("어제", -1), ("모레", 2), ("글피", 3))
+
+# 기간 조회에서 급식이 없는 평일도 "급식 정보 없음"으로 보여 주는 최대 기간 (일)
+RANGE_SHOW_EMPTY_DAYS = 7
+
+def format_meal_display(date: str, meal_type: str, menu: str) -> str:
+    """
+    급식 안내 문구를 만듭니다. (급식 적재 시 미리 만들어 meals.display_text에 저장)
+    
+    Args:
+        date (str): 날짜 (YYYY-MM-DD)
+        meal_type (str): 식사 종류 (조식, 중식, 석식)
+        menu (str): 메뉴 (줄바꿈으로 구분)
+    
+    Returns:
+        str: 급식 안내 문구
+    """
+    # 날짜를 한국어로 변환
+    date_obj = datetime.strptime(date, "%Y-%m-%d")
+    weekday = WEEKDAY_NAMES[date_obj.weekday()]
+    
+    formatted_date = f"{date_obj.month}월 {date_obj.day}일 ({weekday}요일)"
+    
+    return f"📅 {formatted_date} {meal_type} 메뉴입니다:\n\n🍽️ {menu}"
+
+def format_meal_day(date_obj: datetime, menu: Optional[str]) -> str:
+    """기간 조회 응답에 들어가는 하루치 급식 문구를 만듭니다. (메뉴가 없으면 "급식 정보 없음")"""
+    weekday = WEEKDAY_NAMES[date_obj.weekday()]
+    return f"📅 {date_obj.month}월 {date_obj.day}일 ({weekday}요일)\n🍽️ {menu or '급식 정보 없음'}"
 
 class MealHandler:
     """급식 정보 처리 클래스"""
     
-    def __init__(self, db_path: str = '../school_data.db'):
-        self.db_path = db_path
+    def __init__(self, db_path: Optional[str] = None, refresh_interval: float = 1.0):
+        self.db_path = db_path or default_db_path()
+        # DB 변경 여부를 확인하는 최소 간격 (초)
+        self.refresh_interval = refresh_interval
+        # 캘린더가 다시 로드될 때마다 증가
+        self.version = 0
+        
+        # (날짜 -> {식사 종류: (메뉴, 안내 문구, 기간 조회용 하루치 문구)} 캘린더, 정렬된 날짜 목록)
+        # 날짜 목록은 범위 조회 시 bisect 슬라이스로 사용하며, 다시 로드할 때 둘이 어긋나지 않도록
+        # 한 튜플로 묶어 한 번에 교체하고 조회할 때도 한 번만 읽음
+        self._snapshot: Tuple[Dict[str, Dict[str, Tuple[str, str, str]]], List[str]] = ({}, [])
+        
+        self._conn: Optional[sqlite3.Connection] = None
+        self._mtime: Optional[float] = None
+        self._data_version: Optional[int] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        
+        with self._lock:
+            self._load_calendar()
     
     def get_meal_info(self, user_input: str = "") -> str:
         """
@@ -19,119 +121,350 @@ class MealHandler:
         Returns:
             str: 급식 정보 텍스트
         """
-        # 날짜 추출
-        target_date = self._extract_date(user_input)
+        self._refresh_if_stale()
+        calendar, dates = self._snapshot
+        return self._answer(user_input, calendar, dates)
+    
+    def get_meal_infos(self, user_inputs: List[str]) -> List[str]:
+        """
+        여러 입력의 급식 정보를 한 번에 조회합니다.
+        
+        DB 변경 확인은 한 번만 하고, 모든 입력을 같은 캘린더 스냅샷에서 조회합니다.
+        
+        Args:
+            user_inputs (List[str]): 사용자 입력 메시지 목록
+        
+        Returns:
+            List[str]: 입력 순서대로의 급식 정보 텍스트 목록
+        """
+        self._refresh_if_stale()
+        calendar, dates = self._snapshot
+        return [self._answer(user_input, calendar, dates) for user_input in user_inputs]
+    
+    def _answer(self, user_input: str, calendar: Dict[str, Dict[str, Tuple[str, str, str]]],
+                dates: List[str]) -> str:
+        """캘린더에서 입력의 날짜(또는 기간)와 식사 종류에 맞는 급식 정보 텍스트를 찾습니다."""
+        # 날짜 범위와 식사 종류 추출
+        date_range = self._extract_date_range(user_input)
+        meal_type = self._extract_meal_type(user_input)
+        
+        if date_range and date_range[0] != date_range[1]:
+            return self._answer_range(calendar, dates, *date_range, meal_type)
         
-        if not target_date:
-            target_date = datetime.now().strftime("%Y-%m-%d")
+        target_date = date_range[0] if date_range else datetime.now().strftime("%Y-%m-%d")
         
         # 주말 체크
         weekday = datetime.strptime(target_date, "%Y-%m-%d").weekday()
         if weekday >= 5:  # 토요일(5), 일요일(6)
             return f"{target_date}는 주말(토/일)이라 급식이 없습니다."
         
-        # DB에서 급식 정보 조회
-        meal_info = self._get_meal_from_db(target_date)
+        # 캘린더에서 미리 만들어 둔 안내 문구 조회
+        display_text = self._lookup_meal(calendar, target_date, meal_type)
         
-        if meal_info:
-            return self._format_meal_info(target_date, meal_info)
+        if display_text:
+            return display_text
+        elif meal_type != DEFAULT_MEAL_TYPE:
+            return f"{target_date}에는 {meal_type} 식단 정보가 없습니다."
         else:
             return f"{target_date}에는 식단 정보가 없습니다."
     
+    def _extract_meal_type(self, user_input: str) -> str:
+        """사용자 입력에서 식사 종류를 추출합니다. (없으면 중식)"""
+        for meal_type, keywords in MEAL_TYPE_KEYWORDS.items():
+            if any(keyword in user_input for keyword in keywords):
+                return meal_type
+        return DEFAULT_MEAL_TYPE
+    
+    def _answer_range(self, calendar: Dict[str, Dict[str, Tuple[str, str, str]]], dates: List[str],
+                      start_date: str, end_date: str, label: str, meal_type: str) -> str:
+        """캘린더 슬라이스로 기간 내 급식 정보 텍스트를 만듭니다."""
+        meal_label = "급식" if meal_type == DEFAULT_MEAL_TYPE else meal_type
+        
+        # 정렬된 날짜 목록에서 기간에 해당하는 부분만 잘라 조회 (미리 만든 하루치 문구 사용)
+        days = {}
+        for date in dates[bisect_left(dates, start_date):bisect_right(dates, end_date)]:
+            entry = calendar[date].get(meal_type)
+            if entry:
+                days[date] = entry[2]
+        
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+        
+        if (end - start).days < RANGE_SHOW_EMPTY_DAYS:
+            # 한 주 이내면 급식이 없는 평일도 표시
+            lines = []
+            current = start
+            while current <= end:
+                if current.weekday() < 5:
+                    lines.append(days.get(current.strftime("%Y-%m-%d")) or format_meal_day(current, None))
+                current += timedelta(days=1)
+            if not days and not lines:
+                return f"{label}에는 주말(토/일)이라 급식이 없습니다."
+        else:
+            lines = list(days.values())
+        
+        if not days:
+            return f"{label}에는 {meal_label} 식단 정보가 없습니다."
+        
+        header = f"📋 {label} {meal_label} 메뉴입니다:"
+        text = "\n\n".join([header] + lines)
+        
+        # 카카오톡 말풍선(최대 MAX_OUTPUTS개)에 다 들어가지 않으면 들어가는 날까지만 보여 주고 나머지는 안내
+        chunks = split_text(text, max_outputs=None)
+        if len(chunks) > MAX_OUTPUTS:
+            # 말풍선에 들어가는 문단 수에서 머리말과 안내 문구 자리를 뺌
+            shown = sum(chunk.count("\n\n") + 1 for chunk in chunks[:MAX_OUTPUTS]) - 2
+            rest = datetime.strptime(list(days)[shown], "%Y-%m-%d")
+            rest_range = f"{rest.month}월 {rest.day}일부터 {end.month}월 {end.day}일까지"
+            text = "\n\n".join(
+                [header] + lines[:shown]
+                + [f"… 나머지 {len(lines) - shown}일은 \"{rest_range} 급식\"으로 물어봐 주세요."]
+            )
+        return text
+    
     def _extract_date(self, user_input: str) -> Optional[str]:
-        """사용자 입력에서 날짜를 추출합니다."""
-        today = datetime.now()
+        """사용자 입력에서 날짜를 추출합니다. (기간이면 시작 날짜)"""
+        date_range = self._extract_date_range(user_input)
+        return date_range[0] if date_range else None
+    
+    def _extract_date_range(self, user_input: str) -> Optional[Tuple[str, str, str]]:
+        """
+        사용자 입력에서 날짜 또는 기간을 추출합니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+        
+        Returns:
+            Optional[Tuple[str, str, str]]: (시작 날짜, 종료 날짜, 기간 이름), 하루면 시작과 종료가 같음
+        """
+        today = datetime.now().date()
         user_input = user_input.lower()
         
         # 키워드 기반 날짜 추출
-        if "오늘" in user_input:
-            return today.strftime("%Y-%m-%d")
-        elif "내일" in user_input:
-            return (today + timedelta(days=1)).strftime("%Y-%m-%d")
-        elif "어제" in user_input:
-            return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-        elif "모레" in user_input:
-            return (today + timedelta(days=2)).strftime("%Y-%m-%d")
-        elif "글피" in user_input:
-            return (today + timedelta(days=3)).strftime("%Y-%m-%d")
-        
-        # 패턴 기반 날짜 추출
-        # "5월 20일", "5/20" 같은 패턴
-        match = re.search(r'(\d{1,2})[월/\s](\d{1,2})일?', user_input)
+        for keyword, offset in RELATIVE_DAYS:
+            if keyword in user_input:
+                return self._single_day(today + timedelta(days=offset))
+        
+        # "5월 12일부터 16일까지" 같은 날짜 범위
+        match = DATE_RANGE_PATTERN.search(user_input)
         if match:
-            month, day = map(int, match.groups())
-            # 올해 날짜로 가정
-            try:
-                return today.replace(month=month, day=day).strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+            groups = match.groups()
+            start = self._to_date(today, *groups[0:3])
+            if groups[6]:
+                end = self._to_date(today, groups[3] or groups[0], groups[4] or groups[1], groups[6])
+            else:
+                end = self._to_date(today, *groups[3:6])
+            if start and end and start <= end:
+                return self._labeled_range(start, end)
+        
+        # "5월 20일", "5/20" 같은 날짜
+        match = DATE_PATTERN.search(user_input)
+        if match:
+            target = self._to_date(today, *match.groups())
+            if target:
+                return self._single_day(target)
+        
+        # "이번 주", "다음 달" 같은 기간 (요일이 함께 있으면 그 주의 요일)
+        period = PERIOD_PATTERN.search(user_input)
+        week_offset = PERIOD_OFFSETS[period.group(1)] if period and period.group(2) == "주" else 0
+        monday = today - timedelta(days=today.weekday()) + timedelta(weeks=week_offset)
         
-        # "월요일", "화요일" 같은 패턴
-        weekday_map = {
-            "월요일": 0, "화요일": 1, "수요일": 2, "목요일": 3, "금요일": 4,
-            "토요일": 5, "일요일": 6
-        }
+        # "월요일부터 수요일까지", "월~수" 같은 요일 범위
+        match = WEEKDAY_RANGE_PATTERN.search(user_input)
+        if match:
+            first, last = match.group(1, 2) if match.group(1) else match.group(3, 4)
+            start = monday + timedelta(days=WEEKDAY_NAMES.index(first))
+            end = monday + timedelta(days=WEEKDAY_NAMES.index(last))
+            if start <= end:
+                return self._labeled_range(start, end)
+        
+        # "월요일", "다음 주 화요일" 같은 요일
+        match = WEEKDAY_PATTERN.search(user_input)
+        if match:
+            return self._single_day(monday + timedelta(days=WEEKDAY_NAMES.index(match.group(1))))
         
-        for weekday_name, weekday_num in weekday_map.items():
-            if weekday_name in user_input:
-                # 이번 주 해당 요일 계산
-                current_weekday = today.weekday()
-                days_diff = weekday_num - current_weekday
-                target_date = today + timedelta(days=days_diff)
-                return target_date.strftime("%Y-%m-%d")
+        if period:
+            offset = PERIOD_OFFSETS[period.group(1)]
+            if period.group(2) == "주":
+                # 주 단위는 월~금
+                return (monday.strftime("%Y-%m-%d"), (monday + timedelta(days=4)).strftime("%Y-%m-%d"),
+                        WEEK_LABELS.get(offset, f"{monday.month}월 {monday.day}일 주"))
+            month_index = today.year * 12 + today.month - 1 + offset
+            return self._month_range(month_index // 12, month_index % 12 + 1)
+        
+        # "5월 급식", "2025년 5월 급식" 같은 월 단위 (연도가 없으면 올해)
+        match = MONTH_PATTERN.search(user_input)
+        if match and 1 <= int(match.group(2)) <= 12:
+            return self._month_range(int(match.group(1) or today.year), int(match.group(2)))
         
         return None
     
-    def _get_meal_from_db(self, date: str) -> Optional[str]:
-        """DB에서 특정 날짜의 급식 정보를 가져옵니다."""
+    @staticmethod
+    def _to_date(today: Date, year: Optional[str], month: str, day: str) -> Optional[Date]:
+        """정규식에서 찾은 연/월/일을 날짜로 바꿉니다. (연도가 없으면 올해로 가정)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # 중식 정보 조회 (기본적으로 중식만 제공)
-            cursor.execute(
-                'SELECT menu FROM meals WHERE date = ? AND meal_type = "중식"', 
-                (date,)
-            )
-            result = cursor.fetchone()
-            conn.close()
+            return Date(int(year) if year else today.year, int(month), int(day))
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _single_day(day: Date) -> Tuple[str, str, str]:
+        """하루짜리 기간을 만듭니다."""
+        date = day.strftime("%Y-%m-%d")
+        return date, date, date
+    
+    @staticmethod
+    def _labeled_range(start: Date, end: Date) -> Tuple[str, str, str]:
+        """시작/종료 날짜로 이름 붙은 기간을 만듭니다."""
+        label = f"{start.month}월 {start.day}일 ~ {end.month}월 {end.day}일"
+        return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"), label
+    
+    @staticmethod
+    def _month_range(year: int, month: int) -> Tuple[str, str, str]:
+        """한 달 전체 기간을 만듭니다."""
+        last_day = monthrange(year, month)[1]
+        return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last_day:02d}", f"{month}월"
+    
+    def _load_calendar(self):
+        """meals 테이블 전체를 메모리 캘린더로 로드합니다. (호출 시 _lock 보유)"""
+        try:
+            stat = os.stat(self.db_path)
+        except OSError as e:
+            # 존재하지 않는 경로에 빈 DB 파일이 생기지 않도록 연결하지 않음
+            log_event(logger, "meal.load_error", level=logging.ERROR, error=str(e))
+            self._close_connection()
+            self._mtime = None
+            self._data_version = None
+            return
             
-            return result[0] if result else None
+        try:
+            if self._conn is None:
+                self._conn = connect_readonly(self.db_path)
             
+            # 급식 적재 도구(meal_ingest)로 만든 DB에는 미리 만든 안내 문구가 있음
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(meals)')}
+            display_column = 'display_text' if 'display_text' in columns else 'NULL'
+            rows = self._conn.execute(
+                f'SELECT date, meal_type, menu, {display_column} FROM meals ORDER BY date'
+            ).fetchall()
+            data_version = self._conn.execute('PRAGMA data_version').fetchone()[0]
         except Exception as e:
-            print(f"급식 정보 조회 중 오류: {e}")
-            return None
+            log_event(logger, "meal.load_error", level=logging.ERROR, error=str(e))
+            self._close_connection()
+            self._mtime = None
+            self._data_version = None
+            return
+        
+        calendar: Dict[str, Dict[str, Tuple[str, str, str]]] = {}
+        for date, meal_type, menu, display_text in rows:
+            if not menu:
+                continue
+            meal_type = meal_type or DEFAULT_MEAL_TYPE
+            # 안내 문구와 기간 조회용 문구는 로드할 때 한 번만 만들어 요청마다 다시 포맷하지 않음
+            try:
+                day_text = format_meal_day(datetime.strptime(date, "%Y-%m-%d"), menu)
+                if not display_text:
+                    display_text = format_meal_display(date, meal_type, menu)
+            except ValueError:
+                continue
+            calendar.setdefault(date, {})[meal_type] = (menu, display_text, day_text)
+        
+        # 조회 중인 스레드가 반쯤 만들어진 상태를 보지 않도록 한 번에 교체
+        self._snapshot = (calendar, sorted(calendar))
+        self._mtime = stat.st_mtime
+        self._data_version = data_version
+        self.version += 1
+    
+    def _close_connection(self):
+        """캘린더 갱신용 연결을 닫습니다."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
     
-    def _format_meal_info(self, date: str, menu: str) -> str:
-        """급식 정보를 포맷팅합니다."""
-        # 날짜를 한국어로 변환
-        date_obj = datetime.strptime(date, "%Y-%m-%d")
-        weekday_names = ["월", "화", "수", "목", "금", "토", "일"]
-        weekday = weekday_names[date_obj.weekday()]
+    def _refresh_if_stale(self):
+        """DB 파일의 mtime 또는 data_version이 바뀌었으면 캘린더를 다시 로드합니다."""
+        now = time.monotonic()
+        if now - self._last_check < self.refresh_interval:
+            return
         
-        formatted_date = f"{date_obj.month}월 {date_obj.day}일 ({weekday}요일)"
+        with self._lock:
+            if now - self._last_check < self.refresh_interval:
+                return
+            self._last_check = now
+            
+            try:
+                mtime = os.stat(self.db_path).st_mtime
+            except OSError:
+                mtime = None
+            
+            if mtime != self._mtime:
+                # 파일이 교체되었을 수 있으므로 연결을 새로 연다
+                self._close_connection()
+                self._load_calendar()
+                return
+            
+            if self._conn is None:
+                return
+            
+            try:
+                data_version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+            except Exception as e:
+                log_event(logger, "meal.refresh_error", level=logging.WARNING, error=str(e))
+                return
+            
+            if data_version != self._data_version:
+                self._load_calendar()
+    
+    def reload_if_changed(self) -> bool:
+        """
+        DB가 바뀌었으면 캘린더를 다시 로드합니다. (백그라운드 재로드 스레드에서 호출)
         
-        return f"📅 {formatted_date} 중식 메뉴입니다:\n\n🍽️ {menu}"
+        Returns:
+            bool: 캘린더가 다시 로드되었으면 True
+        """
+        version = self.version
+        self._refresh_if_stale()
+        return self.version != version
     
-    def get_weekly_meal_info(self) -> str:
-        """이번 주 급식 정보를 조회합니다."""
-        today = datetime.now()
-        monday = today - timedelta(days=today.weekday())
+    def _lookup_meal(self, calendar: Dict[str, Dict[str, Tuple[str, str, str]]], date: str,
+                     meal_type: str = DEFAULT_MEAL_TYPE) -> Optional[str]:
+        """캘린더에서 특정 날짜/식사 종류의 급식 안내 문구를 가져옵니다."""
+        meals = calendar.get(date)
+        entry = meals.get(meal_type) if meals else None
+        return entry[1] if entry else None
+    
+    def get_meal_range(self, start_date: str, end_date: str,
+                       meal_type: str = DEFAULT_MEAL_TYPE) -> List[Tuple[str, str]]:
+        """
+        기간 내 급식 정보를 캘린더 슬라이스로 조회합니다.
         
-        weekly_meals = []
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함)
+            meal_type (str): 식사 종류
         
-        for i in range(5):  # 월~금
-            date = monday + timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-            
-            meal_info = self._get_meal_from_db(date_str)
-            if meal_info:
-                weekday_names = ["월", "화", "수", "목", "금"]
-                weekday = weekday_names[i]
-                weekly_meals.append(f"📅 {date.month}월 {date.day}일 ({weekday}요일)\n🍽️ {meal_info}")
-            else:
-                weekday_names = ["월", "화", "수", "목", "금"]
-                weekday = weekday_names[i]
-                weekly_meals.append(f"📅 {date.month}월 {date.day}일 ({weekday}요일)\n🍽️ 급식 정보 없음")
+        Returns:
+            List[Tuple[str, str]]: (날짜, 메뉴) 목록 (날짜순)
+        """
+        self._refresh_if_stale()
+        
+        calendar, dates = self._snapshot
+        lo = bisect_left(dates, start_date)
+        hi = bisect_right(dates, end_date)
+        
+        meals = []
+        for date in dates[lo:hi]:
+            entry = calendar[date].get(meal_type)
+            if entry:
+                meals.append((date, entry[0]))
         
-        return "📋 이번 주 급식 메뉴입니다:\n\n" + "\n\n".join(weekly_meals) 
\ No newline at end of file
+        return meals
+    
+    def get_weekly_meal_info(self) -> str:
+        """이번 주 급식 정보를 조회합니다."""
+        self._refresh_if_stale()
+        calendar, dates = self._snapshot
+        return self._answer("이번 주", calendar, dates)
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+급식 식단 적재 도구
+
+NEIS 급식식단정보(mealServiceDietInfo) JSON/CSV 내보내기 파일을 읽어 meals 테이블에 넣습니다.
+메뉴를 정리하고 날짜/식사 종류별 안내 문구를 미리 만들어 저장하며,
+모든 파일을 한 트랜잭션 안에서 묶음 단위 executemany upsert로 적재합니다.
+
+사용법:
+    python -m logic.meal_ingest meals_2025_1.json meals_2025_2.csv [--db school_data.db]
+"""
+
+import argparse
+import csv
+import html
+import json
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .meal_handler import DEFAULT_MEAL_TYPE, format_meal_display
+from .school_db import default_db_path
+
+# NEIS 식사 코드 -> 식사 종류
+MEAL_TYPE_CODES = {"1": "조식", "2": "중식", "3": "석식"}
+
+# 열 이름 후보 (NEIS Open API 필드명, 나이스 내려받기 파일의 한글 열 이름)
+DATE_FIELDS = ("MLSV_YMD", "급식일자")
+MEAL_NAME_FIELDS = ("MMEAL_SC_NM", "식사명")
+MEAL_CODE_FIELDS = ("MMEAL_SC_CODE", "식사코드")
+MENU_FIELDS = ("DDISH_NM", "요리명")
+
+# 메뉴 항목 구분자 (<br/> 태그 또는 줄바꿈)
+_MENU_SEPARATOR = re.compile(r'<br\s*/?>|\r?\n', re.IGNORECASE)
+_SPACES = re.compile(r'\s+')
+_DATE_DIGITS = re.compile(r'\D')
+
+UPSERT_SQL = '''
+    INSERT INTO meals (date, meal_type, menu, display_text)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(date, meal_type) DO UPDATE SET
+        menu = excluded.menu,
+        display_text = excluded.display_text
+'''
+
+def ensure_schema(conn: sqlite3.Connection):
+    """
+    meals 테이블을 (날짜, 식사 종류)별 한 행과 안내 문구 열을 갖는 구조로 맞춥니다.
+    
+    기존 테이블은 date만 UNIQUE라 조식/석식을 넣을 수 없으므로, 다시 만들어 기존 행을 옮기고
+    안내 문구를 채웁니다. (호출하는 쪽 트랜잭션 안에서 실행)
+    """
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(meals)')}
+    
+    if not columns:
+        conn.execute('''
+            CREATE TABLE meals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                meal_type TEXT NOT NULL DEFAULT '중식',
+                menu TEXT,
+                image_url TEXT,
+                display_text TEXT,
+                UNIQUE (date, meal_type)
+            )
+        ''')
+        return
+    
+    if 'display_text' in columns:
+        return
+    
+    conn.execute('ALTER TABLE meals RENAME TO meals_old')
+    conn.execute('''
+        CREATE TABLE meals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            meal_type TEXT NOT NULL DEFAULT '중식',
+            menu TEXT,
+            image_url TEXT,
+            display_text TEXT,
+            UNIQUE (date, meal_type)
+        )
+    ''')
+    rows = conn.execute(
+        'SELECT id, date, COALESCE(meal_type, ?), menu, image_url FROM meals_old ORDER BY id',
+        (DEFAULT_MEAL_TYPE,)
+    ).fetchall()
+    conn.executemany(
+        'INSERT OR REPLACE INTO meals (id, date, meal_type, menu, image_url, display_text) VALUES (?, ?, ?, ?, ?, ?)',
+        [
+            (row_id, date, meal_type, menu, image_url,
+             format_meal_display(date, meal_type, menu) if menu else None)
+            for row_id, date, meal_type, menu, image_url in rows
+        ]
+    )
+    conn.execute('DROP TABLE meals_old')
+
+def normalize_menu(raw: str) -> str:
+    """
+    메뉴 문자열을 정리합니다. (<br/>과 줄바꿈을 항목 구분으로, 항목별 공백 정리, 빈 항목 제거)
+    
+    Args:
+        raw (str): NEIS 요리명 (예: "현미밥<br/>양지 조랭이떡국 (1.5.6.16)")
+    
+    Returns:
+        str: 줄바꿈으로 구분된 메뉴
+    """
+    items = (_SPACES.sub(' ', item).strip() for item in _MENU_SEPARATOR.split(html.unescape(raw)))
+    return "\n".join(item for item in items if item)
+
+def normalize_date(raw: str) -> Optional[str]:
+    """"20250512", "2025-05-12", "2025.05.12" 형식 날짜를 YYYY-MM-DD로 바꿉니다."""
+    digits = _DATE_DIGITS.sub('', raw or '')
+    if len(digits) != 8:
+        return None
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+
+def _field(row: Dict, names: Tuple[str, ...]) -> str:
+    """후보 열 이름 중 값이 있는 첫 열의 값을 반환합니다."""
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ''):
+            return str(value).strip()
+    return ''
+
+def parse_row(row: Dict) -> Optional[Tuple[str, str, str, str]]:
+    """
+    NEIS 식단 행 하나를 (날짜, 식사 종류, 메뉴, 안내 문구)로 바꿉니다.
+    
+    Returns:
+        Optional[Tuple[str, str, str, str]]: 변환 결과 (날짜나 메뉴가 없으면 None)
+    """
+    date = normalize_date(_field(row, DATE_FIELDS))
+    menu = normalize_menu(_field(row, MENU_FIELDS))
+    if not date or not menu:
+        return None
+    
+    meal_type = _field(row, MEAL_NAME_FIELDS) or MEAL_TYPE_CODES.get(_field(row, MEAL_CODE_FIELDS), DEFAULT_MEAL_TYPE)
+    try:
+        display_text = format_meal_display(date, meal_type, menu)
+    except ValueError:
+        return None
+    return date, meal_type, menu, display_text
+
+def read_rows(path: str) -> Iterator[Dict]:
+    """
+    내보내기 파일의 식단 행을 하나씩 읽습니다.
+    
+    CSV는 한 줄씩 읽고, JSON은 NEIS Open API 응답({"mealServiceDietInfo": [..., {"row": [...]}]})이나
+    행 목록([{...}, ...])을 받습니다.
+    """
+    if path.lower().endswith('.csv'):
+        # 엑셀에서 저장한 CSV의 BOM 처리
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            yield from csv.DictReader(f)
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if isinstance(data, dict):
+        for section in data.get('mealServiceDietInfo', []):
+            yield from section.get('row', [])
+    else:
+        yield from data
+
+def ingest(paths: Iterable[str], db_path: Optional[str] = None, batch_size: int = 500) -> Dict[str, int]:
+    """
+    식단 파일들을 한 트랜잭션 안에서 묶음 단위 upsert로 적재합니다. (실패하면 전체 취소)
+    
+    Args:
+        paths (Iterable[str]): JSON/CSV 파일 경로 목록
+        db_path (Optional[str]): 학교 데이터 DB 경로 (None이면 SCHOOL_DB_PATH 또는 저장소 루트의 school_data.db)
+        batch_size (int): executemany 한 번에 넣을 행 수
+    
+    Returns:
+        Dict[str, int]: {"read": 읽은 행 수, "upserted": 적재한 행 수, "skipped": 건너뛴 행 수}
+    """
+    counts = {"read": 0, "upserted": 0, "skipped": 0}
+    
+    # 트랜잭션을 직접 관리 (DDL도 같은 트랜잭션에 포함)
+    conn = sqlite3.connect(db_path or default_db_path(), isolation_level=None)
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            ensure_schema(conn)
+            
+            batch: List[Tuple[str, str, str, str]] = []
+            for path in paths:
+                for row in read_rows(path):
+                    counts["read"] += 1
+                    parsed = parse_row(row)
+                    if parsed is None:
+                        counts["skipped"] += 1
+                        continue
+                    
+                    batch.append(parsed)
+                    if len(batch) >= batch_size:
+                        conn.executemany(UPSERT_SQL, batch)
+                        counts["upserted"] += len(batch)
+                        batch = []
+            
+            if batch:
+                conn.executemany(UPSERT_SQL, batch)
+                counts["upserted"] += len(batch)
+            
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.close()
+    
+    return counts
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="NEIS 급식 식단 파일 적재")
+    parser.add_argument("paths", nargs="+", help="NEIS 급식식단정보 JSON/CSV 파일")
+    parser.add_argument("--db", default=default_db_path(), help="학교 데이터 DB 경로")
+    parser.add_argument("--batch-size", type=int, default=500, help="executemany 한 번에 넣을 행 수")
+    args = parser.parse_args(argv)
+    
+    print("🍱 급식 식단 적재")
+    print("=" * 50)
+    
+    start = time.perf_counter()
+    try:
+        counts = ingest(args.paths, args.db, args.batch_size)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"❌ 급식 식단 적재 중 오류: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    
+    print(f"✅ {counts['upserted']}건 적재 (읽은 행 {counts['read']}건, 건너뜀 {counts['skipped']}건, {elapsed:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
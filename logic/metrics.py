@@ -0,0 +1,134 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+# 처리 단계별 소요 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 모든 지표 이름 앞에 붙는 접두어
+METRIC_PREFIX = "wasuk"
+
+class Histogram:
+    """고정 구간으로 값의 분포를 세는 히스토그램 클래스"""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # 구간별 개수 (마지막 칸은 가장 큰 구간보다 큰 값)
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        """값 하나를 기록합니다."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+class Metrics:
+    """단계별 소요 시간 히스토그램과 카운터를 모아 Prometheus 텍스트 형식으로 내보내는 클래스"""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, Histogram] = {}
+        # (지표 이름, 라벨 이름, 라벨 값) -> 값
+        self._counters: Dict[Tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, stage: str, seconds: float):
+        """
+        처리 단계의 소요 시간을 기록합니다.
+        
+        Args:
+            stage (str): 처리 단계 이름 (예: "intent", "qa_similar", "gpt")
+            seconds (float): 소요 시간 (초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+    
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 stage로 기록합니다. (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+    
+    def increment(self, name: str, label: str, value: str, amount: float = 1):
+        """
+        라벨이 하나인 카운터를 올립니다.
+        
+        Args:
+            name (str): 카운터 이름 (예: "requests_total")
+            label (str): 라벨 이름 (예: "intent")
+            value (str): 라벨 값 (예: "급식")
+            amount (float): 더할 값
+        """
+        key = (name, label, value)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def reset(self):
+        """기록된 값을 모두 지웁니다."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+    
+    def render(self, gauges: Dict[str, Dict] = None) -> str:
+        """
+        Prometheus 텍스트 형식으로 지표를 만듭니다.
+        
+        Args:
+            gauges (Dict[str, Dict]): 구성 요소 이름 -> stats() 결과 (숫자 값만 게이지로 출력)
+        
+        Returns:
+            str: Prometheus 텍스트 형식 지표
+        """
+        lines: List[str] = []
+        
+        with self._lock:
+            histograms = {stage: (list(h.counts), h.total, h.count) for stage, h in self._histograms.items()}
+            counters = dict(self._counters)
+        
+        name = f"{METRIC_PREFIX}_stage_duration_seconds"
+        lines.append(f"# HELP {name} 처리 단계별 소요 시간")
+        lines.append(f"# TYPE {name} histogram")
+        for stage in sorted(histograms):
+            counts, total, count = histograms[stage]
+            label = f'stage="{_escape(stage)}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{label}}} {total}")
+            lines.append(f"{name}_count{{{label}}} {count}")
+        
+        for counter in sorted({key[0] for key in counters}):
+            name = f"{METRIC_PREFIX}_{counter}"
+            lines.append(f"# TYPE {name} counter")
+            for (counter_name, label, value), amount in sorted(counters.items()):
+                if counter_name == counter:
+                    lines.append(f'{name}{{{label}="{_escape(value)}"}} {amount}')
+        
+        for component, stats in sorted((gauges or {}).items()):
+            for key, value in stats.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"{METRIC_PREFIX}_{component}_{key}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+        
+        return "\n".join(lines) + "\n"
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값에 쓸 수 있도록 이스케이프합니다."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# 프로세스 전체에서 공유하는 지표 저장소
+METRICS = Metrics()
\ No newline at end of file
@@ -0,0 +1,320 @@
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from .korean_text import KOREAN_STOP_WORDS, strip_particle
+from .metrics import METRICS
+from .school_db import ThreadLocalConnections, connect_readonly, default_db_path
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("notice")
+
+# 검색어에서 뺄 공지 질문 표현 (공지 제목에도 흔해서 순위에 도움이 되지 않음)
+NOTICE_STOP_WORDS = KOREAN_STOP_WORDS | {
+    "공지", "공지사항", "가정통신문", "통신문", "안내", "안내장", "알림", "소식", "학교", "와석초",
+    "최근", "최신", "새로운", "관련", "알려줘", "알려주세요", "보여줘", "있어", "있나요", "뭐야", "뭐예요"
+}
+
+# 열별 BM25 가중치 (제목, 본문, 태그)
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+# 트라이그램 색인으로 찾을 수 있는 최소 검색어 길이
+TRIGRAM_MIN_CHARS = 3
+
+class Notice(NamedTuple):
+    """검색된 공지사항 하나"""
+    title: str
+    url: Optional[str]
+    created_at: str
+    snippet: str
+    score: float
+
+class NoticeHandler:
+    """notices 테이블을 FTS5 트라이그램 색인으로 검색하는 공지사항 처리 클래스"""
+    
+    def __init__(self, db_path: Optional[str] = None, max_results: int = 3,
+                 recency_half_life: float = 365.0, candidates: int = 20):
+        self.db_path = db_path or default_db_path()
+        # 답변에 보여줄 최대 공지 수
+        self.max_results = max_results
+        # 최신성 가중치가 절반이 되는 공지 나이 (일)
+        self.recency_half_life = recency_half_life
+        # 최신성 가중치를 적용하기 전에 관련도로 먼저 뽑을 후보 수
+        self.candidates = candidates
+        # 색인이 다시 만들어질 때마다 증가
+        self.version = 0
+        
+        # 검색 색인 (스레드별 메모리 FTS5 연결 풀, FTS5 사용 여부, rowid -> (제목, URL, 게시일))
+        # FTS5를 쓸 수 없으면 notices 사본 테이블을 LIKE로 검색
+        # 재로드 시 새 색인을 만든 뒤 참조만 교체하므로 검색 중인 요청은 이전 색인을 끝까지 사용하고,
+        # 이전 풀의 연결은 참조가 없어지면 정리됨
+        self._index: Optional[Tuple[ThreadLocalConnections, bool, Dict[int, Tuple[str, Optional[str], str]]]] = None
+        
+        # DB 변경 감지용 연결과 마지막으로 확인한 상태
+        self._watch_conn: Optional[sqlite3.Connection] = None
+        self._mtime: Optional[float] = None
+        self._data_version: Optional[int] = None
+        self._reload_lock = threading.Lock()
+        
+        self._load_notices()
+    
+    def _load_notices(self):
+        """notices 테이블을 읽어 검색 색인을 만듭니다."""
+        with self._reload_lock:
+            try:
+                self._check_db_state()
+                self._swap_index(self._fetch_rows())
+            except Exception as e:
+                log_event(logger, "notice.load_error", level=logging.ERROR, error=str(e))
+    
+    def reload_if_changed(self) -> bool:
+        """
+        notices가 바뀌었으면 색인을 다시 만들어 교체합니다.
+        (백그라운드 재로드 스레드에서 호출)
+        
+        Returns:
+            bool: 색인이 교체되었으면 True
+        """
+        with self._reload_lock:
+            try:
+                if not self._check_db_state():
+                    return False
+                
+                self._swap_index(self._fetch_rows())
+                return True
+            
+            except FileNotFoundError:
+                return False
+            except Exception as e:
+                # 재로드에 실패하면 기존 색인을 계속 사용
+                log_event(logger, "notice.reload_error", level=logging.ERROR, error=str(e))
+                return False
+    
+    def _check_db_state(self) -> bool:
+        """DB 파일 mtime과 data_version을 확인해 변경되었으면 True를 반환합니다."""
+        mtime = os.stat(self.db_path).st_mtime
+        
+        if self._watch_conn is None or mtime != self._mtime:
+            # 파일이 교체되었을 수 있으므로 연결을 새로 연다
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+            self._watch_conn = connect_readonly(self.db_path)
+        
+        data_version = self._watch_conn.execute('PRAGMA data_version').fetchone()[0]
+        changed = (mtime, data_version) != (self._mtime, self._data_version)
+        self._mtime, self._data_version = mtime, data_version
+        return changed
+    
+    def _fetch_rows(self) -> List[tuple]:
+        """notices 테이블 전체를 읽습니다."""
+        cursor = self._watch_conn.execute(
+            'SELECT id, title, content, tags, url, created_at FROM notices ORDER BY id'
+        )
+        return cursor.fetchall()
+    
+    def _swap_index(self, rows: List[tuple]):
+        """
+        행 목록으로 메모리 검색 색인을 만들고 한 번에 교체합니다.
+        
+        연결 하나를 잠금으로 나눠 쓰면 검색이 한 줄로 서므로, 검색하는 스레드마다 같은 행으로
+        자기 메모리 색인을 만들어 씁니다. (공지는 수십 건이라 스레드당 한 번 만드는 비용이 작음)
+        """
+        index_rows = [(row_id, title or '', content or '', tags or '') for row_id, title, content, tags, _, _ in rows]
+        notices = {row_id: (title or '', url, created_at or '') for row_id, title, _, _, url, created_at in rows}
+        
+        # 지금 스레드에서 한 번 만들어 FTS5 사용 여부를 확인하고 그대로 풀에 넣음
+        first, fts = self._build_index(index_rows)
+        build = self._build_index
+        pool = ThreadLocalConnections(lambda: build(index_rows)[0])
+        pool.adopt(first)
+        
+        self._index = (pool, fts, notices)
+        self.version += 1
+    
+    @staticmethod
+    def _build_index(index_rows: List[tuple]) -> Tuple[sqlite3.Connection, bool]:
+        """(rowid, 제목, 본문, 태그) 목록으로 메모리 검색 색인 연결을 만듭니다."""
+        index = sqlite3.connect(':memory:', check_same_thread=False)
+        try:
+            index.execute(
+                "CREATE VIRTUAL TABLE notice_fts USING fts5(title, content, tags, tokenize='trigram')"
+            )
+            fts = True
+        except sqlite3.OperationalError:
+            # SQLite 3.34 미만이거나 FTS5 없이 빌드된 경우
+            index.execute("CREATE TABLE notice_fts (title TEXT, content TEXT, tags TEXT)")
+            fts = False
+        
+        with index:
+            index.executemany('INSERT INTO notice_fts (rowid, title, content, tags) VALUES (?, ?, ?, ?)', index_rows)
+        return index, fts
+    
+    def get_notice_info(self, user_input: str) -> str:
+        """
+        사용자 입력과 관련된 공지사항을 찾아 답변을 만듭니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+        
+        Returns:
+            str: 공지사항 안내 텍스트
+        """
+        terms = self._extract_terms(user_input)
+        notices = self.search(user_input) if terms else []
+        
+        if notices:
+            header = "📢 관련 공지사항입니다:"
+        else:
+            # 검색어가 없거나("최근 공지 알려줘") 찾지 못하면 최근 공지를 안내
+            notices = self.latest()
+            header = "📢 관련된 공지사항을 찾지 못해 최근 공지사항을 안내해 드려요:" if terms else "📢 최근 공지사항입니다:"
+        
+        if not notices:
+            return "죄송합니다. 현재 공지사항을 불러올 수 없습니다. 학교 홈페이지 공지사항을 확인해 주세요."
+        
+        return header + "\n\n" + "\n\n".join(self._format_notice(notice) for notice in notices)
+    
+    def search(self, query: str, k: Optional[int] = None) -> List[Notice]:
+        """
+        검색어와 관련된 공지사항을 관련도와 최신성으로 순위를 매겨 찾습니다.
+        
+        3글자 이상 검색어는 FTS5 트라이그램 색인의 BM25 점수로, 2글자 검색어는 부분 문자열 일치로 찾은 뒤
+        게시일이 오래될수록 점수를 줄입니다. (recency_half_life일마다 가중치 절반, 최소 0.5)
+        
+        Args:
+            query (str): 검색어 (사용자 입력)
+            k (Optional[int]): 반환할 최대 개수 (기본값 max_results)
+        
+        Returns:
+            List[Notice]: 점수 내림차순 공지사항 목록
+        """
+        k = self.max_results if k is None else k
+        terms = self._extract_terms(query)
+        if not terms or k <= 0:
+            return []
+        
+        index = self._index
+        if index is None:
+            return []
+        pool, fts, notices = index
+        
+        with METRICS.span("notice"):
+            hits = self._match(pool.get(), fts, terms)
+            
+            today = datetime.now()
+            ranked = []
+            for row_id, relevance, snippet in hits:
+                title, url, created_at = notices[row_id]
+                score = relevance * self._recency_weight(created_at, today)
+                ranked.append(Notice(title, url, created_at, snippet or title, score))
+        
+        # 점수가 같으면 최근 공지 먼저
+        ranked.sort(key=lambda notice: notice.created_at, reverse=True)
+        ranked.sort(key=lambda notice: -notice.score)
+        return ranked[:k]
+    
+    def latest(self, k: Optional[int] = None) -> List[Notice]:
+        """최근 공지사항을 게시일 순으로 반환합니다."""
+        k = self.max_results if k is None else k
+        index = self._index
+        if index is None:
+            return []
+        notices = index[2]
+        
+        recent = sorted(notices.values(), key=lambda notice: notice[2], reverse=True)[:k]
+        return [Notice(title, url, created_at, title, 0.0) for title, url, created_at in recent]
+    
+    def _match(self, index: sqlite3.Connection, fts: bool, terms: List[str]) -> List[Tuple[int, float, str]]:
+        """
+        현재 스레드의 색인 연결에서 검색어와 일치하는 후보를 찾아 관련도를 계산합니다.
+        
+        관련도 = (BM25 점수 + 작은 값) x (1 + 제목/본문에 포함된 검색어 수)
+        트라이그램 색인은 3글자 이상만 찾을 수 있으므로 2글자 검색어는 부분 문자열 일치로 후보를 더하고 개수에만 반영합니다.
+        """
+        long_terms = [term for term in terms if len(term) >= TRIGRAM_MIN_CHARS] if fts else []
+        short_terms = [term for term in terms if term not in long_terms]
+        
+        # rowid -> [BM25 점수, 조각]
+        candidates: Dict[int, List] = {}
+        
+        if long_terms:
+            match = " OR ".join('"{}"'.format(term.replace('"', '""')) for term in long_terms)
+            rows = index.execute(
+                "SELECT rowid, bm25(notice_fts, ?, ?, ?) AS rank, "
+                "snippet(notice_fts, 1, '', '', '…', 16) "
+                "FROM notice_fts WHERE notice_fts MATCH ? ORDER BY rank LIMIT ?",
+                (*BM25_WEIGHTS, match, self.candidates)
+            ).fetchall()
+            for row_id, rank, snippet in rows:
+                # bm25()는 관련도가 높을수록 작은(음수) 값
+                candidates[row_id] = [-rank, snippet]
+        
+        if short_terms:
+            conditions = " OR ".join(["title LIKE ? OR content LIKE ?"] * len(short_terms))
+            params = [f"%{term}%" for term in short_terms for _ in range(2)]
+            rows = index.execute(
+                f"SELECT rowid FROM notice_fts WHERE {conditions} LIMIT ?", (*params, self.candidates)
+            ).fetchall()
+            for (row_id,) in rows:
+                candidates.setdefault(row_id, [0.0, None])
+        
+        if not candidates:
+            return []
+        
+        placeholders = ",".join("?" * len(candidates))
+        rows = index.execute(
+            f"SELECT rowid, title, content FROM notice_fts WHERE rowid IN ({placeholders})",
+            list(candidates)
+        ).fetchall()
+        
+        hits = []
+        for row_id, title, content in rows:
+            bm25, snippet = candidates[row_id]
+            covered = sum(1 for term in terms if term in title or term in content)
+            relevance = (bm25 + 1e-3) * (1 + covered)
+            hits.append((row_id, relevance, snippet or self._make_snippet(content, terms)))
+        return hits
+    
+    def _extract_terms(self, text: str) -> List[str]:
+        """텍스트에서 불용어를 뺀 검색어를 추출합니다."""
+        terms = []
+        for word in re.findall(r'[가-힣a-zA-Z0-9]+', text.lower()):
+            stem = strip_particle(word)
+            # 조사를 떼면 트라이그램 색인으로 찾을 수 없을 만큼 짧아지는 경우(예: "만족도")는 원래 단어도 사용
+            candidates = (word, stem) if len(stem) < TRIGRAM_MIN_CHARS <= len(word) else (stem,)
+            for term in candidates:
+                if len(term) >= 2 and term not in NOTICE_STOP_WORDS and term not in terms:
+                    terms.append(term)
+        return terms
+    
+    def _recency_weight(self, created_at: str, today: datetime) -> float:
+        """게시일이 오래될수록 줄어드는 가중치 (0.5~1.0)를 계산합니다."""
+        try:
+            posted = datetime.strptime(created_at, "%Y.%m.%d")
+        except ValueError:
+            return 0.5
+        
+        age_days = max((today - posted).days, 0)
+        return 0.5 + 0.5 * 0.5 ** (age_days / self.recency_half_life)
+    
+    def _make_snippet(self, content: str, terms: List[str], width: int = 40) -> str:
+        """본문에서 검색어가 처음 나오는 곳 주변을 잘라 냅니다."""
+        if not content:
+            return ""
+        
+        positions = [content.find(term) for term in terms if term in content]
+        start = max(min(positions) - width // 4, 0) if positions else 0
+        snippet = content[start:start + width]
+        return ("…" if start > 0 else "") + snippet + ("…" if start + width < len(content) else "")
+    
+    def _format_notice(self, notice: Notice) -> str:
+        """공지사항 하나를 포맷팅합니다."""
+        lines = [f"📌 {notice.title} ({notice.created_at})"]
+        if notice.snippet and notice.snippet != notice.title:
+            lines.append(notice.snippet.replace("\n", " "))
+        if notice.url:
+            lines.append(f"🔗 {notice.url}")
+        return "\n".join(lines)
\ No newline at end of file
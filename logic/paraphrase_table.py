@@ -0,0 +1,177 @@
+"""
+QA 질문 바꿔 말하기 표 생성 도구
+
+qa_data의 각 질문에 대해 자주 쓰는 다른 말투(존댓말/반말, "~알려줘" 등)를 규칙으로 만들어
+{"원래 질문": ["바꿔 말한 표현", ...]} 형식의 JSON 파일로 저장합니다.
+QAHandler는 이 표의 표현도 정규화해 정확한 매칭 색인에 넣으므로, 흔한 표현은 TF-IDF 계산 없이 답합니다.
+
+사용법:
+    python -m logic.paraphrase_table [--db school_data.db] [--output qa_paraphrases.json] [--pairs reviewed_pairs.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+from .korean_text import normalize_question
+from .school_db import connect_readonly, default_db_path
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("qa")
+
+# 저장소 루트의 바꿔 말하기 표
+DEFAULT_PARAPHRASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'qa_paraphrases.json')
+
+def _has_final_consonant(text: str) -> bool:
+    """마지막 글자에 받침이 있는지 확인합니다."""
+    last = text[-1:] or ' '
+    return '가' <= last <= '힣' and (ord(last) - ord('가')) % 28 != 0
+
+def _copula_variants(stem: str) -> List[str]:
+    """"~인가요"로 끝나는 질문의 다른 말투 (받침에 따라 "이야"/"야")"""
+    if _has_final_consonant(stem):
+        return [stem + "이야", stem + "이에요", stem + "인지 알려줘", stem + "인지 알려주세요"]
+    return [stem + "야", stem + "예요", stem + "인지 알려줘", stem + "인지 알려주세요"]
+
+# 같은 뜻의 질문 끝 표현 묶음 (질문이 묶음의 한 표현으로 끝나면 나머지 표현으로 바꿔 씀)
+ENDING_GROUPS: List[Tuple[str, ...]] = [
+    ("있나요", "있어요", "있어", "있니", "있는지 알려줘", "있는지 알려주세요"),
+    ("되나요", "돼요", "돼", "되니", "되는지 알려줘", "되는지 알려주세요"),
+    ("하나요", "해요", "해", "하니", "하는지 알려줘", "하는지 알려주세요"),
+    ("싶어요", "싶어", "싶습니다", "싶은데요", "싶은데"),
+    ("끝나요", "끝나", "끝나나요", "끝나니", "끝나는지 알려줘")
+]
+
+# 끝 표현 -> 다른 말투를 만드는 함수 (긴 표현부터 확인)
+ENDING_RULES: List[Tuple[str, Callable[[str], List[str]]]] = sorted(
+    [("인가요", _copula_variants)] + [
+        (ending, lambda stem, group=group, ending=ending: [stem + other for other in group if other != ending])
+        for group in ENDING_GROUPS for ending in group
+    ],
+    key=lambda rule: -len(rule[0])
+)
+
+# 끝 표현이 없는 명사형 질문("학사일정", "보건실 연락처")에 붙일 표현
+NOUN_SUFFIXES = (" 알려줘", " 알려주세요", " 궁금해요")
+
+_TRAILING_PUNCTUATION = re.compile(r'[\s?!.~]+$')
+
+def paraphrase(question: str) -> List[str]:
+    """
+    질문 하나의 다른 말투를 규칙으로 만듭니다.
+    
+    Args:
+        question (str): 원래 질문
+    
+    Returns:
+        List[str]: 바꿔 말한 표현 목록
+    """
+    text = _TRAILING_PUNCTUATION.sub('', question.strip())
+    if not text:
+        return []
+    
+    for ending, make_variants in ENDING_RULES:
+        if text.endswith(ending):
+            return make_variants(text[:-len(ending)])
+    
+    # 물음표 없이 명사로 끝나는 질문만 "~알려줘" 형태를 붙임
+    if question.strip() == text and re.search(r'[가-힣]$', text):
+        return [text + suffix for suffix in NOUN_SUFFIXES]
+    return []
+
+def build_table(questions: List[str], pairs: Optional[List[Dict]] = None) -> Dict[str, List[str]]:
+    """
+    질문 목록으로 바꿔 말하기 표를 만듭니다.
+    
+    정규화한 결과가 원래 질문과 겹치거나 두 질문 이상에서 나온 표현은 어느 질문인지 모호하므로 뺍니다.
+    
+    Args:
+        questions (List[str]): qa_data 질문 목록
+        pairs (Optional[List[Dict]]): 검토한 (발화, 질문) 쌍 [{"utterance": ..., "question": ...}, ...]
+    
+    Returns:
+        Dict[str, List[str]]: 원래 질문 -> 바꿔 말한 표현 목록
+    """
+    candidates: Dict[str, List[str]] = {question: paraphrase(question) for question in questions}
+    for pair in pairs or []:
+        if pair.get("question") in candidates and pair.get("utterance"):
+            candidates[pair["question"]].append(pair["utterance"])
+    
+    question_keys = {normalize_question(question) for question in questions}
+    # 정규화한 표현 -> 그 표현이 나온 질문 수
+    owners = Counter(
+        key for question, phrases in candidates.items()
+        for key in {normalize_question(phrase) for phrase in phrases}
+    )
+    
+    table: Dict[str, List[str]] = {}
+    for question, phrases in candidates.items():
+        kept, seen = [], set()
+        for phrase in phrases:
+            key = normalize_question(phrase)
+            if not key or key in seen or key in question_keys or owners[key] > 1:
+                continue
+            seen.add(key)
+            kept.append(phrase)
+        if kept:
+            table[question] = kept
+    return table
+
+def load_paraphrases(path: str) -> Dict[str, List[str]]:
+    """
+    바꿔 말하기 표 파일을 읽습니다.
+    
+    Args:
+        path (str): JSON 파일 경로 ({"원래 질문": ["바꿔 말한 표현", ...]})
+    
+    Returns:
+        Dict[str, List[str]]: 원래 질문 -> 바꿔 말한 표현 목록 (읽을 수 없으면 빈 표)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+        return {str(question): [str(phrase) for phrase in phrases] for question, phrases in table.items()}
+    except Exception as e:
+        log_event(logger, "qa.paraphrase_load_error", level=logging.WARNING, error=str(e))
+        return {}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="QA 질문 바꿔 말하기 표 생성")
+    parser.add_argument("--db", default=default_db_path(), help="학교 데이터 DB 경로")
+    parser.add_argument("--output", default=DEFAULT_PARAPHRASE_PATH, help="저장할 JSON 파일")
+    parser.add_argument("--pairs", help="검토한 (발화, 질문) 쌍 JSON 파일 [{\"utterance\": ..., \"question\": ...}]")
+    args = parser.parse_args(argv)
+    
+    print("🔁 QA 바꿔 말하기 표 생성")
+    print("=" * 50)
+    
+    try:
+        conn = connect_readonly(args.db)
+        try:
+            questions = [row[0] for row in conn.execute('SELECT question FROM qa_data ORDER BY id')]
+        finally:
+            conn.close()
+        
+        pairs = None
+        if args.pairs:
+            with open(args.pairs, encoding="utf-8") as f:
+                pairs = json.load(f)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"❌ 바꿔 말하기 표 생성 중 오류: {e}")
+        return 1
+    
+    table = build_table(questions, pairs)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, indent=2)
+    
+    phrases = sum(len(values) for values in table.values())
+    print(f"✅ 질문 {len(table)}/{len(questions)}개, 표현 {phrases}개 -> {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
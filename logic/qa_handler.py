@@ -1,42 +1,183 @@
+import logging
+import os
 import sqlite3
 import re
-from typing import Optional, Dict, List
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+import threading
+from typing import Optional, Dict, List, Tuple
+from .korean_text import KOREAN_STOP_WORDS, normalize_question
+from .qa_index import QAIndex
+from .metrics import METRICS
+from .school_db import connect_readonly, default_db_path
+from .paraphrase_table import load_paraphrases
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("qa")
+
+# 분석기 모드별 유사도 매칭 기준값 (글자 n-그램은 공유 단어가 많아 점수가 높게 나옴)
+SIMILARITY_THRESHOLDS = {
+    "word": 0.3,
+    "char": 0.4
+}
 
 class QAHandler:
     """QA 데이터베이스 처리 클래스"""
     
-    def __init__(self, db_path: str = '../school_data.db'):
-        self.db_path = db_path
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words=None,
-            ngram_range=(1, 2)
-        )
-        self.qa_vectors = None
-        self.qa_data = []
+    def __init__(self, db_path: Optional[str] = None, analyzer: str = "word",
+                 index_dir: Optional[str] = None, paraphrase_path: Optional[str] = None):
+        self.db_path = db_path or default_db_path()
+        # "word": 단어 1~2그램, "char": 조사 제거 후 글자 n-그램
+        self.analyzer = analyzer
+        self.similarity_threshold = SIMILARITY_THRESHOLDS[analyzer]
+        self.max_features = 1000
+        # 학습된 색인 스냅샷 저장 위치 (None이면 저장하지 않음)
+        self.index_dir = index_dir
+        # 정확한 매칭에 더할 바꿔 말하기 표 ({"원래 질문": ["표현", ...]}, None이면 사용 안 함)
+        self.paraphrase_path = paraphrase_path
+        self._paraphrases: Dict[str, List[str]] = {}
+        self._paraphrase_mtime: Optional[float] = None
+        
+        # TF-IDF 단어장, 역색인, 키워드 색인을 묶은 검색 색인
+        # (재로드 시 새 색인을 완성한 뒤 참조만 교체하므로 조회 중인 요청은 이전 색인을 끝까지 사용)
+        self.index: Optional[QAIndex] = None
+        # 색인이 교체될 때마다 증가
+        self.version = 0
+        
+        # DB 변경 감지용 연결과 마지막으로 확인한 상태
+        self._watch_conn: Optional[sqlite3.Connection] = None
+        self._mtime: Optional[float] = None
+        self._data_version: Optional[int] = None
+        self._reload_lock = threading.Lock()
+        
         self._load_qa_data()
     
+    @property
+    def qa_data(self) -> List[tuple]:
+        """로드된 QA 행 목록 (question, answer, additional_answer, category)"""
+        index = self.index
+        return index.rows if index else []
+    
+    @property
+    def qa_vectors(self):
+        """질문 TF-IDF 행렬"""
+        index = self.index
+        return index.vectors if index else None
+    
     def _load_qa_data(self):
         """QA 데이터를 로드하고 벡터화합니다."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT question, answer, additional_answer, category FROM qa_data')
-            self.qa_data = cursor.fetchall()
-            conn.close()
-            
-            if self.qa_data:
-                # 질문들을 벡터화
-                questions = [qa[0] for qa in self.qa_data]
-                self.qa_vectors = self.vectorizer.fit_transform(questions)
+        with self._reload_lock:
+            try:
+                self._load_paraphrases()
+                self._check_db_state()
+                self._swap_index(self._fetch_rows())
+            except Exception as e:
+                log_event(logger, "qa.load_error", level=logging.ERROR, error=str(e))
+                self.index = None
+    
+    def reload_if_changed(self) -> bool:
+        """
+        qa_data나 바꿔 말하기 표가 바뀌었으면 색인을 다시 만들어 교체합니다.
+        (백그라운드 재로드 스레드에서 호출)
+        
+        Returns:
+            bool: 색인이 교체되었으면 True
+        """
+        with self._reload_lock:
+            try:
+                db_changed = self._check_db_state()
+                paraphrases_changed = self._load_paraphrases()
+                if not db_changed:
+                    return paraphrases_changed and self._apply_paraphrases()
                 
-        except Exception as e:
-            print(f"QA 데이터 로드 중 오류: {e}")
-            self.qa_data = []
-            self.qa_vectors = None
+                rows = self._fetch_rows()
+                index = self.index
+                if index is not None and index.key == QAIndex.content_key(rows, self.analyzer, self.max_features):
+                    # 다른 테이블만 바뀐 경우
+                    return paraphrases_changed and self._apply_paraphrases()
+                
+                self._swap_index(rows)
+                return True
+            
+            except FileNotFoundError:
+                return False
+            except Exception as e:
+                # 재로드에 실패하면 기존 색인을 계속 사용
+                log_event(logger, "qa.reload_error", level=logging.ERROR, error=str(e))
+                return False
+    
+    def _check_db_state(self) -> bool:
+        """DB 파일 mtime과 data_version을 확인해 변경되었으면 True를 반환합니다."""
+        mtime = os.stat(self.db_path).st_mtime
+        
+        if self._watch_conn is None or mtime != self._mtime:
+            # 파일이 교체되었을 수 있으므로 연결을 새로 연다
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+            self._watch_conn = connect_readonly(self.db_path)
+        
+        data_version = self._watch_conn.execute('PRAGMA data_version').fetchone()[0]
+        changed = (mtime, data_version) != (self._mtime, self._data_version)
+        self._mtime, self._data_version = mtime, data_version
+        return changed
+    
+    def _load_paraphrases(self) -> bool:
+        """바꿔 말하기 표 파일이 바뀌었으면 다시 읽고 True를 반환합니다. (호출 시 _reload_lock 보유)"""
+        if not self.paraphrase_path:
+            return False
+        
+        try:
+            mtime = os.stat(self.paraphrase_path).st_mtime
+        except OSError:
+            mtime = None
+        
+        if mtime == self._paraphrase_mtime:
+            return False
+        
+        self._paraphrase_mtime = mtime
+        self._paraphrases = load_paraphrases(self.paraphrase_path) if mtime is not None else {}
+        return True
+    
+    def _apply_paraphrases(self) -> bool:
+        """현재 색인의 정확한 매칭 색인만 새 바꿔 말하기 표로 교체합니다."""
+        index = self.index
+        if index is None:
+            return False
+        
+        index.set_paraphrases(self._paraphrases)
+        self.version += 1
+        return True
+    
+    def _fetch_rows(self) -> List[tuple]:
+        """qa_data 테이블 전체를 읽습니다."""
+        cursor = self._watch_conn.execute(
+            'SELECT question, answer, additional_answer, category FROM qa_data ORDER BY id'
+        )
+        return cursor.fetchall()
+    
+    def _swap_index(self, rows: List[tuple]):
+        """행 목록으로 색인을 만들고 한 번에 교체합니다."""
+        if not rows:
+            self.index = None
+            self.version += 1
+            return
+        
+        # qa_data 내용이 같으면 저장된 스냅샷을 재사용하고, 없을 때만 학습
+        index = None
+        if self.index_dir:
+            index = QAIndex.load(self.index_dir, rows, self.analyzer, self.max_features)
+        
+        if index is None:
+            index = QAIndex.build(rows, self.analyzer, self.max_features)
+            if self.index_dir:
+                try:
+                    os.makedirs(self.index_dir, exist_ok=True)
+                    index.save(self.index_dir)
+                except OSError as e:
+                    # 스냅샷을 저장하지 못해도 방금 만든 색인으로 계속 답함
+                    log_event(logger, "qa.snapshot_save_error", level=logging.WARNING, error=str(e))
+        
+        index.set_paraphrases(self._paraphrases)
+        self.index = index
+        self.version += 1
     
     def get_answer(self, user_input: str) -> str:
         """
@@ -51,87 +192,209 @@ class QAHandler:
         if not self.qa_data:
             return "죄송합니다. 현재 QA 데이터를 불러올 수 없습니다."
         
+        match, _ = self.find_match(user_input)
+        if match:
+            return self._format_answer(match)
+        
+        return "죄송합니다. 해당 질문에 대한 답변을 찾을 수 없습니다. 학교로 문의해 주세요."
+    
+    def find_match(self, user_input: str) -> Tuple[Optional[tuple], str]:
+        """
+        정확한 매칭 -> 유사도 -> 키워드 순서로 QA를 찾습니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+        
+        Returns:
+            Tuple[Optional[tuple], str]: (QA 행, 매칭 단계) - 단계는 "exact", "similar", "keyword", "none"
+        """
+        # 재로드로 색인이 바뀌어도 세 단계 모두 같은 색인을 사용
+        index = self.index
+        
         # 1. 정확한 매칭 시도
-        exact_match = self._find_exact_match(user_input)
+        with METRICS.span("qa_exact"):
+            exact_match = self._find_exact_match(user_input, index)
         if exact_match:
-            return self._format_answer(exact_match)
+            METRICS.increment("qa_matches_total", "stage", "exact")
+            return exact_match, "exact"
         
         # 2. 유사도 기반 검색
-        similar_match = self._find_similar_match(user_input)
+        with METRICS.span("qa_similar"):
+            similar_match = self._find_similar_match(user_input, index=index)
         if similar_match:
-            return self._format_answer(similar_match)
+            METRICS.increment("qa_matches_total", "stage", "similar")
+            return similar_match, "similar"
         
         # 3. 키워드 기반 검색
-        keyword_match = self._find_keyword_match(user_input)
+        with METRICS.span("qa_keyword"):
+            keyword_match = self._find_keyword_match(user_input, index)
         if keyword_match:
-            return self._format_answer(keyword_match)
+            METRICS.increment("qa_matches_total", "stage", "keyword")
+            return keyword_match, "keyword"
         
-        return "죄송합니다. 해당 질문에 대한 답변을 찾을 수 없습니다. 학교로 문의해 주세요."
+        METRICS.increment("qa_matches_total", "stage", "none")
+        return None, "none"
     
-    def _find_exact_match(self, user_input: str) -> Optional[tuple]:
-        """정확한 매칭을 찾습니다."""
-        user_input = user_input.lower().strip()
+    def get_answers(self, user_inputs: List[str]) -> List[str]:
+        """
+        여러 입력에 대한 답변을 한 번에 찾습니다. (get_answer와 같은 결과)
         
-        for qa in self.qa_data:
-            question = qa[0].lower().strip()
-            if user_input == question:
-                return qa
+        Args:
+            user_inputs (List[str]): 사용자 입력 메시지 목록
         
-        return None
+        Returns:
+            List[str]: 입력 순서대로의 답변 텍스트 목록
+        """
+        if not self.qa_data:
+            return ["죄송합니다. 현재 QA 데이터를 불러올 수 없습니다."] * len(user_inputs)
+        
+        return [
+            self._format_answer(match) if match
+            else "죄송합니다. 해당 질문에 대한 답변을 찾을 수 없습니다. 학교로 문의해 주세요."
+            for match, _ in self.find_matches(user_inputs)
+        ]
     
-    def _find_similar_match(self, user_input: str, threshold: float = 0.3) -> Optional[tuple]:
-        """유사도 기반 매칭을 찾습니다."""
-        if self.qa_vectors is None:
+    def find_matches(self, user_inputs: List[str]) -> List[Tuple[Optional[tuple], str]]:
+        """
+        여러 입력의 QA를 한 번에 찾습니다. (find_match와 같은 순서로 매칭)
+        
+        정확한 매칭이 안 된 입력들은 한 번의 TF-IDF 변환과 희소 행렬 곱으로 유사도를 계산합니다.
+        
+        Args:
+            user_inputs (List[str]): 사용자 입력 메시지 목록
+        
+        Returns:
+            List[Tuple[Optional[tuple], str]]: 입력 순서대로의 (QA 행, 매칭 단계) 목록
+        """
+        results: List[Tuple[Optional[tuple], str]] = [(None, "none")] * len(user_inputs)
+        # 재로드로 색인이 바뀌어도 배치 전체에 같은 색인을 사용
+        index = self.index
+        if index is None:
+            return results
+        
+        # 1. 정확한 매칭 시도
+        pending = []
+        with METRICS.span("qa_exact"):
+            for i, user_input in enumerate(user_inputs):
+                exact_match = self._find_exact_match(user_input, index)
+                if exact_match:
+                    results[i] = (exact_match, "exact")
+                else:
+                    pending.append(i)
+        
+        # 2. 유사도 기반 검색 (남은 입력 전체를 한 번에 변환하고 점수 계산)
+        if pending:
+            with METRICS.span("qa_similar"):
+                try:
+                    vectors = index.transform([user_inputs[i] for i in pending])
+                    hits = index.retriever.search_batch(vectors, k=1)
+                except Exception as e:
+                    log_event(logger, "qa.similarity_error", level=logging.ERROR, error=str(e))
+                    hits = [[] for _ in pending]
+            
+            remaining = []
+            for i, top in zip(pending, hits):
+                if top and top[0][1] >= self.similarity_threshold:
+                    results[i] = (index.rows[top[0][0]], "similar")
+                else:
+                    remaining.append(i)
+            pending = remaining
+        
+        # 3. 키워드 기반 검색
+        with METRICS.span("qa_keyword"):
+            for i in pending:
+                keyword_match = self._find_keyword_match(user_inputs[i], index)
+                if keyword_match:
+                    results[i] = (keyword_match, "keyword")
+        
+        for _, stage in results:
+            METRICS.increment("qa_matches_total", "stage", stage)
+        return results
+    
+    def _find_exact_match(self, user_input: str, index: Optional[QAIndex] = None) -> Optional[tuple]:
+        """
+        정확한 매칭을 찾습니다.
+        
+        띄어쓰기, 문장부호, 조사 차이를 무시하도록 정규화한 뒤 질문(과 바꿔 말하기 표)의
+        해시 색인에서 한 번에 찾으므로 QA 수와 관계없이 일정한 시간이 걸립니다.
+        """
+        index = index or self.index
+        if index is None:
             return None
         
+        key = normalize_question(user_input)
+        return index.exact.get(key) if key else None
+    
+    def _find_similar_match(self, user_input: str, threshold: Optional[float] = None,
+                            index: Optional[QAIndex] = None) -> Optional[tuple]:
+        """유사도 기반 매칭을 찾습니다."""
+        if threshold is None:
+            threshold = self.similarity_threshold
+        
+        hits = self.search(user_input, k=1, index=index)
+        
+        if hits and hits[0][1] >= threshold:
+            return hits[0][0]
+        
+        return None
+    
+    def search(self, user_input: str, k: int = 5, index: Optional[QAIndex] = None) -> List[Tuple[tuple, float]]:
+        """
+        역색인으로 입력과 유사한 QA 상위 k개를 찾습니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+            k (int): 반환할 최대 개수
+            index (Optional[QAIndex]): 사용할 색인 (None이면 현재 색인)
+        
+        Returns:
+            List[Tuple[tuple, float]]: (QA 행, 코사인 유사도) 목록 (유사도 내림차순)
+        """
+        index = index or self.index
+        if index is None:
+            return []
+        
         try:
             # 사용자 입력을 벡터화
-            user_vector = self.vectorizer.transform([user_input])
+            user_vector = index.transform([user_input])
             
-            # 유사도 계산
-            similarities = cosine_similarity(user_vector, self.qa_vectors).flatten()
-            
-            # 가장 유사한 답변 찾기
-            best_idx = np.argmax(similarities)
-            best_similarity = similarities[best_idx]
-            
-            if best_similarity >= threshold:
-                return self.qa_data[best_idx]
+            # 입력과 단어를 공유하는 질문만 점수 계산
+            hits = index.retriever.search(user_vector, k)
+            return [(index.rows[idx], score) for idx, score in hits]
             
         except Exception as e:
-            print(f"유사도 계산 중 오류: {e}")
+            log_event(logger, "qa.similarity_error", level=logging.ERROR, error=str(e))
         
-        return None
+        return []
     
-    def _find_keyword_match(self, user_input: str) -> Optional[tuple]:
-        """키워드 기반 매칭을 찾습니다."""
+    def _find_keyword_match(self, user_input: str, index: Optional[QAIndex] = None) -> Optional[tuple]:
+        """키워드 기반 매칭을 찾습니다. (index가 None이면 현재 색인 사용)"""
         user_input = user_input.lower().strip()
         
         # 사용자 입력에서 키워드 추출
         keywords = self._extract_keywords(user_input)
         
-        best_match = None
-        best_score = 0
+        index = index or self.index
+        if index is None:
+            return None
         
-        for qa in self.qa_data:
-            question = qa[0].lower()
-            answer = qa[1].lower()
+        # 키워드를 포함하는 질문/답변만 색인에서 찾아 점수 계산
+        scores: Dict[int, int] = {}
+        for keyword in keywords:
+            for idx in index.question_index.find(keyword):
+                scores[idx] = scores.get(idx, 0) + 2  # 질문에 키워드가 있으면 높은 점수
+            for idx in index.answer_index.find(keyword):
+                scores[idx] = scores.get(idx, 0) + 1  # 답변에 키워드가 있으면 낮은 점수
             
-            # 키워드 매칭 점수 계산
-            score = 0
-            for keyword in keywords:
-                if keyword in question:
-                    score += 2  # 질문에 키워드가 있으면 높은 점수
-                if keyword in answer:
-                    score += 1  # 답변에 키워드가 있으면 낮은 점수
+        if not scores:
+            return None
             
-            if score > best_score:
-                best_score = score
-                best_match = qa
+        # 동점이면 먼저 등록된 QA 선택
+        best_idx = min(scores, key=lambda idx: (-scores[idx], idx))
         
         # 최소 점수 이상일 때만 반환
-        if best_score >= 2:
-            return best_match
+        if scores[best_idx] >= 2:
+            return index.rows[best_idx]
         
         return None
     
@@ -144,8 +407,7 @@ class QAHandler:
         keywords = [kw for kw in keywords if len(kw) >= 2]
         
         # 불용어 제거
-        stop_words = {'이', '가', '을', '를', '은', '는', '에', '에서', '로', '으로', '와', '과', '도', '만', '의', '것', '수', '등', '등등'}
-        keywords = [kw for kw in keywords if kw not in stop_words]
+        keywords = [kw for kw in keywords if kw not in KOREAN_STOP_WORDS]
         
         return keywords
     
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Dict, List, Optional
+import numpy as np
+from scipy import sparse
+from .korean_text import get_analyzer, normalize_question
+from .retrieval import InvertedIndex, SubstringIndex
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("qa")
+
+# 스냅샷 파일 형식이 바뀌면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_FORMAT_VERSION = 1
+
+# 보관할 스냅샷 최대 개수 (다른 워커가 아직 사용 중일 수 있어 바로 지우지 않음)
+MAX_SNAPSHOTS = 3
+
+class QAIndex:
+    """학습된 TF-IDF 단어장, IDF 가중치, 역색인을 묶은 QA 검색 색인 클래스"""
+    
+    def __init__(self, rows: List[tuple], analyzer: str, vocabulary: Dict[str, int],
+                 idf: np.ndarray, postings: InvertedIndex, key: str):
+        self.rows = rows
+        self.analyzer = analyzer
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.retriever = postings
+        self.key = key
+        self._analyze = get_analyzer(analyzer)
+        
+        # 키워드 검색용 색인
+        self.question_index = SubstringIndex([qa[0].lower() for qa in rows])
+        self.answer_index = SubstringIndex([qa[1].lower() for qa in rows])
+        
+        # 정규화한 질문(과 바꿔 말한 표현) -> QA 행 (정확한 매칭용 해시 색인)
+        self.exact: Dict[str, tuple] = self._build_exact({})
+    
+    def set_paraphrases(self, paraphrases: Dict[str, List[str]]):
+        """바꿔 말하기 표를 반영한 정확한 매칭 색인을 만들어 교체합니다."""
+        self.exact = self._build_exact(paraphrases)
+    
+    def _build_exact(self, paraphrases: Dict[str, List[str]]) -> Dict[str, tuple]:
+        """질문과 바꿔 말한 표현을 정규화해 QA 행으로 찾는 사전을 만듭니다. (원래 질문, 앞쪽 행 우선)"""
+        exact: Dict[str, tuple] = {}
+        for qa in self.rows:
+            key = normalize_question(qa[0])
+            if key:
+                exact.setdefault(key, qa)
+        
+        for qa in self.rows:
+            for phrase in paraphrases.get(qa[0], ()):
+                key = normalize_question(phrase)
+                if key:
+                    exact.setdefault(key, qa)
+        return exact
+    
+    @staticmethod
+    def content_key(rows: List[tuple], analyzer: str, max_features: int) -> str:
+        """qa_data 내용과 색인 설정으로 스냅샷 키(해시)를 만듭니다."""
+        payload = json.dumps(
+            [SNAPSHOT_FORMAT_VERSION, analyzer, max_features, rows],
+            ensure_ascii=False
+        )
+        return f"{analyzer}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+    
+    @classmethod
+    def build(cls, rows: List[tuple], analyzer: str, max_features: int) -> "QAIndex":
+        """질문들로 TF-IDF를 학습해 색인을 만듭니다."""
+        # sklearn은 학습할 때만 필요하므로 여기서 가져옴
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        vectorizer = TfidfVectorizer(
+            max_features=max_features,
+            analyzer=get_analyzer(analyzer)
+        )
+        vectors = vectorizer.fit_transform([qa[0] for qa in rows])
+        
+        vocabulary = {term: int(idx) for term, idx in vectorizer.vocabulary_.items()}
+        key = cls.content_key(rows, analyzer, max_features)
+        return cls(rows, analyzer, vocabulary, vectorizer.idf_, InvertedIndex.from_matrix(vectors), key)
+    
+    @classmethod
+    def load(cls, snapshot_dir: str, rows: List[tuple], analyzer: str,
+             max_features: int) -> Optional["QAIndex"]:
+        """
+        저장된 스냅샷이 있으면 메모리 매핑으로 불러옵니다.
+        
+        Args:
+            snapshot_dir (str): 스냅샷 상위 디렉터리
+            rows (List[tuple]): 현재 qa_data 행 목록
+            analyzer (str): 분석기 모드
+            max_features (int): 최대 단어 수
+        
+        Returns:
+            Optional[QAIndex]: 스냅샷이 없거나 손상되었으면 None
+        """
+        key = cls.content_key(rows, analyzer, max_features)
+        path = os.path.join(snapshot_dir, key)
+        if not os.path.isdir(path):
+            return None
+        
+        try:
+            with open(os.path.join(path, "vocabulary.json"), encoding="utf-8") as f:
+                terms = json.load(f)
+            
+            # 여러 워커가 같은 페이지를 공유하도록 읽기 전용 메모리 매핑
+            idf = np.load(os.path.join(path, "idf.npy"), mmap_mode="r")
+            indptr = np.load(os.path.join(path, "indptr.npy"), mmap_mode="r")
+            docs = np.load(os.path.join(path, "docs.npy"), mmap_mode="r")
+            weights = np.load(os.path.join(path, "weights.npy"), mmap_mode="r")
+            
+            if len(terms) != len(idf) or len(indptr) != len(terms) + 1:
+                raise ValueError("스냅샷 배열 크기가 맞지 않습니다.")
+            
+            postings = InvertedIndex(indptr, docs, weights, len(rows))
+        except Exception as e:
+            log_event(logger, "qa.snapshot_load_error", level=logging.WARNING, error=str(e))
+            return None
+        
+        vocabulary = {term: idx for idx, term in enumerate(terms)}
+        return cls(rows, analyzer, vocabulary, idf, postings, key)
+    
+    def save(self, snapshot_dir: str):
+        """색인을 스냅샷 디렉터리에 원자적으로 저장합니다."""
+        path = os.path.join(snapshot_dir, self.key)
+        if os.path.isdir(path):
+            return
+        
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        try:
+            os.makedirs(tmp_path, exist_ok=True)
+            
+            terms = [None] * len(self.vocabulary)
+            for term, idx in self.vocabulary.items():
+                terms[idx] = term
+            with open(os.path.join(tmp_path, "vocabulary.json"), "w", encoding="utf-8") as f:
+                json.dump(terms, f, ensure_ascii=False)
+            
+            indptr, docs, weights = self.retriever.arrays()
+            np.save(os.path.join(tmp_path, "idf.npy"), np.asarray(self.idf, dtype=np.float64))
+            np.save(os.path.join(tmp_path, "indptr.npy"), np.asarray(indptr, dtype=np.int32))
+            np.save(os.path.join(tmp_path, "docs.npy"), np.asarray(docs, dtype=np.int32))
+            np.save(os.path.join(tmp_path, "weights.npy"), np.asarray(weights, dtype=np.float64))
+            
+            # 다른 워커가 먼저 저장했으면 rename이 실패하므로 임시 디렉터리만 정리
+            os.rename(tmp_path, path)
+        except OSError as e:
+            if not os.path.isdir(path):
+                log_event(logger, "qa.snapshot_save_error", level=logging.WARNING, error=str(e))
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        
+        self._prune(snapshot_dir)
+    
+    def _prune(self, snapshot_dir: str):
+        """오래된 스냅샷을 정리합니다."""
+        try:
+            snapshots = [
+                os.path.join(snapshot_dir, name) for name in os.listdir(snapshot_dir)
+                if name.startswith(f"{self.analyzer}-") and ".tmp-" not in name
+            ]
+            snapshots.sort(key=os.path.getmtime, reverse=True)
+            for path in snapshots[MAX_SNAPSHOTS:]:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+    
+    @property
+    def vectors(self):
+        """질문 TF-IDF 행렬 (질문 수 x 단어 수)"""
+        indptr, docs, weights = self.retriever.arrays()
+        term_doc = sparse.csr_matrix(
+            (weights, docs, indptr),
+            shape=(len(self.vocabulary), len(self.rows)),
+            copy=False
+        )
+        return term_doc.T
+    
+    def transform(self, texts: List[str]):
+        """
+        학습된 단어장과 IDF로 텍스트를 L2 정규화된 TF-IDF 벡터로 변환합니다.
+        (TfidfVectorizer.transform과 같은 결과이며 sklearn 없이 동작)
+        
+        Args:
+            texts (List[str]): 변환할 텍스트 목록
+        
+        Returns:
+            csr_matrix: 텍스트 수 x 단어 수 희소 행렬
+        """
+        vocabulary = self.vocabulary
+        indptr = [0]
+        indices: List[int] = []
+        values: List[float] = []
+        
+        for text in texts:
+            counts: Dict[int, int] = {}
+            for term in self._analyze(text):
+                idx = vocabulary.get(term)
+                if idx is not None:
+                    counts[idx] = counts.get(idx, 0) + 1
+            
+            if counts:
+                cols = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+                tfidf = np.fromiter(counts.values(), dtype=np.float64, count=len(counts)) * self.idf[cols]
+                tfidf /= np.sqrt(np.dot(tfidf, tfidf))
+                indices.extend(cols.tolist())
+                values.extend(tfidf.tolist())
+            
+            indptr.append(len(indices))
+        
+        matrix = sparse.csr_matrix(
+            (np.array(values, dtype=np.float64), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int32)),
+            shape=(len(texts), len(vocabulary))
+        )
+        matrix.sort_indices()
+        return matrix
\ No newline at end of file
@@ -0,0 +1,57 @@
+import logging
+import threading
+from typing import List
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("reload")
+
+class Reloader:
+    """등록된 모듈의 reload_if_changed()를 주기적으로 호출하는 백그라운드 재로드 클래스"""
+    
+    def __init__(self, interval: float = 30.0):
+        # 변경 확인 주기 (초)
+        self.interval = interval
+        self._components: List = []
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def register(self, component):
+        """reload_if_changed() 메서드를 가진 모듈을 등록합니다."""
+        self._components.append(component)
+    
+    def start(self):
+        """재로드 스레드를 시작합니다. (요청 처리 스레드와 별도로 색인을 다시 만듦)"""
+        if self._thread is not None or self.interval <= 0:
+            return
+        
+        self._thread = threading.Thread(target=self._run, name="wasuk-reloader", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """재로드 스레드를 멈춥니다."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def reload_now(self) -> int:
+        """
+        등록된 모든 모듈의 변경 여부를 즉시 확인합니다.
+        
+        Returns:
+            int: 다시 로드된 모듈 수
+        """
+        reloaded = 0
+        for component in self._components:
+            try:
+                if component.reload_if_changed():
+                    reloaded += 1
+                    log_event(logger, "reload.done", component=type(component).__name__)
+            except Exception as e:
+                log_event(logger, "reload.error", level=logging.ERROR, component=type(component).__name__, error=str(e))
+        return reloaded
+    
+    def _run(self):
+        """재로드 주기마다 변경 여부를 확인합니다."""
+        while not self._stop_event.wait(self.interval):
+            self.reload_now()
\ No newline at end of file
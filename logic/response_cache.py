@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class ResponseCache:
+    """크기 제한(LRU)과 만료 시간(TTL)을 가진 응답 캐시 클래스"""
+    
+    def __init__(self, max_size: int = 1024, ttl: float = 600.0):
+        self.max_size = max_size
+        # 기본 만료 시간 (초)
+        self.ttl = ttl
+        
+        # 키 -> (만료 시각, 값), 최근 사용한 항목이 뒤쪽
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시된 값을 조회합니다.
+        
+        Args:
+            key (Hashable): 캐시 키
+        
+        Returns:
+            Optional[Any]: 캐시된 값 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        """
+        값을 캐시에 저장합니다.
+        
+        Args:
+            key (Hashable): 캐시 키
+            value (Any): 저장할 값
+            expires_at (Optional[float]): 만료 시각 (epoch 초, 기본 TTL보다 이르면 우선)
+        """
+        if self.max_size <= 0:
+            return
+        
+        default_expiry = time.time() + self.ttl
+        if expires_at is None or expires_at > default_expiry:
+            expires_at = default_expiry
+        
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            
+            # 가장 오래 사용하지 않은 항목부터 제거
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0
+            }
\ No newline at end of file
@@ -0,0 +1,147 @@
+from typing import Dict, List, Set, Tuple
+import numpy as np
+from scipy import sparse
+
+class InvertedIndex:
+    """TF-IDF 행렬 위의 역색인 (질의와 단어를 공유하는 문서만 점수 계산)"""
+    
+    def __init__(self, indptr, docs, weights, num_docs: int):
+        # 단어 j의 포스팅: docs[indptr[j]:indptr[j + 1]] (가중치는 weights)
+        self.num_docs = num_docs
+        self._indptr = indptr
+        self._docs = docs
+        self._weights = weights
+    
+    @classmethod
+    def from_matrix(cls, doc_vectors) -> "InvertedIndex":
+        """문서 x 단어 행렬로 역색인을 만듭니다."""
+        # 열(단어) 단위로 문서 목록을 꺼내기 위해 CSC로 변환
+        postings = sparse.csc_matrix(doc_vectors)
+        postings.sort_indices()
+        
+        return cls(postings.indptr, postings.indices, postings.data, postings.shape[0])
+    
+    def arrays(self) -> Tuple:
+        """(indptr, docs, weights) 배열을 반환합니다."""
+        return self._indptr, self._docs, self._weights
+    
+    def search(self, query_vector, k: int = 5) -> List[Tuple[int, float]]:
+        """
+        질의 벡터와 내적이 큰 상위 k개 문서를 찾습니다.
+        
+        문서와 질의 벡터가 모두 L2 정규화되어 있으므로 내적은 코사인 유사도와 같습니다.
+        
+        Args:
+            query_vector: 1 x 단어 수 희소 벡터
+            k (int): 반환할 최대 문서 수
+        
+        Returns:
+            List[Tuple[int, float]]: (문서 번호, 점수) 목록 (점수 내림차순, 동점이면 문서 번호순)
+        """
+        query = sparse.csr_matrix(query_vector)
+        terms = query.indices
+        if k <= 0 or len(terms) == 0:
+            return []
+        
+        # 질의 단어들의 포스팅 리스트만 모아서 점수 누적
+        starts = self._indptr[terms]
+        ends = self._indptr[terms + 1]
+        docs = np.concatenate([self._docs[s:e] for s, e in zip(starts, ends)])
+        if len(docs) == 0:
+            return []
+        weights = np.concatenate([
+            self._weights[s:e] * w for s, e, w in zip(starts, ends, query.data)
+        ])
+        
+        doc_ids, inverse = np.unique(docs, return_inverse=True)
+        scores = np.bincount(inverse, weights=weights)
+        
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+            doc_ids, scores = doc_ids[top], scores[top]
+        
+        order = np.lexsort((doc_ids, -scores))
+        return [(int(doc_ids[i]), float(scores[i])) for i in order]
+    
+    def search_batch(self, query_matrix, k: int = 5) -> List[List[Tuple[int, float]]]:
+        """
+        여러 질의 벡터를 한 번의 희소 행렬 곱으로 점수 계산해 질의별 상위 k개 문서를 찾습니다.
+        
+        Args:
+            query_matrix: 질의 수 x 단어 수 희소 행렬
+            k (int): 질의마다 반환할 최대 문서 수
+        
+        Returns:
+            List[List[Tuple[int, float]]]: 질의별 (문서 번호, 점수) 목록 (search()와 같은 순서)
+        """
+        queries = sparse.csr_matrix(query_matrix)
+        if k <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        
+        # 포스팅 배열은 그대로 단어 x 문서 CSR 행렬이 됨
+        term_doc = sparse.csr_matrix(
+            (self._weights, self._docs, self._indptr),
+            shape=(len(self._indptr) - 1, self.num_docs),
+            copy=False
+        )
+        scores = (queries @ term_doc).tocsr()
+        
+        results = []
+        for row in range(scores.shape[0]):
+            start, end = scores.indptr[row], scores.indptr[row + 1]
+            doc_ids, row_scores = scores.indices[start:end], scores.data[start:end]
+            
+            if k < len(row_scores):
+                top = np.argpartition(-row_scores, k - 1)[:k]
+                doc_ids, row_scores = doc_ids[top], row_scores[top]
+            
+            order = np.lexsort((doc_ids, -row_scores))
+            results.append([(int(doc_ids[i]), float(row_scores[i])) for i in order])
+        
+        return results
+
+class SubstringIndex:
+    """글자 바이그램 역색인을 이용한 부분 문자열 검색 클래스"""
+    
+    def __init__(self, texts: List[str]):
+        self._texts = texts
+        self._postings: Dict[str, Set[int]] = {}
+        
+        for doc_id, text in enumerate(texts):
+            for gram in self._bigrams(text):
+                self._postings.setdefault(gram, set()).add(doc_id)
+    
+    def _bigrams(self, text: str) -> Set[str]:
+        """텍스트의 글자 바이그램 집합을 만듭니다."""
+        return {text[i:i + 2] for i in range(len(text) - 1)}
+    
+    def find(self, keyword: str) -> List[int]:
+        """
+        키워드를 부분 문자열로 포함하는 문서 번호를 찾습니다.
+        
+        Args:
+            keyword (str): 찾을 키워드
+        
+        Returns:
+            List[int]: 문서 번호 목록 (오름차순)
+        """
+        if len(keyword) < 2:
+            # 바이그램을 만들 수 없는 한 글자는 전체 확인
+            return [i for i, text in enumerate(self._texts) if keyword in text]
+        
+        # 모든 바이그램을 포함하는 후보만 남긴 뒤 실제 포함 여부 확인
+        postings = []
+        for gram in self._bigrams(keyword):
+            docs = self._postings.get(gram)
+            if not docs:
+                return []
+            postings.append(docs)
+        
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for docs in postings[1:]:
+            candidates &= docs
+            if not candidates:
+                return []
+        
+        return sorted(i for i in candidates if keyword in self._texts[i])
\ No newline at end of file
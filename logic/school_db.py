@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Callable, Optional
+from urllib.parse import quote
+
+# 저장소 루트의 학교 데이터 DB (실행 위치와 관계없이 같은 파일을 사용)
+PACKAGE_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'school_data.db')
+
+# 읽기 전용 연결 설정 (메모리 매핑 크기, 연결별로 재사용할 컴파일된 쿼리 수)
+MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 64 * 1024 * 1024))
+CACHED_STATEMENTS = 256
+
+def default_db_path() -> str:
+    """학교 데이터 DB 경로를 반환합니다. (SCHOOL_DB_PATH가 없으면 저장소 루트의 school_data.db)"""
+    return os.environ.get('SCHOOL_DB_PATH') or PACKAGE_DB_PATH
+
+def data_path(name: str) -> str:
+    """학교 데이터 DB와 같은 디렉터리에 둘 파일(색인 스냅샷, 캐시, 대화 기록)의 경로를 반환합니다."""
+    return os.path.join(os.path.dirname(os.path.abspath(default_db_path())), name)
+
+def connect_readonly(db_path: str, immutable: Optional[bool] = None) -> sqlite3.Connection:
+    """
+    학교 데이터 DB를 읽기 전용으로 엽니다.
+    
+    mode=ro라 파일이 없으면 빈 DB를 만들지 않고 오류가 나며, 쓰기 잠금을 잡지 않습니다.
+    immutable이면 SQLite가 파일 잠금과 변경 확인을 건너뜁니다. (배포 때 파일을 통째로 교체하는 경우에만 사용,
+    제자리에서 고치는 DB는 data_version 변경을 감지하지 못함)
+    
+    Args:
+        db_path (str): DB 파일 경로
+        immutable (Optional[bool]): immutable로 열지 여부 (None이면 SCHOOL_DB_IMMUTABLE 환경 변수)
+    
+    Returns:
+        sqlite3.Connection: 여러 스레드에서 넘겨 써도 되는 읽기 전용 연결
+    """
+    if immutable is None:
+        immutable = os.environ.get('SCHOOL_DB_IMMUTABLE', '0') == '1'
+    
+    uri = f"file:{quote(os.path.abspath(db_path))}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+    try:
+        conn.execute(f'PRAGMA mmap_size = {MMAP_SIZE}')
+        conn.execute('PRAGMA query_only = 1')
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+class ThreadLocalConnections:
+    """
+    스레드마다 연결을 하나씩 만들어 재사용하는 연결 풀 클래스
+    
+    SQLite 연결 하나를 여러 스레드가 잠금으로 나눠 쓰면 조회가 한 줄로 서므로,
+    스레드별 연결로 동시에 조회합니다. 연결은 threading.local에 두므로 스레드가 끝나거나
+    풀을 버리면(참조가 없어지면) 그 연결도 함께 닫힙니다.
+    """
+    
+    def __init__(self, factory: Callable[[], sqlite3.Connection]):
+        # 새 연결을 만드는 함수
+        self.factory = factory
+        self._local = threading.local()
+        # 살아 있는 스레드의 연결 보관함 (close에서 한꺼번에 닫기 위해 약한 참조로 보관)
+        self._holders: "weakref.WeakSet[_ConnectionHolder]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+    
+    def get(self) -> sqlite3.Connection:
+        """현재 스레드의 연결을 반환합니다. (처음이면 새로 만듦)"""
+        holder = getattr(self._local, "holder", None)
+        if holder is not None:
+            return holder.conn
+        
+        return self.adopt(self.factory())
+    
+    def adopt(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """이미 만든 연결을 현재 스레드의 연결로 등록합니다."""
+        old = getattr(self._local, "holder", None)
+        if old is not None and old.conn is conn:
+            return conn
+        
+        holder = _ConnectionHolder(conn)
+        self._local.holder = holder
+        with self._lock:
+            self._holders.add(holder)
+        if old is not None:
+            old.close()
+        return conn
+    
+    def close(self):
+        """지금까지 만든 모든 연결을 닫습니다. (종료할 때 호출)"""
+        with self._lock:
+            holders = list(self._holders)
+            self._holders.clear()
+        for holder in holders:
+            holder.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._holders)
+
+class _ConnectionHolder:
+    """스레드 하나의 연결을 담는 객체 (스레드가 끝나 threading.local에서 사라지면 연결을 닫음)"""
+    
+    __slots__ = ("conn", "_finalizer", "__weakref__")
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._finalizer = weakref.finalize(self, _close_quietly, conn)
+    
+    def close(self):
+        """연결을 닫습니다. (여러 번 호출해도 한 번만 닫음)"""
+        self._finalizer()
+
+def _close_quietly(conn: sqlite3.Connection):
+    """연결을 닫습니다. (이미 닫혔거나 닫다가 난 오류는 무시)"""
+    try:
+        conn.close()
+    except Exception:
+        pass
\ No newline at end of file
@@ -0,0 +1,297 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from scipy import sparse
+from .korean_text import get_analyzer, normalize_utterance
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("gpt_cache")
+
+class SemanticCache:
+    """
+    TF-IDF 벡터 유사도로 비슷한 질문의 GPT 답변을 재사용하는 캐시 클래스
+    
+    단어장은 캐시 질문에서 직접 만들고 IDF는 QA 색인 값을 씁니다. QA 단어장에 없는 단어("3학년", "싫대요")는
+    버리지 않고 가장 드문 단어로 취급하므로, 그런 단어만 다른 질문은 같은 질문으로 보지 않습니다.
+    """
+    
+    def __init__(self, db_path: Optional[str] = None, threshold: float = 0.85,
+                 ttl: float = 86400.0, max_size: int = 500):
+        # 캐시 저장 파일 (None 또는 빈 문자열이면 메모리에만 보관)
+        self.db_path = db_path or None
+        # 이 값 이상으로 유사하면 같은 질문으로 간주
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        
+        # 정규화한 질문 -> (질문, 답변, 저장 시각), 최근 사용한 항목이 뒤쪽
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # 정규화한 질문 -> 저장 시각, 먼저 저장한 항목이 앞쪽 (만료 확인은 앞쪽만)
+        self._created: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # 캐시 질문들의 벡터 (저장할 때 한 행씩 추가, QA 색인이 바뀌면 다시 계산)
+        # 단어 -> 열 번호와 열 번호 -> 단어 (캐시 질문에 나온 단어만, 행렬을 압축할 때 남은 행의 단어로 줄임)
+        self._vocabulary: Dict[str, int] = {}
+        self._terms: List[str] = []
+        # 질문 키 -> QA 단어장에 없는 단어
+        self._unknown: Dict[str, frozenset] = {}
+        # 아직 행렬에 합치지 않은 (열 번호, 가중치) 행
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._matrix = None
+        # 행 번호 -> 질문 키 (행렬에 합치지 않은 행 포함, 제거된 항목의 행은 다음 압축 때까지 남음)
+        self._matrix_keys: List[str] = []
+        self._matrix_index = None
+        self._matrix_index_key = None
+        self._max_idf = 1.0
+        
+        self.hits = 0
+        self.misses = 0
+        
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.db_path:
+            self._load()
+    
+    def _load(self):
+        """저장 파일에서 만료되지 않은 항목을 불러옵니다."""
+        try:
+            directory = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(directory, exist_ok=True)
+            
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS gpt_cache ('
+                'normalized TEXT PRIMARY KEY, question TEXT NOT NULL, '
+                'answer TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._conn.execute('DELETE FROM gpt_cache WHERE created_at < ?', (time.time() - self.ttl,))
+            self._conn.commit()
+            
+            rows = self._conn.execute(
+                'SELECT normalized, question, answer, created_at FROM gpt_cache '
+                'ORDER BY created_at DESC LIMIT ?', (self.max_size,)
+            ).fetchall()
+        except Exception as e:
+            log_event(logger, "gpt_cache.load_error", level=logging.WARNING, error=str(e))
+            self._conn = None
+            return
+        
+        for normalized, question, answer, created_at in reversed(rows):
+            self._entries[normalized] = (question, answer, created_at)
+            self._created[normalized] = created_at
+    
+    def lookup(self, question: str, index) -> Optional[str]:
+        """
+        비슷한 질문의 캐시된 답변을 찾습니다.
+        
+        Args:
+            question (str): 사용자 질문
+            index: 벡터화에 사용할 QAIndex (None이면 정확히 같은 질문만 확인)
+        
+        Returns:
+            Optional[str]: 캐시된 답변 (없으면 None)
+        """
+        normalized = normalize_utterance(question)
+        now = time.time()
+        
+        with self._lock:
+            self._expire(now)
+            
+            # 1. 정규화한 질문이 같은 경우
+            entry = self._entries.get(normalized)
+            
+            # 2. TF-IDF 코사인 유사도가 기준값 이상이고, QA 단어장에 없는 단어가 같은 경우
+            if entry is None and index is not None and self._entries:
+                matrix = self._vectors(index)
+                cols, weights, unknown = self._weigh(question, index, grow=False)
+                if len(cols) and matrix.shape[0]:
+                    query = np.zeros(matrix.shape[1])
+                    query[cols] = weights
+                    similarities = matrix @ query
+                    candidates = np.flatnonzero(similarities >= self.threshold)
+                    for row in candidates[np.argsort(-similarities[candidates])]:
+                        key = self._matrix_keys[row]
+                        # 제거된 항목의 행과 "3학년"/"5학년"처럼 모르는 단어만 다른 질문은 건너뜀
+                        if key in self._entries and self._unknown.get(key) == unknown:
+                            normalized = key
+                            entry = self._entries[key]
+                            break
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(normalized)
+            self.hits += 1
+            return entry[1]
+    
+    def store(self, question: str, answer: str):
+        """
+        GPT 답변을 캐시에 저장합니다.
+        
+        Args:
+            question (str): 사용자 질문
+            answer (str): GPT 답변
+        """
+        if self.max_size <= 0:
+            return
+        
+        normalized = normalize_utterance(question)
+        created_at = time.time()
+        
+        with self._lock:
+            self._entries[normalized] = (question, answer, created_at)
+            self._entries.move_to_end(normalized)
+            self._created[normalized] = created_at
+            self._created.move_to_end(normalized)
+            
+            evicted = []
+            while len(self._entries) > self.max_size:
+                key = next(iter(self._entries))
+                self._remove(key)
+                evicted.append((key,))
+            
+            # 전체를 다시 계산하지 않고 새 질문의 행만 추가
+            if self._matrix_index is not None:
+                self._append(normalized, question)
+            
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO gpt_cache (normalized, question, answer, created_at) '
+                        'VALUES (?, ?, ?, ?)', (normalized, question, answer, created_at)
+                    )
+                    if evicted:
+                        self._conn.executemany('DELETE FROM gpt_cache WHERE normalized = ?', evicted)
+                    self._conn.commit()
+                except Exception as e:
+                    log_event(logger, "gpt_cache.store_error", level=logging.WARNING, error=str(e))
+    
+    def _expire(self, now: float):
+        """만료된 항목을 제거합니다. (호출 시 _lock 보유, 저장 순서대로 앞쪽만 확인)"""
+        while self._created:
+            key, created_at = next(iter(self._created.items()))
+            if created_at >= now - self.ttl:
+                break
+            self._remove(key)
+    
+    def _remove(self, key: str):
+        """항목을 제거합니다. (호출 시 _lock 보유, 행렬의 행은 다음 압축 때 정리)"""
+        del self._entries[key]
+        del self._created[key]
+        self._unknown.pop(key, None)
+    
+    def _weigh(self, text: str, index, grow: bool) -> Tuple[np.ndarray, np.ndarray, frozenset]:
+        """
+        텍스트를 캐시 단어장 기준의 L2 정규화된 TF-IDF 가중치로 바꿉니다. (호출 시 _lock 보유)
+        
+        Args:
+            text (str): 질문
+            index: IDF를 가져올 QAIndex (QA 단어장에 없는 단어는 가장 큰 IDF)
+            grow (bool): 캐시 단어장에 없는 단어를 추가할지 여부 (False면 그 단어는 정규화 크기에만 반영)
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, frozenset]: (열 번호, 가중치, QA 단어장에 없는 단어)
+        """
+        counts: Dict[str, int] = {}
+        for term in get_analyzer(index.analyzer)(text):
+            counts[term] = counts.get(term, 0) + 1
+        
+        cols: List[int] = []
+        weights: List[float] = []
+        unknown = []
+        unseen = 0.0
+        for term, count in counts.items():
+            qa_idx = index.vocabulary.get(term)
+            if qa_idx is None:
+                unknown.append(term)
+                weight = count * self._max_idf
+            else:
+                weight = count * float(index.idf[qa_idx])
+            
+            col = self._vocabulary.get(term)
+            if col is None and grow:
+                col = self._vocabulary[term] = len(self._terms)
+                self._terms.append(term)
+            if col is None:
+                unseen += weight * weight
+                continue
+            cols.append(col)
+            weights.append(weight)
+        
+        weights_array = np.array(weights, dtype=np.float64)
+        norm = np.sqrt(np.dot(weights_array, weights_array) + unseen)
+        if norm:
+            weights_array /= norm
+        return np.array(cols, dtype=np.int32), weights_array, frozenset(unknown)
+    
+    def _vectors(self, index):
+        """캐시 질문들의 TF-IDF 행렬을 반환합니다. (호출 시 _lock 보유)"""
+        if self._matrix_index_key != index.key:
+            # QA 색인(IDF)이 바뀌면 모든 항목을 다시 계산
+            self._matrix_index = index
+            self._matrix_index_key = index.key
+            self._max_idf = float(np.max(index.idf)) if len(index.idf) else 1.0
+            self._vocabulary = {}
+            self._terms = []
+            self._unknown = {}
+            self._matrix = None
+            self._matrix_keys = []
+            self._pending = []
+            for key in self._entries:
+                self._append(key, self._entries[key][0])
+        
+        if self._pending or self._matrix is None:
+            width = len(self._vocabulary)
+            rows = [
+                sparse.csr_matrix((weights, cols, [0, len(cols)]), shape=(1, width))
+                for cols, weights in self._pending
+            ]
+            if self._matrix is not None:
+                self._matrix.resize((self._matrix.shape[0], width))
+                rows.insert(0, self._matrix)
+            self._matrix = sparse.vstack(rows, format="csr") if rows else sparse.csr_matrix((0, width))
+            self._pending = []
+        
+        if len(self._matrix_keys) > 2 * max(len(self._entries), 1):
+            self._compact()
+        return self._matrix
+    
+    def _compact(self):
+        """
+        제거된 항목의 행이 절반을 넘으면 남은 항목의 행과 그 행에 나온 단어만 남깁니다. (호출 시 _lock 보유)
+        
+        오래 실행되는 워커에서 지나간 질문의 단어로 단어장과 질문 벡터 폭이 계속 커지지 않게 합니다.
+        """
+        live = [row for row, key in enumerate(self._matrix_keys) if key in self._entries]
+        matrix = self._matrix[live]
+        used = np.unique(matrix.indices)
+        
+        self._matrix = matrix[:, used]
+        self._matrix_keys = [self._matrix_keys[row] for row in live]
+        self._terms = [self._terms[col] for col in used]
+        self._vocabulary = {term: col for col, term in enumerate(self._terms)}
+    
+    def _append(self, key: str, question: str):
+        """질문의 행을 다음 행렬 갱신 때 추가하도록 계산해 둡니다. (호출 시 _lock 보유)"""
+        cols, weights, unknown = self._weigh(question, self._matrix_index, grow=True)
+        self._unknown[key] = unknown
+        self._pending.append((cols, weights))
+        self._matrix_keys.append(key)
+    
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
\ No newline at end of file
@@ -0,0 +1,165 @@
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, NamedTuple, Optional
+
+class Turn(NamedTuple):
+    """대화 한 턴 (사용자 메시지, 챗봇 응답, 의도, 시각)"""
+    user: str
+    bot: str
+    intent: str
+    timestamp: float
+
+def turn_size(turn: Turn) -> int:
+    """대화 한 턴이 차지하는 대략적인 메모리(바이트)를 계산합니다. (의도 문자열은 턴끼리 공유되므로 제외)"""
+    return (sys.getsizeof(turn) + sys.getsizeof(turn.user)
+            + sys.getsizeof(turn.bot) + sys.getsizeof(turn.timestamp))
+
+class InMemorySessionStore:
+    """전체 사용자 수 제한(LRU)과 유휴 만료 시간을 가진 메모리 대화 기록 저장소 클래스"""
+    
+    def __init__(self, max_turns: int = 10, capacity: int = 10000, idle_ttl: float = 3600.0):
+        # 사용자별 최대 대화 기록 수
+        self.max_turns = max_turns
+        # 기록을 보관할 최대 사용자 수
+        self.capacity = capacity
+        # 이 시간(초) 동안 대화가 없으면 기록 삭제
+        self.idle_ttl = idle_ttl
+        
+        # 사용자 ID -> (마지막 대화 시각, 턴 목록), 최근 대화한 사용자가 뒤쪽
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # 저장된 턴 수와 대략적인 메모리(바이트) (통계 조회 때 전체를 훑지 않도록 변경할 때마다 갱신)
+        self._turn_count = 0
+        self._memory_bytes = 0
+        # 사용자 한 명의 (마지막 대화 시각, 턴 목록) 튜플과 빈 턴 목록 크기
+        self._session_overhead = sys.getsizeof((0.0, None)) + sys.getsizeof(deque(maxlen=max(max_turns, 0)))
+        
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get_history(self, user_id: str, limit: Optional[int] = None) -> List[Turn]:
+        """
+        사용자의 최근 대화 기록을 반환합니다.
+        
+        Args:
+            user_id (str): 사용자 ID
+            limit (Optional[int]): 최근 몇 턴까지 반환할지 (None이면 전체)
+        
+        Returns:
+            List[Turn]: 오래된 것부터 정렬된 대화 기록 (없거나 만료되었으면 빈 목록)
+        """
+        now = time.time()
+        
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is None:
+                return []
+            
+            last_seen, turns = session
+            if last_seen < now - self.idle_ttl:
+                self._remove(user_id)
+                self.expirations += 1
+                return []
+            
+            history = list(turns)
+        
+        if limit is not None:
+            history = history[-limit:] if limit > 0 else []
+        return history
+    
+    def has_history(self, user_id: str) -> bool:
+        """사용자의 만료되지 않은 대화 기록이 있는지 확인합니다."""
+        return bool(self.get_history(user_id, limit=1))
+    
+    def append(self, user_id: str, user_input: str, bot_response: str, intent: str):
+        """
+        대화 한 턴을 기록합니다.
+        
+        Args:
+            user_id (str): 사용자 ID
+            user_input (str): 사용자 입력 메시지
+            bot_response (str): 챗봇 응답
+            intent (str): 감지된 의도
+        """
+        if self.capacity <= 0 or self.max_turns <= 0:
+            return
+        
+        now = time.time()
+        turn = Turn(user_input, bot_response, intent, now)
+        
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is not None and session[0] < now - self.idle_ttl:
+                self._remove(user_id)
+                session = None
+            
+            if session is None:
+                turns = deque(maxlen=self.max_turns)
+                self._memory_bytes += sys.getsizeof(user_id) + self._session_overhead
+            else:
+                turns = session[1]
+            
+            if len(turns) == self.max_turns:
+                # 가장 오래된 턴이 밀려남
+                self._turn_count -= 1
+                self._memory_bytes -= turn_size(turns[0])
+            turns.append(turn)
+            self._turn_count += 1
+            self._memory_bytes += turn_size(turn)
+            self._sessions[user_id] = (now, turns)
+            self._sessions.move_to_end(user_id)
+            
+            self._evict(now)
+    
+    def _evict(self, now: float):
+        """유휴 시간이 지났거나 용량을 넘은 사용자를 제거합니다. (호출 시 _lock 보유)"""
+        # 마지막 대화 시각 순으로 정렬되어 있으므로 앞쪽만 확인
+        while self._sessions:
+            user_id, (last_seen, _) = next(iter(self._sessions.items()))
+            if last_seen >= now - self.idle_ttl:
+                break
+            self._remove(user_id)
+            self.expirations += 1
+        
+        while len(self._sessions) > self.capacity:
+            self._remove(next(iter(self._sessions)))
+            self.evictions += 1
+    
+    def _remove(self, user_id: str):
+        """사용자의 기록을 지우고 턴 수와 메모리 사용량에서 뺍니다. (호출 시 _lock 보유)"""
+        session = self._sessions.pop(user_id)
+        turns = session[1]
+        self._turn_count -= len(turns)
+        self._memory_bytes -= (sys.getsizeof(user_id) + self._session_overhead
+                               + sum(turn_size(turn) for turn in turns))
+    
+    def clear(self, user_id: Optional[str] = None):
+        """특정 사용자(또는 전체)의 대화 기록을 삭제합니다."""
+        with self._lock:
+            if user_id is None:
+                self._sessions.clear()
+                self._turn_count = 0
+                self._memory_bytes = 0
+            elif user_id in self._sessions:
+                self._remove(user_id)
+    
+    def memory_usage(self) -> int:
+        """저장된 대화 기록이 차지하는 대략적인 메모리(바이트)를 반환합니다."""
+        with self._lock:
+            return sys.getsizeof(self._sessions) + self._memory_bytes
+    
+    def stats(self) -> Dict[str, float]:
+        """저장소 사용량 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "backend": "memory",
+                "users": len(self._sessions),
+                "capacity": self.capacity,
+                "turns": self._turn_count,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "memory_bytes": sys.getsizeof(self._sessions) + self._memory_bytes
+            }
\ No newline at end of file
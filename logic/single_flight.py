@@ -0,0 +1,70 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+class _Call:
+    """진행 중인 호출 하나의 결과를 기다리는 대기자들이 공유하는 상태"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 한 번만 실행하고 결과를 나눠 주는 클래스"""
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        
+        self.calls = 0
+        self.shared = 0
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        같은 키의 호출이 진행 중이면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+        
+        Args:
+            key (Hashable): 호출을 구분하는 키
+            fn (Callable[[], Any]): 실행할 함수
+        
+        Returns:
+            Tuple[Any, bool]: (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+                leader = True
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            # 결과를 정한 뒤에 키를 지워야 늦게 온 요청이 새 호출을 시작함
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        
+        return call.result, False
+    
+    def stats(self) -> Dict[str, int]:
+        """실행/공유 횟수 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "calls": self.calls,
+                "shared": self.shared
+            }
\ No newline at end of file
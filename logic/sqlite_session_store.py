@@ -0,0 +1,362 @@
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from .session_store import Turn, turn_size
+from .structured_logging import get_logger, log_event
+
+logger = get_logger("sessions")
+
+class SQLiteSessionStore:
+    """여러 워커 프로세스가 함께 쓰는 SQLite(WAL) 대화 기록 저장소 클래스 (쓰기는 모아서 저장, 읽기는 사용자별 캐시)"""
+    
+    def __init__(self, db_path: str = 'sessions.db', max_turns: int = 10, capacity: int = 10000,
+                 idle_ttl: float = 3600.0, flush_interval: float = 0.05, cache_size: int = 1024,
+                 cleanup_interval: float = 60.0, stats_interval: float = 10.0):
+        self.db_path = db_path
+        # 사용자별 최대 대화 기록 수
+        self.max_turns = max_turns
+        # 기록을 보관할 최대 사용자 수
+        self.capacity = capacity
+        # 이 시간(초) 동안 대화가 없으면 기록 삭제
+        self.idle_ttl = idle_ttl
+        # 쓰기를 모아서 저장하는 주기 (초)
+        self.flush_interval = flush_interval
+        # 읽기 캐시에 둘 최대 사용자 수
+        self.cache_size = cache_size
+        # 만료/용량 초과 사용자를 정리하는 주기 (초)
+        self.cleanup_interval = cleanup_interval
+        # DB의 사용자/턴 수를 다시 세는 주기 (초, 상태 확인마다 테이블 전체를 세지 않도록 결과를 보관)
+        self.stats_interval = stats_interval
+        
+        self._lock = threading.Lock()
+        # 저장 중인 배치가 끝날 때까지 다른 flush()가 기다리도록 함
+        self._flush_lock = threading.Lock()
+        # 아직 저장하지 않은 (사용자 ID, 턴) 목록과 사용자별 개수
+        self._pending: List[tuple] = []
+        self._pending_users: Dict[str, int] = {}
+        # 사용자 ID -> (DB의 마지막 턴 ID, 턴 목록), 최근 읽은 사용자가 뒤쪽
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # 읽기 캐시와 저장 대기 중인 턴의 대략적인 메모리(바이트) (통계 조회 때 전체를 훑지 않도록 변경할 때마다 갱신)
+        self._cache_bytes = 0
+        self._pending_bytes = 0
+        
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._writer = None
+        self._last_cleanup = time.time()
+        # 마지막으로 센 (사용자 수, 턴 수)와 센 시각
+        self._db_counts = (0, 0)
+        self._db_counts_at: Optional[float] = None
+        
+        self.flushes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        
+        self._create_schema()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 DB 연결을 반환합니다. (fork된 워커에서는 새로 연결)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    def _create_schema(self):
+        """대화 기록 테이블을 만듭니다."""
+        directory = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(directory, exist_ok=True)
+        
+        conn = self._connect()
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS session_turns ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, user_id TEXT NOT NULL, '
+            'user_text TEXT NOT NULL, bot_text TEXT NOT NULL, '
+            'intent TEXT NOT NULL, created_at REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_session_turns_user ON session_turns (user_id, id)')
+        conn.commit()
+    
+    def get_history(self, user_id: str, limit: Optional[int] = None) -> List[Turn]:
+        """
+        사용자의 최근 대화 기록을 반환합니다.
+        
+        Args:
+            user_id (str): 사용자 ID
+            limit (Optional[int]): 최근 몇 턴까지 반환할지 (None이면 전체)
+        
+        Returns:
+            List[Turn]: 오래된 것부터 정렬된 대화 기록 (없거나 만료되었으면 빈 목록)
+        """
+        history = None
+        
+        with self._lock:
+            entry = self._cache.get(user_id)
+            # 이 워커에 아직 저장하지 않은 턴이 있으면 캐시가 가장 최신
+            if self._pending_users.get(user_id) and entry is not None:
+                self._cache.move_to_end(user_id)
+                self.cache_hits += 1
+                history = list(entry[1])
+            pending = bool(self._pending_users.get(user_id))
+        
+        if history is None:
+            if pending:
+                self.flush()
+            history = self._read_history(user_id)
+        
+        if history and history[-1].timestamp < time.time() - self.idle_ttl:
+            return []
+        
+        if limit is not None:
+            history = history[-limit:] if limit > 0 else []
+        return history
+    
+    def _read_history(self, user_id: str) -> List[Turn]:
+        """DB의 마지막 턴 ID를 확인해 바뀌었을 때만 대화 기록을 다시 읽습니다."""
+        try:
+            conn = self._connect()
+            last_id = conn.execute(
+                'SELECT MAX(id) FROM session_turns WHERE user_id = ?', (user_id,)
+            ).fetchone()[0]
+            
+            with self._lock:
+                entry = self._cache.get(user_id)
+                if entry is not None and entry[0] == last_id:
+                    self._cache.move_to_end(user_id)
+                    self.cache_hits += 1
+                    return list(entry[1])
+                self.cache_misses += 1
+            
+            if last_id is None:
+                turns = []
+            else:
+                rows = conn.execute(
+                    'SELECT user_text, bot_text, intent, created_at FROM session_turns '
+                    'WHERE user_id = ? ORDER BY id DESC LIMIT ?', (user_id, self.max_turns)
+                ).fetchall()
+                turns = [Turn(*row) for row in reversed(rows)]
+        except Exception as e:
+            log_event(logger, "sessions.read_error", level=logging.ERROR, error=str(e))
+            return []
+        
+        with self._lock:
+            self._cache_put(user_id, (last_id, turns))
+        
+        return list(turns)
+    
+    @staticmethod
+    def _entry_size(user_id: str, entry: tuple) -> int:
+        """읽기 캐시 항목 하나의 대략적인 메모리(바이트)를 계산합니다. (턴이 max_turns개 이하라 비용이 일정함)"""
+        return (sys.getsizeof(user_id) + sys.getsizeof(entry) + sys.getsizeof(entry[1])
+                + sum(turn_size(turn) for turn in entry[1]))
+    
+    def _cache_put(self, user_id: str, entry: tuple):
+        """읽기 캐시 항목을 넣거나 바꾸고 넘치는 사용자를 내보냅니다. (호출 시 _lock 보유)"""
+        old = self._cache.get(user_id)
+        if old is not None:
+            self._cache_bytes -= self._entry_size(user_id, old)
+        self._cache[user_id] = entry
+        self._cache.move_to_end(user_id)
+        self._cache_bytes += self._entry_size(user_id, entry)
+        
+        while len(self._cache) > self.cache_size:
+            evicted_id, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= self._entry_size(evicted_id, evicted)
+    
+    def has_history(self, user_id: str) -> bool:
+        """사용자의 만료되지 않은 대화 기록이 있는지 확인합니다."""
+        return bool(self.get_history(user_id, limit=1))
+    
+    def append(self, user_id: str, user_input: str, bot_response: str, intent: str):
+        """
+        대화 한 턴을 기록합니다. (저장은 백그라운드 스레드가 모아서 처리)
+        
+        Args:
+            user_id (str): 사용자 ID
+            user_input (str): 사용자 입력 메시지
+            bot_response (str): 챗봇 응답
+            intent (str): 감지된 의도
+        """
+        if self.capacity <= 0 or self.max_turns <= 0:
+            return
+        
+        turn = Turn(user_input, bot_response, intent, time.time())
+        
+        with self._lock:
+            self._pending.append((user_id, turn))
+            self._pending_users[user_id] = self._pending_users.get(user_id, 0) + 1
+            self._pending_bytes += turn_size(turn)
+            
+            # 캐시에 있는 사용자는 새 턴을 바로 반영 (없으면 다음 읽기에서 저장 후 조회)
+            entry = self._cache.get(user_id)
+            if entry is not None:
+                self._cache_put(user_id, (entry[0], (entry[1] + [turn])[-self.max_turns:]))
+            
+            self._ensure_writer()
+        
+        self._wakeup.set()
+    
+    def _ensure_writer(self):
+        """저장 스레드를 시작합니다. (호출 시 _lock 보유, fork 후에도 다시 시작)"""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._run, name="wasuk-session-writer", daemon=True)
+            self._writer.start()
+    
+    def _run(self):
+        """쓰기가 생기면 flush_interval 동안 모은 뒤 한 번에 저장합니다."""
+        while not self._stop_event.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stop_event.wait(self.flush_interval):
+                break
+            self.flush()
+    
+    def flush(self):
+        """모아 둔 턴을 한 트랜잭션으로 저장합니다."""
+        with self._flush_lock:
+            self._flush()
+    
+    def _flush(self):
+        """저장 대기 중인 턴을 DB에 씁니다. (호출 시 _flush_lock 보유)"""
+        with self._lock:
+            batch = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+        if not batch:
+            return
+        
+        users = {user_id for user_id, _ in batch}
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    'INSERT INTO session_turns (user_id, user_text, bot_text, intent, created_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    [(user_id, *turn) for user_id, turn in batch]
+                )
+                # 사용자별 최근 max_turns개만 남김
+                conn.executemany(
+                    'DELETE FROM session_turns WHERE user_id = ? AND id <= ('
+                    'SELECT id FROM session_turns WHERE user_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)',
+                    [(user_id, user_id, self.max_turns) for user_id in users]
+                )
+            self.flushes += 1
+        except Exception as e:
+            log_event(logger, "sessions.flush_error", level=logging.ERROR, error=str(e))
+        finally:
+            with self._lock:
+                for user_id, _ in batch:
+                    remaining = self._pending_users.get(user_id, 0) - 1
+                    if remaining > 0:
+                        self._pending_users[user_id] = remaining
+                    else:
+                        self._pending_users.pop(user_id, None)
+        
+        if time.time() - self._last_cleanup >= self.cleanup_interval:
+            self.cleanup()
+    
+    def cleanup(self):
+        """유휴 시간이 지났거나 용량을 넘은 사용자의 기록을 삭제합니다."""
+        self._last_cleanup = time.time()
+        try:
+            conn = self._connect()
+            expired = conn.execute(
+                'SELECT user_id FROM session_turns GROUP BY user_id HAVING MAX(created_at) < ?',
+                (time.time() - self.idle_ttl,)
+            ).fetchall()
+            evicted = conn.execute(
+                'SELECT user_id FROM session_turns GROUP BY user_id '
+                'HAVING MAX(created_at) >= ? ORDER BY MAX(id) DESC LIMIT -1 OFFSET ?',
+                (time.time() - self.idle_ttl, self.capacity)
+            ).fetchall()
+            with conn:
+                conn.executemany('DELETE FROM session_turns WHERE user_id = ?', expired + evicted)
+            self.expirations += len(expired)
+            self.evictions += len(evicted)
+        except Exception as e:
+            log_event(logger, "sessions.cleanup_error", level=logging.WARNING, error=str(e))
+    
+    def clear(self, user_id: Optional[str] = None):
+        """특정 사용자(또는 전체)의 대화 기록을 삭제합니다."""
+        self.flush()
+        try:
+            conn = self._connect()
+            with conn:
+                if user_id is None:
+                    conn.execute('DELETE FROM session_turns')
+                else:
+                    conn.execute('DELETE FROM session_turns WHERE user_id = ?', (user_id,))
+        except Exception as e:
+            log_event(logger, "sessions.clear_error", level=logging.ERROR, error=str(e))
+        
+        with self._lock:
+            if user_id is None:
+                self._cache.clear()
+                self._cache_bytes = 0
+            elif user_id in self._cache:
+                self._cache_bytes -= self._entry_size(user_id, self._cache.pop(user_id))
+    
+    def close(self):
+        """남은 기록을 저장하고 저장 스레드를 멈춥니다."""
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+    
+    def memory_usage(self) -> int:
+        """읽기 캐시와 저장 대기 중인 턴이 차지하는 대략적인 메모리(바이트)를 반환합니다."""
+        with self._lock:
+            return self._memory_usage()
+    
+    def _memory_usage(self) -> int:
+        """변경할 때마다 갱신한 값으로 메모리 사용량을 계산합니다. (호출 시 _lock 보유)"""
+        return (sys.getsizeof(self._cache) + sys.getsizeof(self._pending)
+                + self._cache_bytes + self._pending_bytes)
+    
+    def stats(self) -> Dict[str, float]:
+        """저장소 사용량 통계를 반환합니다. (사용자/턴 수는 stats_interval마다 다시 셈)"""
+        now = time.time()
+        with self._lock:
+            users, turns = self._db_counts
+            stale = self._db_counts_at is None or now - self._db_counts_at >= self.stats_interval
+            if stale:
+                # 다른 요청이 동시에 다시 세지 않도록 먼저 시각을 갱신
+                self._db_counts_at = now
+        
+        if stale:
+            try:
+                users, turns = self._connect().execute(
+                    'SELECT COUNT(DISTINCT user_id), COUNT(*) FROM session_turns'
+                ).fetchone()
+                with self._lock:
+                    self._db_counts = (users, turns)
+            except Exception as e:
+                log_event(logger, "sessions.stats_error", level=logging.WARNING, error=str(e))
+        
+        with self._lock:
+            total = self.cache_hits + self.cache_misses
+            return {
+                "backend": "sqlite",
+                "users": users,
+                "capacity": self.capacity,
+                "turns": turns,
+                "pending": len(self._pending),
+                "flushes": self.flushes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "cache_hit_rate": self.cache_hits / total if total else 0.0,
+                "memory_bytes": self._memory_usage()
+            }
\ No newline at end of file
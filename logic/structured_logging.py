@@ -0,0 +1,133 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# 모든 로거의 상위 로거 이름
+ROOT_LOGGER = "wasuk"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """요청 스레드에서는 레코드를 큐에 넣기만 하는 핸들러 (큐가 가득 차면 버림)"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 여기서 포맷까지 하므로, 메시지만 확정하고 직렬화는 기록 스레드에 맡김
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class _SamplingFilter(logging.Filter):
+    """sampled=True로 남긴 성공 로그를 sample_rate 비율만 통과시키는 필터"""
+    
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False) and record.levelno < logging.WARNING:
+            return random.random() < self.sample_rate
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 만들고 긴 필드 값을 자르는 포매터"""
+    
+    def __init__(self, max_field_chars: int = 200):
+        super().__init__()
+        self.max_field_chars = max_field_chars
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage()
+        }
+        for key, value in getattr(record, "fields", {}).items():
+            entry[key] = self._truncate(value)
+        if record.exc_info:
+            entry["exception"] = self._truncate(self.formatException(record.exc_info))
+        return json.dumps(entry, ensure_ascii=False, default=str)
+    
+    def _truncate(self, value: Any) -> Any:
+        """문자열이 max_field_chars보다 길면 자릅니다."""
+        if isinstance(value, (int, float, bool)) or value is None:
+            return value
+        text = value if isinstance(value, str) else str(value)
+        if len(text) > self.max_field_chars:
+            return f"{text[:self.max_field_chars]}…(+{len(text) - self.max_field_chars}자)"
+        return text
+
+def configure_logging(level: str = "INFO", sample_rate: float = 1.0,
+                      max_field_chars: int = 200, queue_size: int = 10000):
+    """
+    큐 기반 구조화 로깅을 설정합니다. (여러 번 호출해도 한 번만 설정)
+    
+    요청 스레드는 레코드를 큐에 넣기만 하고, 별도 스레드가 JSON으로 만들어 stdout에 씁니다.
+    
+    Args:
+        level (str): 로그 레벨 (DEBUG, INFO, WARNING, ERROR)
+        sample_rate (float): 성공 로그(sampled=True)를 남길 비율 (0~1)
+        max_field_chars (int): 필드 값 최대 글자 수
+        queue_size (int): 기록 대기 큐 크기 (가득 차면 새 로그를 버림)
+    """
+    global _listener
+    
+    with _configure_lock:
+        if _listener is not None:
+            return
+        
+        log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        
+        queue_handler = _DroppingQueueHandler(log_queue)
+        queue_handler.addFilter(_SamplingFilter(sample_rate))
+        
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(JsonFormatter(max_field_chars))
+        
+        logger = logging.getLogger(ROOT_LOGGER)
+        logger.setLevel(level.upper())
+        logger.addHandler(queue_handler)
+        logger.propagate = False
+        
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+        # 종료할 때 큐에 남은 로그를 모두 기록
+        atexit.register(_listener.stop)
+
+def get_logger(name: str) -> logging.Logger:
+    """wasuk 하위 로거를 반환합니다."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO,
+              sampled: bool = False, exc_info: bool = False, **fields):
+    """
+    이벤트 이름과 필드로 구조화 로그를 남깁니다.
+    
+    Args:
+        logger (logging.Logger): 로거
+        event (str): 이벤트 이름 (예: "webhook.response")
+        level (int): 로그 레벨
+        sampled (bool): 많이 발생하는 성공 로그라 샘플링할지 여부
+        exc_info (bool): 현재 예외의 traceback을 함께 남길지 여부
+        **fields: 로그에 남길 필드 (긴 값은 기록할 때 잘림)
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, event, exc_info=exc_info, extra={"fields": fields, "sampled": sampled})
\ No newline at end of file
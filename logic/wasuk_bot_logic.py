@@ -1,38 +1,248 @@
 from dotenv import load_dotenv
 load_dotenv()
 import os
+import atexit
+import threading
+import logging
+import concurrent.futures
+import time
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from openai import OpenAI
-from .intent_detector import IntentDetector
-from .qa_handler import QAHandler
-from .meal_handler import MealHandler
+from .intent_detector import DEFAULT_LEXICON_PATH, IntentDetector
+from .reloader import Reloader
+from .response_cache import ResponseCache
+from .gpt_stream import StreamCollector
+from .session_store import InMemorySessionStore
+from .sqlite_session_store import SQLiteSessionStore
+from .context_builder import ContextBuilder
+from .single_flight import SingleFlight
+from .korean_text import normalize_utterance
+from .metrics import METRICS
+from .structured_logging import configure_logging, get_logger, log_event
+from .kakao_response import KakaoResponse, format_response
+from .school_db import data_path
+
+logger = get_logger("bot")
+
+# 아직 만들지 않은 지연 초기화 구성 요소 표시
+_UNSET = object()
+
+# 배치 처리 GPT 요청에 쓰는 사용자 ID (대화 기록을 남기지 않음)
+BATCH_USER_ID = "__batch__"
+
+# 처음 사용할 때 만드는 구성 요소 (속성 이름 -> 생성 메서드 이름)
+LAZY_COMPONENTS = {
+    "openai_client": "_create_openai_client",
+    "qa_handler": "_create_qa_handler",
+    "meal_handler": "_create_meal_handler",
+    "notice_handler": "_create_notice_handler",
+    "gpt_cache": "_create_gpt_cache"
+}
 
 class WasukBotLogic:
     """와석초 챗봇 메인 로직 클래스"""
     
     def __init__(self):
-        # OpenAI 클라이언트 초기화
-        api_key = os.environ.get('OPENAI_API_KEY')
-        if not api_key:
-            print("경고: OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
-            self.openai_client = None
-        else:
-            self.openai_client = OpenAI(api_key=api_key)
+        # 로그는 큐에 넣고 별도 스레드가 기록 (성공 로그는 LOG_SAMPLE_RATE 비율만 기록)
+        configure_logging(
+            level=os.environ.get('LOG_LEVEL', 'INFO'),
+            sample_rate=float(os.environ.get('LOG_SAMPLE_RATE', 0.1)),
+            max_field_chars=int(os.environ.get('LOG_MAX_FIELD_CHARS', 200))
+        )
+        
+        # OpenAI 클라이언트, QA/급식/공지 모듈, GPT 답변 캐시는 처음 사용할 때 생성
+        # (sklearn/numpy/openai 로드와 TF-IDF 학습을 기동 경로에서 제외)
+        for name in LAZY_COMPONENTS:
+            setattr(self, f"_{name}", _UNSET)
+        self._init_locks = {name: threading.Lock() for name in LAZY_COMPONENTS}
+        self._warm_up_thread = None
         
-        # 각 모듈 초기화
-        self.intent_detector = IntentDetector()
-        self.qa_handler = QAHandler()
-        self.meal_handler = MealHandler()
+        # 의도 파악 모듈은 가벼우므로 바로 초기화
+        self.intent_detector = IntentDetector(lexicon_path=os.environ.get('INTENT_LEXICON_PATH', DEFAULT_LEXICON_PATH))
         
-        # 대화 기록 저장 (사용자별)
-        self.conversation_memory = {}
+        # QA 데이터, 의도 사전, 급식 캘린더 변경을 주기적으로 확인해 재시작 없이 반영
+        # (QA/급식 모듈은 생성될 때 등록)
+        self.reloader = Reloader(interval=float(os.environ.get('RELOAD_INTERVAL', 30)))
+        self.reloader.register(self.intent_detector)
+        self.reloader.start()
         
         # 챗봇 설정
         self.max_conversation_length = 10  # 최대 대화 기록 수
         self.temperature = 0.7
         self.max_tokens = 150
+        
+        # 대화 기록 저장 (사용자별, 전체 사용자 수와 유휴 시간 제한)
+        # 워커 여러 개로 실행할 때는 SESSION_BACKEND=sqlite로 워커끼리 기록 공유
+        session_options = {
+            "max_turns": self.max_conversation_length,
+            "capacity": int(os.environ.get('SESSION_CAPACITY', 10000)),
+            "idle_ttl": float(os.environ.get('SESSION_IDLE_TTL', 3600))
+        }
+        if os.environ.get('SESSION_BACKEND', 'memory') == 'sqlite':
+            self.conversation_memory = SQLiteSessionStore(
+                db_path=os.environ.get('SESSION_DB_PATH', data_path('sessions.db')),
+                **session_options
+            )
+            # 종료할 때 아직 저장하지 않은 대화 기록을 저장
+            atexit.register(self.conversation_memory.close)
+        else:
+            self.conversation_memory = InMemorySessionStore(**session_options)
+        
+        # GPT 프롬프트 토큰 예산 (오래된 대화는 요약, 최근 대화는 최대 5개)
+        self.context_builder = ContextBuilder(
+            token_budget=int(os.environ.get('GPT_PROMPT_TOKEN_BUDGET', 1000)),
+            recent_turns=5
+        )
+        
+        # 결정적인 의도(급식/공지/질문/인사)의 응답 캐시
+        self.cacheable_intents = {"급식", "공지", "질문", "인사"}
+        self.response_cache = ResponseCache(
+            max_size=int(os.environ.get('RESPONSE_CACHE_SIZE', 1024)),
+            ttl=float(os.environ.get('RESPONSE_CACHE_TTL', 600))
+        )
+        
+        # GPT 답변을 스트리밍으로 받아 글자 수/시간 예산을 넘기면 문장 끝에서 중단
+        self.gpt_streaming = os.environ.get('GPT_STREAMING', '1') != '0'
+        self.gpt_stream = StreamCollector(
+            char_budget=int(os.environ.get('GPT_CHAR_BUDGET', 300)),
+            time_budget=float(os.environ.get('GPT_TIME_BUDGET', 2.5))
+        )
+        
+        # 동시에 진행 중인 OpenAI 호출 수 제한과 같은 질문의 호출 합치기
+        self.gpt_max_concurrency = int(os.environ.get('GPT_MAX_CONCURRENCY', 8))
+        self.gpt_slots = threading.BoundedSemaphore(self.gpt_max_concurrency)
+        self.gpt_queue_timeout = float(os.environ.get('GPT_QUEUE_TIMEOUT', 0.2))
+        self.gpt_rejected = 0
+        self._stats_lock = threading.Lock()
+        self.gpt_flight = SingleFlight()
+        
+        # 배치 처리에서 동시에 보낼 GPT 요청 수 (웹훅 요청의 자리를 남기도록 GPT_MAX_CONCURRENCY보다 작게)
+        self.batch_gpt_concurrency = int(os.environ.get('BATCH_GPT_CONCURRENCY', 4))
+    
+    def _lazy(self, name: str):
+        """지연 초기화 구성 요소를 반환합니다. (처음 호출될 때 한 번만 생성)"""
+        value = getattr(self, f"_{name}")
+        if value is _UNSET:
+            with self._init_locks[name]:
+                value = getattr(self, f"_{name}")
+                if value is _UNSET:
+                    start = time.perf_counter()
+                    value = getattr(self, LAZY_COMPONENTS[name])()
+                    setattr(self, f"_{name}", value)
+                    log_event(logger, "startup.component", component=name,
+                              ms=round((time.perf_counter() - start) * 1000, 1))
+        return value
+    
+    @property
+    def openai_client(self):
+        return self._lazy("openai_client")
+    
+    @openai_client.setter
+    def openai_client(self, client):
+        self._openai_client = client
+    
+    @property
+    def qa_handler(self):
+        return self._lazy("qa_handler")
+    
+    @property
+    def meal_handler(self):
+        return self._lazy("meal_handler")
+    
+    @property
+    def notice_handler(self):
+        return self._lazy("notice_handler")
+    
+    @property
+    def gpt_cache(self):
+        return self._lazy("gpt_cache")
     
-    def process_message(self, user_input: str, user_id: str = "default") -> Dict:
+    def _create_openai_client(self):
+        """OpenAI 클라이언트를 만듭니다. (API 키가 없으면 None)"""
+        api_key = os.environ.get('OPENAI_API_KEY')
+        if not api_key:
+            log_event(logger, "gpt.no_api_key", level=logging.WARNING)
+            return None
+        
+        from openai import OpenAI
+        # 응답이 늦어도 작업 스레드가 오래 묶이지 않도록 요청 제한 시간 설정
+        return OpenAI(
+            api_key=api_key,
+            timeout=float(os.environ.get('OPENAI_TIMEOUT', 30))
+        )
+    
+    def _create_qa_handler(self):
+        """QA 모듈을 만들고 재로드 대상으로 등록합니다."""
+        from .qa_handler import QAHandler
+        from .paraphrase_table import DEFAULT_PARAPHRASE_PATH
+        # QA 분석기 모드 ("char": 조사 제거 + 글자 n-그램, "word": 단어 n-그램)
+        # 학습된 QA 색인은 QA_INDEX_DIR에 저장해 다음 기동 시 워커들이 공유
+        # 바꿔 말하기 표(QA_PARAPHRASE_PATH)의 표현은 TF-IDF 계산 없이 정확한 매칭으로 답함
+        qa_handler = QAHandler(
+            analyzer=os.environ.get('QA_ANALYZER', 'char'),
+            index_dir=os.environ.get('QA_INDEX_DIR', data_path('.qa_index')),
+            paraphrase_path=os.environ.get('QA_PARAPHRASE_PATH', DEFAULT_PARAPHRASE_PATH)
+        )
+        self.reloader.register(qa_handler)
+        return qa_handler
+    
+    def _create_meal_handler(self):
+        """급식 모듈을 만들고 재로드 대상으로 등록합니다."""
+        from .meal_handler import MealHandler
+        meal_handler = MealHandler()
+        self.reloader.register(meal_handler)
+        return meal_handler
+    
+    def _create_notice_handler(self):
+        """공지사항 검색 모듈을 만들고 재로드 대상으로 등록합니다."""
+        from .notice_handler import NoticeHandler
+        notice_handler = NoticeHandler()
+        self.reloader.register(notice_handler)
+        return notice_handler
+    
+    def _create_gpt_cache(self):
+        """대화 맥락이 없는 GPT 질문의 답변 캐시를 만듭니다. (비슷한 질문이면 재사용, 재시작 후에도 유지)"""
+        from .semantic_cache import SemanticCache
+        return SemanticCache(
+            db_path=os.environ.get('GPT_CACHE_PATH', data_path('gpt_cache.db')),
+            threshold=float(os.environ.get('GPT_CACHE_THRESHOLD', 0.85)),
+            ttl=float(os.environ.get('GPT_CACHE_TTL', 86400)),
+            max_size=int(os.environ.get('GPT_CACHE_SIZE', 500))
+        )
+    
+    def component_status(self) -> Dict[str, bool]:
+        """지연 초기화 구성 요소별 생성 여부를 반환합니다."""
+        return {name: getattr(self, f"_{name}") is not _UNSET for name in LAZY_COMPONENTS}
+    
+    @property
+    def ready(self) -> bool:
+        """모든 구성 요소가 만들어져 첫 요청도 바로 처리할 수 있는지 여부"""
+        return all(self.component_status().values())
+    
+    def warm_up(self):
+        """모든 구성 요소를 만들고 QA 검색을 한 번 실행해 둡니다."""
+        start = time.perf_counter()
+        for name in LAZY_COMPONENTS:
+            try:
+                self._lazy(name)
+            except Exception as e:
+                log_event(logger, "startup.error", level=logging.ERROR, component=name, error=str(e))
+        
+        try:
+            # 분석기와 색인 배열을 미리 한 번 사용
+            self.qa_handler.find_match("급식 메뉴")
+        except Exception as e:
+            log_event(logger, "startup.error", level=logging.ERROR, component="qa_search", error=str(e))
+        
+        log_event(logger, "startup.ready", ms=round((time.perf_counter() - start) * 1000, 1))
+    
+    def start_warm_up(self):
+        """백그라운드 스레드에서 warm_up()을 실행합니다."""
+        if self._warm_up_thread is None:
+            self._warm_up_thread = threading.Thread(target=self.warm_up, name="wasuk-warmup", daemon=True)
+            self._warm_up_thread.start()
+    
+    def process_message(self, user_input: str, user_id: str = "default") -> KakaoResponse:
         """
         사용자 메시지를 처리하고 카카오톡 응답 형식으로 반환합니다.
         
@@ -41,18 +251,34 @@ class WasukBotLogic:
             user_id (str): 사용자 ID (대화 기록 관리용)
             
         Returns:
-            Dict: 카카오톡 응답 형식
+            KakaoResponse: 카카오톡 응답 (읽기 전용, dict가 필요하면 to_dict())
         """
         try:
+            # 0. 캐시된 응답이 있으면 의도 파악과 처리를 건너뜀
+            cache_key = self._response_cache_key(user_input)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                intent, response_text = cached
+                METRICS.increment("requests_total", "intent", intent)
+                self._update_conversation_memory(user_id, user_input, response_text, intent)
+                # 응답 틀은 미리 만들어 두었으므로 텍스트만 끼워 새로 만듦 (복사 불필요)
+                return self._format_kakao_response(response_text, intent)
+            
             # 1. 의도 파악
-            intent = self.intent_detector.detect(user_input)
-            confidence = self.intent_detector.get_confidence_score(user_input, intent)
+            with METRICS.span("intent"):
+                detection = self.intent_detector.classify(user_input)
+            intent = detection["intent"]
+            confidence = detection["confidence"]
+            METRICS.increment("requests_total", "intent", intent)
             
-            print(f"의도: {intent}, 신뢰도: {confidence:.2f}")
+            log_event(logger, "intent", level=logging.DEBUG, intent=intent, confidence=round(confidence, 2))
             
             # 2. 의도별 처리
             if intent == "급식":
-                response_text = self.meal_handler.get_meal_info(user_input)
+                with METRICS.span("meal"):
+                    response_text = self.meal_handler.get_meal_info(user_input)
+            elif intent == "공지":
+                response_text = self.notice_handler.get_notice_info(user_input)
             elif intent == "질문":
                 response_text = self.qa_handler.get_answer(user_input)
             elif intent == "인사":
@@ -62,18 +288,124 @@ class WasukBotLogic:
                 response_text = self._get_gpt_response(user_input, user_id)
             
             # 3. 대화 기록 업데이트
-            self._update_conversation_memory(user_id, user_input, response_text)
+            self._update_conversation_memory(user_id, user_input, response_text, intent)
             
             # 4. 카카오톡 응답 형식으로 변환
-            return self._format_kakao_response(response_text, intent)
+            with METRICS.span("format"):
+                response = self._format_kakao_response(response_text, intent)
+            
+            if intent in self.cacheable_intents:
+                self.response_cache.set(
+                    cache_key,
+                    (intent, response_text),
+                    expires_at=self._response_expiry(intent)
+                )
+            
+            return response
             
         except Exception as e:
-            print(f"메시지 처리 중 오류: {e}")
+            log_event(logger, "message.error", level=logging.ERROR, exc_info=True, error=str(e))
             return self._format_kakao_response(
                 "죄송합니다. 시스템에 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.",
                 "error"
             )
     
+    def process_batch(self, utterances: List[str]) -> List[Dict]:
+        """
+        여러 발화를 한 번에 처리합니다. (관리자 대시보드, QA 회귀 테스트용)
+        
+        의도별로 모아서 QA는 한 번의 TF-IDF 변환과 행렬 곱으로, 급식은 같은 캘린더 스냅샷에서 조회하고,
+        GPT 요청은 batch_gpt_concurrency개까지 동시에 보냅니다.
+        대화 기록과 응답 캐시는 사용하지 않습니다.
+        
+        Args:
+            utterances (List[str]): 사용자 발화 목록
+        
+        Returns:
+            List[Dict]: 입력 순서대로의 {"utterance", "intent", "confidence", "text"} 목록
+        """
+        with METRICS.span("intent"):
+            detections = [self.intent_detector.classify(utterance) for utterance in utterances]
+        
+        # 의도 -> 발화 번호 목록
+        groups: Dict[str, List[int]] = {}
+        for i, detection in enumerate(detections):
+            groups.setdefault(detection["intent"], []).append(i)
+            METRICS.increment("requests_total", "intent", detection["intent"])
+        
+        texts: List[Optional[str]] = [None] * len(utterances)
+        
+        meal_indices = groups.pop("급식", [])
+        if meal_indices:
+            with METRICS.span("meal"):
+                answers = self.meal_handler.get_meal_infos([utterances[i] for i in meal_indices])
+            for i, answer in zip(meal_indices, answers):
+                texts[i] = answer
+        
+        for i in groups.pop("공지", []):
+            texts[i] = self.notice_handler.get_notice_info(utterances[i])
+        
+        qa_indices = groups.pop("질문", [])
+        if qa_indices:
+            answers = self.qa_handler.get_answers([utterances[i] for i in qa_indices])
+            for i, answer in zip(qa_indices, answers):
+                texts[i] = answer
+        
+        for i in groups.pop("인사", []):
+            texts[i] = self._get_greeting_response(utterances[i])
+        
+        # 나머지(일반 대화)는 GPT 요청을 동시에 보냄
+        gpt_indices = [i for indices in groups.values() for i in indices]
+        if gpt_indices:
+            workers = max(1, min(self.batch_gpt_concurrency, len(gpt_indices)))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wasuk-batch") as pool:
+                answers = pool.map(lambda i: self._get_batch_gpt_response(utterances[i]), gpt_indices)
+                for i, answer in zip(gpt_indices, answers):
+                    texts[i] = answer
+        
+        return [
+            {
+                "utterance": utterance,
+                "intent": detection["intent"],
+                "confidence": round(detection["confidence"], 3),
+                "text": text
+            }
+            for utterance, detection, text in zip(utterances, detections, texts)
+        ]
+    
+    def _get_batch_gpt_response(self, user_input: str) -> str:
+        """배치 처리용 GPT 응답을 생성합니다. (대화 기록 없이 요청하므로 GPT 답변 캐시 사용)"""
+        try:
+            return self._get_gpt_response(user_input, BATCH_USER_ID)
+        except Exception as e:
+            log_event(logger, "batch.gpt_error", level=logging.ERROR, error=str(e))
+            return "죄송합니다. 시스템에 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+    
+    def _response_cache_key(self, user_input: str) -> tuple:
+        """정규화한 발화, 날짜, 데이터 버전으로 응답 캐시 키를 만듭니다."""
+        # 공백과 끝 문장부호 차이는 같은 질문으로 취급
+        normalized = normalize_utterance(user_input)
+        
+        # "오늘", "내일" 같은 상대 날짜가 날짜별로 다른 키가 되도록 포함
+        # 데이터가 다시 로드되면 버전이 바뀌어 이전 응답을 쓰지 않음
+        return (
+            normalized,
+            datetime.now().strftime("%Y-%m-%d"),
+            self.intent_detector.version,
+            # 아직 만들지 않은 모듈은 0 (캐시 키 계산만으로 모듈을 만들지 않음)
+            self._qa_handler.version if self._qa_handler is not _UNSET else 0,
+            self._meal_handler.version if self._meal_handler is not _UNSET else 0,
+            self._notice_handler.version if self._notice_handler is not _UNSET else 0
+        )
+    
+    def _response_expiry(self, intent: str) -> Optional[float]:
+        """의도별 캐시 만료 시각을 계산합니다. (급식은 자정에 만료)"""
+        if intent != "급식":
+            return None
+        
+        tomorrow = (datetime.now() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return tomorrow.timestamp()
+    
     def _get_greeting_response(self, user_input: str) -> str:
         """인사말에 대한 응답을 생성합니다."""
         user_input = user_input.lower()
@@ -92,30 +424,86 @@ class WasukBotLogic:
         if not self.openai_client:
             return "죄송합니다. 현재 AI 응답 기능을 사용할 수 없습니다. 학교 관련 질문이나 급식 정보를 문의해 주세요."
         
+        # 이전 대화가 없는 사용자의 질문만 캐시 대상 (맥락에 따라 답이 달라지지 않음)
+        context_free = not self.conversation_memory.has_history(user_id)
+        if context_free:
+            cached_answer = self.gpt_cache.lookup(user_input, self.qa_handler.index)
+            if cached_answer is not None:
+                METRICS.increment("gpt_calls_total", "result", "cached")
+                return cached_answer
+            
+            # 같은 질문이 동시에 여러 개 들어오면 GPT는 한 번만 호출하고 결과를 공유
+            answer, shared = self.gpt_flight.do(
+                normalize_utterance(user_input),
+                lambda: self._request_gpt(user_input, user_id, store=True)
+            )
+            if shared:
+                METRICS.increment("gpt_calls_total", "result", "shared")
+                log_event(logger, "gpt.shared", sampled=True)
+            return answer
+        
+        return self._request_gpt(user_input, user_id)
+    
+    def _request_gpt(self, user_input: str, user_id: str, store: bool = False) -> str:
+        """
+        OpenAI API를 호출해 응답을 생성합니다.
+        
+        Args:
+            user_input (str): 사용자 입력 메시지
+            user_id (str): 사용자 ID
+            store (bool): 응답을 GPT 답변 캐시에 저장할지 여부
+        
+        Returns:
+            str: GPT 응답 (동시 호출 수가 가득 찼거나 오류가 나면 안내 메시지)
+        """
+        # 동시 호출 수 제한 (가득 차면 잠시만 기다리고 안내 메시지로 응답)
+        if not self.gpt_slots.acquire(timeout=self.gpt_queue_timeout):
+            with self._stats_lock:
+                self.gpt_rejected += 1
+            METRICS.increment("gpt_calls_total", "result", "rejected")
+            log_event(logger, "gpt.rejected", level=logging.WARNING, max_concurrency=self.gpt_max_concurrency)
+            return "지금 질문이 많아 답변이 늦어지고 있어요. 잠시 후 다시 질문해 주세요."
+        
         try:
             # 대화 컨텍스트 구성
             messages = self._build_conversation_context(user_input, user_id)
             
             # GPT 응답 생성
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
+            with METRICS.span("gpt"):
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    stream=self.gpt_streaming
+                )
+                
+                if self.gpt_streaming:
+                    answer, timing = self.gpt_stream.collect(response)
+                    if timing['first_token'] is not None:
+                        METRICS.observe("gpt_first_token", timing['first_token'])
+                    log_event(logger, "gpt.stream", sampled=True, **timing)
+                else:
+                    answer = response.choices[0].message.content
+            if not answer:
+                # 첫 토큰도 받기 전에 스트림이 끝난 경우 등 (빈 말풍선은 보낼 수 없음)
+                raise ValueError("GPT 응답이 비어 있습니다.")
+            METRICS.increment("gpt_calls_total", "result", "ok")
+            if store and answer:
+                self.gpt_cache.store(user_input, answer)
             
-            return response.choices[0].message.content
+            return answer
             
         except Exception as e:
-            print(f"GPT 응답 생성 중 오류: {e}")
+            METRICS.increment("gpt_calls_total", "result", "error")
+            log_event(logger, "gpt.error", level=logging.ERROR, error=str(e))
             return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+        finally:
+            self.gpt_slots.release()
     
     def _build_conversation_context(self, user_input: str, user_id: str) -> List[Dict]:
         """대화 컨텍스트를 구성합니다."""
-        messages = [
-            {
-                "role": "system",
-                "content": """당신은 파주와석초등학교의 친근하고 도움이 되는 챗봇입니다.
+        system_prompt = """당신은 파주와석초등학교의 친근하고 도움이 되는 챗봇입니다.
 
 주요 역할:
 1. 학교 관련 질문에 친절하고 정확하게 답변
@@ -133,72 +521,22 @@ class WasukBotLogic:
 - 확실하지 않은 정보는 "학교로 문의해 주세요"라고 안내
 - 개인정보나 민감한 정보는 제공하지 않음
 - 항상 학부모님과 학생들의 입장에서 생각하여 답변"""
-            }
-        ]
         
-        # 이전 대화 기록 추가 (최대 5개)
-        if user_id in self.conversation_memory:
-            recent_conversations = self.conversation_memory[user_id][-5:]
-            for conv in recent_conversations:
-                messages.append({"role": "user", "content": conv["user"]})
-                messages.append({"role": "assistant", "content": conv["bot"]})
-        
-        # 현재 사용자 입력 추가
-        messages.append({"role": "user", "content": user_input})
+        # 토큰 예산 안에서 최근 대화(급식/인사 등은 축약)와 이전 대화 요약 추가
+        messages, tokens = self.context_builder.build(
+            system_prompt,
+            user_id,
+            self.conversation_memory.get_history(user_id),
+            user_input
+        )
+        log_event(logger, "gpt.prompt", level=logging.DEBUG, tokens=tokens, messages=len(messages))
         
         return messages
     
-    def _update_conversation_memory(self, user_id: str, user_input: str, bot_response: str):
+    def _update_conversation_memory(self, user_id: str, user_input: str, bot_response: str, intent: str = "일반"):
         """대화 기록을 업데이트합니다."""
-        if user_id not in self.conversation_memory:
-            self.conversation_memory[user_id] = []
-        
-        self.conversation_memory[user_id].append({
-            "user": user_input,
-            "bot": bot_response,
-            "timestamp": "now"  # 실제 구현시에는 datetime 사용
-        })
-        
-        # 최대 길이 제한
-        if len(self.conversation_memory[user_id]) > self.max_conversation_length:
-            self.conversation_memory[user_id] = self.conversation_memory[user_id][-self.max_conversation_length:]
-    
-    def _format_kakao_response(self, text: str, intent: str = "general") -> Dict:
-        """카카오톡 응답 형식으로 변환합니다."""
-        response = {
-            "version": "2.0",
-            "template": {
-                "outputs": [
-                    {
-                        "simpleText": {
-                            "text": text
-                        }
-                    }
-                ],
-                "quickReplies": []
-            }
-        }
-        
-        # 의도별 퀵리플라이 추가
-        quick_replies = []
-        
-        if intent == "급식":
-            quick_replies.extend([
-                {"messageText": "내일 급식 알려줘", "action": "message", "label": "내일 급식"},
-                {"messageText": "이번 주 급식 알려줘", "action": "message", "label": "이번 주 급식"}
-            ])
-        elif intent == "질문":
-            quick_replies.extend([
-                {"messageText": "급식 메뉴 알려줘", "action": "message", "label": "급식 메뉴"},
-                {"messageText": "학교 규칙 알려줘", "action": "message", "label": "학교 규칙"}
-            ])
-        else:
-            quick_replies.extend([
-                {"messageText": "급식 메뉴 알려줘", "action": "message", "label": "급식 메뉴"},
-                {"messageText": "학교 규칙 알려줘", "action": "message", "label": "학교 규칙"},
-                {"messageText": "방과후 프로그램 알려줘", "action": "message", "label": "방과후"}
-            ])
-        
-        response["template"]["quickReplies"] = quick_replies
-        
-        return response 
\ No newline at end of file
+        self.conversation_memory.append(user_id, user_input, bot_response, intent)
+    
+    def _format_kakao_response(self, text: str, intent: str = "general") -> KakaoResponse:
+        """카카오톡 응답 형식으로 변환합니다. (의도별 퀵리플라이는 kakao_response.TEMPLATES에 미리 정의)"""
+        return format_response(text, intent) 
\ No newline at end of file
@@ -44,8 +44,8 @@ def test_chatbot():
         print("-" * 30)
         
         try:
-            # 챗봇 응답 생성
-            response = bot.process_message(test_message, "test_user")
+            # 챗봇 응답 생성 (응답 틀 객체를 dict로 바꿔 출력)
+            response = bot.process_message(test_message, "test_user").to_dict()
             
             # 응답 출력
             if isinstance(response, dict) and 'template' in response:
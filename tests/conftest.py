@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트를 Python 경로에 추가 (logic 패키지 import)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
@@ -0,0 +1,54 @@
+import pytest
+from logic.wasuk_bot_logic import LAZY_COMPONENTS
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    # app은 불러올 때 챗봇을 만들므로 그 전에 설정 (재로드 스레드, 미리 준비, OpenAI 호출 끔)
+    # 구성 요소는 처음 쓸 때 환경 변수를 읽으므로 테스트가 끝날 때까지 유지
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("RELOAD_INTERVAL", "0")
+        patch.setenv("WARMUP", "0")
+        patch.setenv("OPENAI_API_KEY", "")
+        patch.setenv("SESSION_BACKEND", "memory")
+        # 미리 준비 테스트가 만드는 색인 스냅샷과 GPT 답변 캐시는 임시 디렉터리에
+        data_dir = tmp_path_factory.mktemp("data")
+        patch.setenv("QA_INDEX_DIR", str(data_dir / "qa_index"))
+        patch.setenv("GPT_CACHE_PATH", str(data_dir / "gpt_cache.db"))
+        import app
+        yield app.app.test_client()
+
+def test_test_endpoint_returns_kakao_json(client):
+    response = client.post("/test", json={"message": "안녕"})
+    
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["user_message"] == "안녕"
+    assert body["bot_response"]["version"] == "2.0"
+    text = body["bot_response"]["template"]["outputs"][0]["simpleText"]["text"]
+    assert "안녕하세요" in text
+
+def test_test_endpoint_requires_message(client):
+    response = client.post("/test", json={"message": ""})
+    assert response.status_code == 400
+def test_metrics_endpoint_renders_prometheus_text(client):
+    client.post("/test", json={"message": "안녕"})
+    response = client.get("/metrics")
+    
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    assert "# TYPE wasuk_stage_duration_seconds histogram" in text
+    assert 'wasuk_stage_duration_seconds_count{stage="intent"}' in text
+    assert "wasuk_sessions_" in text
+def test_health_reports_warm_up_readiness(client):
+    import app
+    
+    body = client.get("/health").get_json()
+    assert body["status"] == "healthy"
+    assert set(body["components"]) == set(LAZY_COMPONENTS)
+    assert body["ready"] == all(body["components"].values())
+    
+    app.bot_logic.warm_up()
+    body = client.get("/health").get_json()
+    assert body["ready"]
+    assert all(body["components"].values())
\ No newline at end of file
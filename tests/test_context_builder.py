@@ -0,0 +1,80 @@
+import pytest
+from logic.context_builder import MESSAGE_OVERHEAD_TOKENS, ContextBuilder, count_tokens
+from logic.session_store import Turn
+
+SYSTEM_PROMPT = "당신은 와석초등학교 안내 챗봇입니다."
+
+MEAL_ANSWER = "🍽️ 2025년 5월 14일 (수) 급식 메뉴\n\n" + "\n".join(f"• 메뉴{i} (1.2.5)" for i in range(10))
+NOTICE_ANSWER = "📢 관련 공지사항:\n" + "\n".join(f"{i}. 가정통신문 제목 {i} (2025.05.0{i})" for i in range(1, 6))
+
+def make_history(count):
+    """급식, 공지, 질문, 인사, 기타 턴을 번갈아 만든 대화 기록"""
+    turns = [
+        ("오늘 급식 뭐야", MEAL_ANSWER, "급식"),
+        ("공지사항 알려줘", NOTICE_ANSWER, "공지"),
+        ("전학 절차 알려줘", "전학 절차는 " + "서류 제출과 상담이 필요합니다. " * 10, "질문"),
+        ("안녕", "안녕하세요! 무엇을 도와드릴까요?", "인사"),
+        ("오늘 날씨 어때", "날씨 정보는 제공하지 않아요.", "일반"),
+    ]
+    return [Turn(*turns[i % len(turns)], timestamp=float(i)) for i in range(count)]
+
+def prompt_tokens(messages):
+    return sum(count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+@pytest.mark.parametrize("budget", [60, 120, 200, 400, 1000])
+def test_prompt_stays_within_token_budget(budget):
+    builder = ContextBuilder(token_budget=budget, recent_turns=5)
+    history = make_history(12)
+    
+    messages, tokens = builder.build(SYSTEM_PROMPT, "user", history, "방과후 신청은 어떻게 해?")
+    
+    assert tokens <= budget
+    assert prompt_tokens(messages) <= budget
+    assert messages[0]["role"] == "system"
+    assert messages[-1] == {"role": "user", "content": "방과후 신청은 어떻게 해?"}
+
+def test_tight_budget_keeps_newest_turns():
+    history = make_history(5)
+    full, _ = ContextBuilder(token_budget=10000, recent_turns=5).build(SYSTEM_PROMPT, "user", history, "질문")
+    tight, _ = ContextBuilder(token_budget=prompt_tokens(full) - 1, recent_turns=5).build(SYSTEM_PROMPT, "user", history, "질문")
+    
+    # 예산이 모자라면 오래된 턴부터 빠짐
+    assert 2 < len(tight) < len(full)
+    assert tight[1:] == full[len(full) - len(tight) + 1:]
+
+def test_meal_and_notice_turns_are_abbreviated():
+    builder = ContextBuilder(token_budget=10000, recent_turns=5)
+    messages, _ = builder.build(SYSTEM_PROMPT, "user", make_history(5), "질문")
+    contents = [message["content"] for message in messages]
+    
+    assert "(급식 메뉴를 안내함)" in contents
+    assert "(공지사항 검색 결과를 안내함)" in contents
+    assert MEAL_ANSWER not in contents
+    assert NOTICE_ANSWER not in contents
+    # 인사 턴은 통째로 생략하고, 질문 답변은 줄여서 넣음
+    assert "안녕" not in contents
+    answer = contents[contents.index("전학 절차 알려줘") + 1]
+    assert answer.endswith("…") and len(answer) <= builder.abbreviate_chars + 1
+    assert "날씨 정보는 제공하지 않아요." in contents
+
+def test_older_turns_are_summarized_without_answers():
+    builder = ContextBuilder(token_budget=10000, recent_turns=2)
+    messages, _ = builder.build(SYSTEM_PROMPT, "user", make_history(7), "질문")
+    
+    system = messages[0]["content"]
+    assert "이전 대화 요약:" in system
+    assert "- 사용자: 오늘 급식 뭐야 (급식)" in system
+    assert "- 사용자: 공지사항 알려줘 (공지)" in system
+    assert "메뉴0" not in system and "가정통신문 제목" not in system
+    # 최근 2턴만 그대로 포함
+    assert len(messages) == 2 + 2 * 2
+
+def test_summary_is_extended_incrementally():
+    builder = ContextBuilder(token_budget=10000, recent_turns=2, summary_lines=3)
+    history = make_history(10)
+    builder.build(SYSTEM_PROMPT, "user", history[:6], "질문")
+    incremental, _ = builder.build(SYSTEM_PROMPT, "user", history, "질문")
+    fresh, _ = ContextBuilder(token_budget=10000, recent_turns=2, summary_lines=3).build(SYSTEM_PROMPT, "user", history, "질문")
+    
+    assert incremental == fresh
+    assert incremental[0]["content"].count("\n- 사용자:") == 3
\ No newline at end of file
@@ -0,0 +1,126 @@
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from logic.deadline_executor import DeadlineExecutor
+
+class CallbackServer:
+    """카카오 콜백 URL 역할을 하는 테스트용 HTTP 서버 (받은 요청 본문을 보관)"""
+    
+    def __init__(self, status: int = 200, delay: float = 0.0):
+        self.received = []
+        self.arrived = threading.Event()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                time.sleep(delay)
+                self.send_response(status)
+                self.end_headers()
+                server.received.append(json.loads(body))
+                server.arrived.set()
+            
+            def log_message(self, *args):
+                pass
+        
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/callback"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+@pytest.fixture
+def callback_server():
+    server = CallbackServer()
+    yield server
+    server.close()
+
+def answer(text):
+    return {"version": "2.0", "template": {"outputs": [{"simpleText": {"text": text}}]}}
+
+def slow_process(delay):
+    def process(user_input, user_id):
+        time.sleep(delay)
+        return answer(f"{user_id}:{user_input}")
+    return process
+
+def output_text(response):
+    return response["template"]["outputs"][0]["simpleText"]["text"]
+
+def test_fast_answer_is_returned_directly(callback_server):
+    executor = DeadlineExecutor(slow_process(0), deadline=1.0)
+    try:
+        response, deferred = executor.run("급식", "user-1", callback_server.url)
+    finally:
+        executor.shutdown()
+    
+    assert not deferred
+    assert output_text(response) == "user-1:급식"
+    assert callback_server.received == []
+
+def test_late_answer_is_posted_to_callback(callback_server):
+    executor = DeadlineExecutor(slow_process(0.3), deadline=0.05)
+    try:
+        response, deferred = executor.run("급식", "user-1", callback_server.url)
+        
+        assert deferred
+        assert response["useCallback"] is True
+        assert response["data"]["text"]
+        
+        assert callback_server.arrived.wait(5)
+    finally:
+        executor.shutdown()
+    
+    assert [output_text(body) for body in callback_server.received] == ["user-1:급식"]
+    assert executor.stats() == {"deferred": 1, "timed_out": 0}
+
+def test_timeout_without_callback_url():
+    executor = DeadlineExecutor(slow_process(0.3), deadline=0.05)
+    try:
+        response, deferred = executor.run("급식", "user-1", None)
+    finally:
+        executor.shutdown()
+    
+    assert not deferred
+    assert "다시 보내 주세요" in output_text(response)
+    assert executor.stats() == {"deferred": 0, "timed_out": 1}
+
+def test_processing_error_posts_error_response(callback_server, caplog):
+    def process(user_input, user_id):
+        time.sleep(0.2)
+        raise RuntimeError("boom")
+    
+    executor = DeadlineExecutor(process, deadline=0.05)
+    with caplog.at_level(logging.ERROR, logger="wasuk.callback"):
+        try:
+            _, deferred = executor.run("급식", "user-1", callback_server.url)
+            assert deferred
+            assert callback_server.arrived.wait(5)
+        finally:
+            executor.shutdown()
+    
+    assert "오류" in output_text(callback_server.received[0])
+    assert "callback.process_error" in caplog.messages
+
+@pytest.mark.parametrize("status, delay, event", [
+    (500, 0.0, "callback.rejected"),
+    (200, 1.0, "callback.error")
+])
+def test_callback_failures_are_logged(caplog, status, delay, event):
+    server = CallbackServer(status=status, delay=delay)
+    executor = DeadlineExecutor(slow_process(0.2), deadline=0.05, callback_timeout=0.2)
+    with caplog.at_level(logging.WARNING, logger="wasuk.callback"):
+        try:
+            _, deferred = executor.run("급식", "user-1", server.url)
+            assert deferred
+        finally:
+            # 작업 스레드(콜백 전송 포함)가 끝날 때까지 기다림
+            executor.shutdown()
+            server.close()
+    
+    assert event in caplog.messages
\ No newline at end of file
@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+import pytest
+from logic import gpt_stream
+from logic.gpt_stream import StreamCollector
+
+def chunk(content):
+    """chat.completions 스트림 청크와 같은 모양의 객체"""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+class FakeStream:
+    """토큰마다 가짜 시계를 step초씩 움직이는 스트리밍 응답 (fail_after개 뒤에는 연결 오류)"""
+    
+    def __init__(self, tokens, clock=None, step=0.0, fail_after=None):
+        self.tokens = tokens
+        self.clock = clock
+        self.step = step
+        self.fail_after = fail_after
+        self.consumed = 0
+        self.closed = False
+    
+    def __iter__(self):
+        # 역할 없는 청크(choices 없음)와 빈 delta는 건너뛰어야 함
+        yield SimpleNamespace(choices=[])
+        yield chunk(None)
+        for token in self.tokens:
+            if self.fail_after is not None and self.consumed >= self.fail_after:
+                raise ConnectionError("stream reset")
+            if self.clock is not None:
+                self.clock.now += self.step
+            self.consumed += 1
+            yield chunk(token)
+    
+    def close(self):
+        self.closed = True
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def perf_counter(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(gpt_stream.time, "perf_counter", fake.perf_counter)
+    return fake
+
+def tokens(text):
+    return [text[i:i + 2] for i in range(0, len(text), 2)]
+
+ANSWER = "첫 번째 문장입니다. 두 번째 문장이에요! 세 번째 문장은 길게 이어집니다. 네 번째 문장"
+
+def test_full_answer_within_budget():
+    stream = FakeStream(tokens(ANSWER))
+    text, timing = StreamCollector(char_budget=1000, time_budget=100).collect(stream)
+    
+    assert text == ANSWER
+    assert not timing["truncated"]
+    assert timing["chars"] == len(ANSWER)
+    assert stream.closed
+
+def test_char_budget_cuts_at_sentence_end():
+    stream = FakeStream(tokens(ANSWER))
+    collector = StreamCollector(char_budget=25, time_budget=100)
+    text, timing = collector.collect(stream)
+    
+    assert text == "첫 번째 문장입니다. 두 번째 문장이에요!"
+    assert timing["truncated"]
+    # 자른 뒤에는 남은 토큰을 받지 않고 연결을 닫음
+    assert stream.consumed < len(stream.tokens)
+    assert stream.closed
+    assert collector.stats()["truncated"] == 1
+
+def test_time_budget_cuts_at_sentence_end(clock):
+    stream = FakeStream(tokens(ANSWER), clock=clock, step=0.1)
+    text, timing = StreamCollector(char_budget=1000, time_budget=0.6).collect(stream)
+    
+    assert text == "첫 번째 문장입니다."
+    assert timing["truncated"]
+    assert timing["first_token"] == pytest.approx(0.1)
+
+def test_budget_waits_for_first_sentence_end():
+    stream = FakeStream(tokens("끝나지 않는 긴 문장이 계속 이어지고 있습니다. 다음"))
+    text, timing = StreamCollector(char_budget=5, time_budget=100).collect(stream)
+    
+    assert text == "끝나지 않는 긴 문장이 계속 이어지고 있습니다."
+    assert timing["truncated"]
+
+def test_stream_ending_early_returns_received_text():
+    stream = FakeStream(tokens("짧은 답변"))
+    text, timing = StreamCollector(char_budget=300, time_budget=100).collect(stream)
+    
+    assert text == "짧은 답변"
+    assert not timing["truncated"]
+
+def test_empty_stream_returns_empty_text():
+    text, timing = StreamCollector().collect(FakeStream([]))
+    
+    assert text == ""
+    assert timing["first_token"] is None
+
+def test_stream_error_keeps_complete_sentences():
+    stream = FakeStream(tokens(ANSWER), fail_after=14)
+    text, timing = StreamCollector(char_budget=1000, time_budget=100).collect(stream)
+    
+    assert text == "첫 번째 문장입니다. 두 번째 문장이에요!"
+    assert timing["truncated"]
+    assert stream.closed
+
+def test_stream_error_before_any_sentence_raises():
+    stream = FakeStream(tokens(ANSWER), fail_after=3)
+    with pytest.raises(ConnectionError):
+        StreamCollector().collect(stream)
+    assert stream.closed
\ No newline at end of file
@@ -0,0 +1,59 @@
+import json
+import pytest
+from logic.context_builder import ABBREVIATED_INTENTS
+from logic.intent_detector import DEFAULT_LEXICON_PATH, IntentDetector
+
+def test_notice_document_names_come_from_lexicon():
+    detector = IntentDetector(lexicon_path=DEFAULT_LEXICON_PATH)
+    assert detector.detect("방과후 정산서 보여줘") == "공지"
+    assert detector.detect("2024년 집행결과") == "공지"
+    
+    # 사전 없이도 일반적인 공지 표현은 인식
+    assert IntentDetector().detect("공지사항 알려줘") == "공지"
+    assert IntentDetector().detect("방과후 정산서 보여줘") != "공지"
+
+def test_lexicon_reload_replaces_notice_keywords(tmp_path):
+    path = tmp_path / "intent_lexicon.json"
+    path.write_text(json.dumps({"공지": ["공지", "협약서"]}, ensure_ascii=False), encoding="utf-8")
+    detector = IntentDetector(lexicon_path=str(path))
+    
+    assert detector.detect("투명사회 협약서") == "공지"
+    assert detector.detect("정산서") != "공지"
+
+def test_notice_turns_are_abbreviated_in_context():
+    assert ABBREVIATED_INTENTS["공지"]
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("안녕하세요 오늘 급식 뭐예요?", "급식"),
+    ("안녕하세요 급식 알려줘", "급식"),
+    ("안녕하세요 전학 절차 궁금해요", "질문"),
+    ("고마워 공지사항도 알려줘", "공지"),
+    ("안녕하세요", "인사"),
+    ("안녕 고마워", "인사"),
+])
+def test_greeting_wins_only_without_content_intent(user_input, expected):
+    assert IntentDetector().detect(user_input) == expected
+
+def test_greeting_score_does_not_lower_content_confidence():
+    detector = IntentDetector()
+    with_greeting = detector.classify("안녕하세요 급식 메뉴")
+    assert with_greeting["scores"]["인사"] == 5
+    assert with_greeting["confidence"] == detector.get_confidence_score("안녕하세요 급식 메뉴", "급식")
+    # 비중은 급식만으로 1.0, 입력 9글자 중 5글자를 덮음
+    assert with_greeting["confidence"] == pytest.approx(5 / 9)
+
+def test_longest_keyword_coverage_wins():
+    detector = IntentDetector()
+    # 질문("학교" 2글자)보다 급식("급식 메뉴" 5글자)이 더 많이 덮음
+    result = detector.classify("학교 급식 메뉴")
+    assert result["intent"] == "급식"
+    assert result["scores"] == {"질문": 2, "급식": 5}
+    # 겹치는 키워드("급식", "급식 메뉴", "메뉴")는 한 번만 셈
+    assert [keyword for _, _, keyword in result["matches"]] == ["급식", "급식 메뉴", "메뉴"]
+
+def test_tie_goes_to_first_defined_intent():
+    # 공지("공지" 2글자)와 질문("학교" 2글자) 동점이면 먼저 정의된 공지
+    assert IntentDetector().detect("학교 공지") == "공지"
+
+def test_no_keyword_is_general():
+    assert IntentDetector().classify("날씨 어때") == {"intent": "일반", "confidence": 0.0, "matches": [], "scores": {}}
\ No newline at end of file
@@ -0,0 +1,41 @@
+import json
+from logic.kakao_response import MAX_OUTPUTS, SIMPLE_TEXT_LIMIT, format_response, split_text
+
+def outputs(response):
+    return [output["simpleText"]["text"] for output in response["template"]["outputs"]]
+
+def test_short_text_is_one_output():
+    response = format_response("안녕하세요", "급식")
+    assert outputs(json.loads(response.to_bytes())) == ["안녕하세요"]
+
+def test_long_text_splits_on_paragraphs():
+    paragraphs = [f"{i}번째 문단 " + "가" * 180 for i in range(12)]
+    chunks = split_text("\n\n".join(paragraphs))
+    
+    assert 1 < len(chunks) <= MAX_OUTPUTS
+    assert all(len(chunk) <= SIMPLE_TEXT_LIMIT for chunk in chunks)
+    assert "\n\n".join(chunks) == "\n\n".join(paragraphs)
+
+def test_overflow_is_truncated():
+    chunks = split_text("가" * (SIMPLE_TEXT_LIMIT * (MAX_OUTPUTS + 1)))
+    assert len(chunks) == MAX_OUTPUTS
+    assert chunks[-1].endswith("…")
+    assert all(len(chunk) <= SIMPLE_TEXT_LIMIT for chunk in chunks)
+
+def test_bytes_match_dict():
+    response = format_response("\n\n".join(["나" * 600] * 3), "공지")
+    decoded = json.loads(response.to_bytes())
+    assert decoded == dict(response)
+    assert len(outputs(decoded)) == 3
+
+def test_responses_do_not_share_mutable_state():
+    first = format_response("첫 답변", "급식")
+    second = format_response("두 번째 답변", "급식")
+    
+    # 읽을 때마다 새 dict를 만들므로 고쳐도 다른 응답이나 바이트에 영향이 없음
+    first["template"]["quickReplies"].clear()
+    first.to_dict()["template"]["outputs"][0]["simpleText"]["text"] = "바뀜"
+    
+    assert json.loads(first.to_bytes()) == dict(first)
+    assert outputs(first) == ["첫 답변"]
+    assert len(second["template"]["quickReplies"]) == 2
\ No newline at end of file
@@ -0,0 +1,48 @@
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+from logic.korean_text import char_analyzer, get_analyzer, normalize_question, normalize_utterance, word_analyzer
+
+@pytest.mark.parametrize("text, expected", [
+    ("방과후 신청은?", "방과후신청"),
+    ("방과후신청", "방과후신청"),
+    ("  Wi-Fi 비밀번호는!! ", "wifi비밀번호"),
+    ("학교가 어디에", "학교어디"),
+    # 조사를 떼면 한 글자만 남는 단어는 그대로
+    ("차는", "차는"),
+    ("ㅋㅋ 급식", "ㅋㅋ급식"),
+    ("?!", ""),
+])
+def test_normalize_question(text, expected):
+    assert normalize_question(text) == expected
+
+def test_normalize_utterance_keeps_particles():
+    assert normalize_utterance("  오늘   급식은?! ") == "오늘 급식은"
+    assert normalize_utterance("오늘 급식은") != normalize_utterance("오늘 급식")
+def test_char_analyzer_strips_particles_and_pads_words():
+    assert char_analyzer("급식은", max_n=2) == [" ", "급", "식", " ", " 급", "급식", "식 "]
+    # 조사를 떼면 한 글자만 남는 단어는 그대로
+    assert char_analyzer("차는", min_n=3) == [" 차는", "차는 "]
+    # 문장부호는 버리고 단어 경계를 넘는 n-그램은 만들지 않음
+    assert char_analyzer("Wi-Fi!", min_n=2, max_n=2) == [" w", "wi", "i ", " f", "fi", "i "]
+
+@pytest.mark.parametrize("text", ["방과후 신청 방법", "보건실 연락처 031 000", "Hello World"])
+def test_char_analyzer_matches_sklearn_char_wb_without_particles(text):
+    sklearn_analyzer = CountVectorizer(analyzer="char_wb", ngram_range=(1, 3)).build_analyzer()
+    assert char_analyzer(text) == sklearn_analyzer(text)
+
+@pytest.mark.parametrize("text", ["급식 시간은 언제인가요?", "보건실 연락처 031-000-0000", "a 방과후 B"])
+def test_word_analyzer_matches_sklearn_default(text):
+    sklearn_analyzer = CountVectorizer(ngram_range=(1, 2)).build_analyzer()
+    assert word_analyzer(text) == sklearn_analyzer(text)
+
+def test_char_analyzer_shares_terms_across_particles_and_spacing():
+    # 조사나 띄어쓰기가 달라도 글자 n-그램이 겹쳐야 함 (단어 분석기는 겹치지 않음)
+    assert set(char_analyzer("급식시간은")) & set(char_analyzer("급식 시간"))
+    assert not set(word_analyzer("급식시간은")) & set(word_analyzer("급식 시간"))
+    assert set(char_analyzer("방과후가")) == set(char_analyzer("방과후"))
+
+def test_get_analyzer():
+    assert get_analyzer("word") is word_analyzer
+    assert get_analyzer("char") is char_analyzer
+    with pytest.raises(ValueError):
+        get_analyzer("bpe")
\ No newline at end of file
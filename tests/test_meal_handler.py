@@ -0,0 +1,124 @@
+import sqlite3
+from datetime import datetime
+import pytest
+from logic import meal_handler
+from logic.kakao_response import MAX_OUTPUTS, SIMPLE_TEXT_LIMIT, split_text
+from logic.meal_handler import MealHandler, format_meal_display
+from logic.meal_ingest import UPSERT_SQL, ensure_schema
+from logic.school_db import PACKAGE_DB_PATH
+
+class SwappingSnapshot:
+    """self._snapshot을 읽을 때마다 다른 캘린더를 돌려주는 속성 (재로드 도중을 흉내)"""
+    
+    def __init__(self, first, second):
+        self.snapshots = [first, second]
+        self.reads = 0
+    
+    def __get__(self, handler, owner):
+        self.reads += 1
+        return self.snapshots[min(self.reads - 1, 1)]
+
+class FixedDatetime(datetime):
+    """2025년 5월 14일(수)로 고정한 datetime"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 5, 14, 9, 0)
+
+@pytest.fixture
+def handler(monkeypatch):
+    monkeypatch.setattr(meal_handler, "datetime", FixedDatetime)
+    return MealHandler(db_path=PACKAGE_DB_PATH)
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("내일 급식", ("2025-05-15", "2025-05-15", "2025-05-15")),
+    ("5월 12일부터 16일까지 급식", ("2025-05-12", "2025-05-16", "5월 12일 ~ 5월 16일")),
+    ("5/12~5/16 급식", ("2025-05-12", "2025-05-16", "5월 12일 ~ 5월 16일")),
+    ("5월 16일부터 12일까지 급식", ("2025-05-16", "2025-05-16", "2025-05-16")),
+    ("2025-05-20 급식", ("2025-05-20", "2025-05-20", "2025-05-20")),
+    ("이번 주 급식", ("2025-05-12", "2025-05-16", "이번 주")),
+    ("다음 주 화요일 급식", ("2025-05-20", "2025-05-20", "2025-05-20")),
+    ("월~수 급식", ("2025-05-12", "2025-05-14", "5월 12일 ~ 5월 14일")),
+    ("다음 달 급식", ("2025-06-01", "2025-06-30", "6월")),
+    ("3월 급식", ("2025-03-01", "2025-03-31", "3월")),
+    ("2024년 5월 급식", ("2024-05-01", "2024-05-31", "5월")),
+    ("2025.05.12 급식", ("2025-05-12", "2025-05-12", "2025-05-12")),
+    ("5.13일 급식", ("2025-05-13", "2025-05-13", "2025-05-13")),
+    # 연도 없이 "-", "."만 있으면 날짜가 아님
+    ("1-2학년 급식", None),
+    ("5-13 급식", None),
+    ("1-2학년 5월 13일 급식", ("2025-05-13", "2025-05-13", "2025-05-13")),
+    ("5월 40일 급식", None),
+    ("급식 알려줘", None),
+])
+def test_extract_date_range(handler, user_input, expected):
+    assert handler._extract_date_range(user_input) == expected
+
+def test_explicit_year_month_is_answered_in_another_year(monkeypatch):
+    class NextYear(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2026, 5, 14, 9, 0)
+    
+    monkeypatch.setattr(meal_handler, "datetime", NextYear)
+    answer = MealHandler(db_path=PACKAGE_DB_PATH).get_meal_info("2025년 5월 급식")
+    assert answer.startswith("📋 5월 급식 메뉴입니다:")
+
+def test_week_range_lists_every_weekday(handler):
+    answer = handler.get_meal_info("이번 주 급식")
+    assert answer.startswith("📋 이번 주 급식 메뉴입니다:")
+    assert answer.count("📅") == 5
+
+def test_long_range_fits_kakao_outputs(handler):
+    answer = handler.get_meal_info("3월 4일부터 7월 30일까지 급식")
+    chunks = split_text(answer, max_outputs=None)
+    
+    assert len(chunks) <= MAX_OUTPUTS
+    assert all(len(chunk) <= SIMPLE_TEXT_LIMIT for chunk in chunks)
+    assert "급식\"으로 물어봐 주세요." in answer
+
+def test_month_range_splits_into_outputs(handler):
+    answer = handler.get_meal_info("5월 급식")
+    assert len(answer) > SIMPLE_TEXT_LIMIT
+    assert 1 < len(split_text(answer)) <= MAX_OUTPUTS
+    assert "물어봐 주세요" not in answer
+
+def make_meal_db(path, dates):
+    conn = sqlite3.connect(path)
+    ensure_schema(conn)
+    conn.executemany(UPSERT_SQL, [
+        (date, "중식", "잡곡밥\n미역국", format_meal_display(date, "중식", "잡곡밥\n미역국"))
+        for date in dates
+    ])
+    conn.commit()
+    conn.close()
+
+def test_range_lookup_sees_reloaded_calendar(tmp_path, monkeypatch):
+    monkeypatch.setattr(meal_handler, "datetime", FixedDatetime)
+    path = str(tmp_path / "meals.db")
+    make_meal_db(path, ["2025-05-12", "2025-05-13"])
+    handler = MealHandler(db_path=path, refresh_interval=0)
+    assert [date for date, _ in handler.get_meal_range("2025-05-01", "2025-05-31")] == ["2025-05-12", "2025-05-13"]
+    
+    make_meal_db(path, ["2025-05-14"])
+    assert handler.reload_if_changed()
+    assert [date for date, _ in handler.get_meal_range("2025-05-01", "2025-05-31")] == [
+        "2025-05-12", "2025-05-13", "2025-05-14"
+    ]
+    assert handler.get_meal_infos(["5월 14일 급식"])[0] == format_meal_display("2025-05-14", "중식", "잡곡밥\n미역국")
+
+def test_range_lookup_reads_one_snapshot(tmp_path, monkeypatch):
+    # 재로드로 캘린더가 통째로 바뀌어도 조회 하나는 처음 읽은 캘린더만 사용
+    first, second = str(tmp_path / "first.db"), str(tmp_path / "second.db")
+    make_meal_db(first, ["2025-05-12", "2025-05-13"])
+    make_meal_db(second, ["2025-05-20"])
+    handler = MealHandler(db_path=first, refresh_interval=3600)
+    current = handler._snapshot
+    replacement = MealHandler(db_path=second, refresh_interval=3600)._snapshot
+    
+    del handler.__dict__["_snapshot"]
+    swapping = SwappingSnapshot(current, replacement)
+    monkeypatch.setattr(MealHandler, "_snapshot", swapping, raising=False)
+    
+    assert [date for date, _ in handler.get_meal_range("2025-05-01", "2025-05-31")] == ["2025-05-12", "2025-05-13"]
+    assert swapping.reads == 1
\ No newline at end of file
@@ -0,0 +1,75 @@
+import json
+import sqlite3
+from logic.meal_handler import format_meal_display
+from logic.meal_ingest import ensure_schema, ingest, normalize_menu, parse_row
+
+def make_old_meal_db(path):
+    """date만 UNIQUE이고 안내 문구 열이 없는 예전 meals 테이블을 만듭니다."""
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE meals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL UNIQUE,
+            meal_type TEXT,
+            menu TEXT,
+            image_url TEXT
+        )
+    ''')
+    conn.executemany('INSERT INTO meals (id, date, meal_type, menu, image_url) VALUES (?, ?, ?, ?, ?)', [
+        (7, "2025-05-12", "중식", "현미밥\n떡국", "/images/0512.jpg"),
+        (8, "2025-05-13", None, "잡곡밥\n미역국", None),
+        (9, "2025-05-14", "중식", None, None),
+    ])
+    conn.commit()
+    conn.close()
+
+def test_ensure_schema_migrates_old_table(tmp_path):
+    path = str(tmp_path / "old.db")
+    make_old_meal_db(path)
+    
+    conn = sqlite3.connect(path)
+    ensure_schema(conn)
+    conn.commit()
+    
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(meals)')}
+    assert {"display_text", "meal_type"} <= columns
+    rows = conn.execute('SELECT id, date, meal_type, menu, image_url, display_text FROM meals ORDER BY id').fetchall()
+    assert rows == [
+        (7, "2025-05-12", "중식", "현미밥\n떡국", "/images/0512.jpg", format_meal_display("2025-05-12", "중식", "현미밥\n떡국")),
+        (8, "2025-05-13", "중식", "잡곡밥\n미역국", None, format_meal_display("2025-05-13", "중식", "잡곡밥\n미역국")),
+        (9, "2025-05-14", "중식", None, None, None),
+    ]
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'meals_old'").fetchone() is None
+    
+    # 같은 날짜에 다른 식사 종류를 넣을 수 있고, 두 번 호출해도 그대로
+    conn.execute("INSERT INTO meals (date, meal_type, menu) VALUES ('2025-05-12', '석식', '비빔밥')")
+    ensure_schema(conn)
+    assert conn.execute('SELECT COUNT(*) FROM meals').fetchone()[0] == 4
+    conn.close()
+
+def test_ingest_upserts_into_migrated_table(tmp_path):
+    path = str(tmp_path / "old.db")
+    make_old_meal_db(path)
+    export = tmp_path / "meals.json"
+    export.write_text(json.dumps({"mealServiceDietInfo": [
+        {"head": [{"list_total_count": 3}]},
+        {"row": [
+            {"MLSV_YMD": "20250512", "MMEAL_SC_NM": "중식", "DDISH_NM": "현미밥<br/>양지 조랭이떡국 (1.5.6.16)"},
+            {"MLSV_YMD": "20250512", "MMEAL_SC_CODE": "3", "DDISH_NM": "비빔밥<br/> <br/>"},
+            {"MLSV_YMD": "", "MMEAL_SC_NM": "중식", "DDISH_NM": "빈 날짜"},
+        ]}
+    ]}, ensure_ascii=False), encoding="utf-8")
+    
+    counts = ingest([str(export)], db_path=path, batch_size=1)
+    
+    assert counts == {"read": 3, "upserted": 2, "skipped": 1}
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT meal_type, menu, image_url FROM meals WHERE date = '2025-05-12' ORDER BY meal_type").fetchall()
+    conn.close()
+    # 기존 행은 메뉴만 바뀌고 사진 경로는 유지
+    assert rows == [("석식", "비빔밥", None), ("중식", "현미밥\n양지 조랭이떡국 (1.5.6.16)", "/images/0512.jpg")]
+
+def test_parse_row_accepts_korean_columns():
+    parsed = parse_row({"급식일자": "2025.05.15", "식사명": "조식", "요리명": "토스트<br>우유"})
+    assert parsed == ("2025-05-15", "조식", "토스트\n우유", format_meal_display("2025-05-15", "조식", "토스트\n우유"))
+    assert normalize_menu("  김치&amp;볶음밥 <BR/>\n  국  ") == "김치&볶음밥\n국"
\ No newline at end of file
@@ -0,0 +1,80 @@
+import re
+import pytest
+from logic.metrics import Metrics
+
+# Prometheus 텍스트 형식의 표본 줄: 이름{라벨="값",...} 값
+SAMPLE_PATTERN = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(?:[a-zA-Z_]\w*="(?:[^"\\\n]|\\[\\"n])*",?)*\})? (\S+)$')
+
+def samples(text):
+    """주석이 아닌 줄을 (이름, 라벨 부분, 값)으로 나눕니다. (형식이 틀린 줄이 있으면 실패)"""
+    assert text.endswith("\n")
+    result = []
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE_PATTERN.match(line)
+        assert match, line
+        result.append((match.group(1), match.group(2) or "", float(match.group(3))))
+    return result
+
+def test_histogram_buckets_are_cumulative():
+    metrics = Metrics(buckets=(0.01, 0.1, 1.0))
+    for seconds in (0.005, 0.01, 0.05, 0.5, 3.0):
+        metrics.observe("qa_similar", seconds)
+    
+    values = {(name, labels): value for name, labels, value in samples(metrics.render())}
+    prefix = "wasuk_stage_duration_seconds"
+    # 경계값과 같은 값은 그 구간에 포함 (le = 이하)
+    assert values[(f"{prefix}_bucket", '{stage="qa_similar",le="0.01"}')] == 2
+    assert values[(f"{prefix}_bucket", '{stage="qa_similar",le="0.1"}')] == 3
+    assert values[(f"{prefix}_bucket", '{stage="qa_similar",le="1.0"}')] == 4
+    assert values[(f"{prefix}_bucket", '{stage="qa_similar",le="+Inf"}')] == 5
+    assert values[(f"{prefix}_count", '{stage="qa_similar"}')] == 5
+    assert values[(f"{prefix}_sum", '{stage="qa_similar"}')] == pytest.approx(3.565)
+
+def test_span_records_even_when_block_raises():
+    metrics = Metrics()
+    with pytest.raises(ValueError):
+        with metrics.span("gpt"):
+            raise ValueError
+    assert 'wasuk_stage_duration_seconds_count{stage="gpt"} 1' in metrics.render()
+
+def test_counters_and_gauges():
+    metrics = Metrics()
+    metrics.increment("requests_total", "intent", "급식")
+    metrics.increment("requests_total", "intent", "급식")
+    metrics.increment("requests_total", "intent", "공지", amount=3)
+    
+    text = metrics.render({"response_cache": {"hits": 7, "hit_rate": 0.5, "enabled": True, "backend": "memory"}})
+    assert "# TYPE wasuk_requests_total counter" in text
+    assert 'wasuk_requests_total{intent="급식"} 2' in text
+    assert 'wasuk_requests_total{intent="공지"} 3' in text
+    assert "wasuk_response_cache_hits 7" in text
+    assert "wasuk_response_cache_hit_rate 0.5" in text
+    # 불리언과 문자열 값은 게이지로 내보내지 않음
+    assert "enabled" not in text and "backend" not in text
+    samples(text)
+
+@pytest.mark.parametrize("value, escaped", [
+    ('say "hi"', 'say \\"hi\\"'),
+    ("back\\slash", "back\\\\slash"),
+    ("two\nlines", "two\\nlines"),
+    ('\\"\n', '\\\\\\"\\n'),
+])
+def test_label_values_are_escaped(value, escaped):
+    metrics = Metrics()
+    metrics.increment("requests_total", "intent", value)
+    metrics.observe(value, 0.001)
+    
+    text = metrics.render()
+    assert f'wasuk_requests_total{{intent="{escaped}"}} 1' in text
+    assert f'wasuk_stage_duration_seconds_count{{stage="{escaped}"}} 1' in text
+    # 이스케이프하지 않으면 줄이 나뉘거나 따옴표가 어긋나 형식 검사에서 실패
+    samples(text)
+
+def test_reset_clears_everything():
+    metrics = Metrics()
+    metrics.observe("intent", 0.001)
+    metrics.increment("requests_total", "intent", "급식")
+    metrics.reset()
+    assert samples(metrics.render()) == []
\ No newline at end of file
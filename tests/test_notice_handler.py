@@ -0,0 +1,68 @@
+import sqlite3
+import threading
+import pytest
+from logic.notice_handler import NoticeHandler
+
+NOTICES = [
+    ("방과후학교 수강신청 안내", "2학기 방과후학교 프로그램 수강신청을 받습니다.", "2025.08.20"),
+    ("급식 알레르기 유발 식품 안내", "방과후학교 간식에도 알레르기 표시를 합니다.", "2025.08.25"),
+    ("학부모 만족도 조사 안내", "교육활동 만족도 조사에 참여해 주세요.", "2024.06.10"),
+    ("학부모 만족도 조사 결과", "교육활동 만족도 조사 결과를 알려 드립니다.", "2025.06.10"),
+]
+
+def make_notice_db(path, notices):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS notices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT,
+            url TEXT,
+            created_at TEXT,
+            tags TEXT,
+            category TEXT
+        )
+    ''')
+    conn.executemany(
+        'INSERT INTO notices (title, content, url, created_at) VALUES (?, ?, ?, ?)',
+        [(title, content, f"https://example.com/{i}", created_at) for i, (title, content, created_at) in enumerate(notices)]
+    )
+    conn.commit()
+    conn.close()
+
+@pytest.fixture
+def handler(tmp_path):
+    path = str(tmp_path / "notices.db")
+    make_notice_db(path, NOTICES)
+    handler = NoticeHandler(db_path=path)
+    if not handler._index[1]:
+        pytest.skip("SQLite에 FTS5 트라이그램 토크나이저가 없음")
+    return handler
+
+def test_title_match_outranks_content_match(handler):
+    titles = [notice.title for notice in handler.search("방과후학교 신청")]
+    assert titles[:2] == ["방과후학교 수강신청 안내", "급식 알레르기 유발 식품 안내"]
+
+def test_newer_notice_wins_equal_relevance(handler):
+    titles = [notice.title for notice in handler.search("만족도 조사")]
+    assert titles[:2] == ["학부모 만족도 조사 결과", "학부모 만족도 조사 안내"]
+
+def test_two_char_term_uses_substring_match(handler):
+    assert [notice.title for notice in handler.search("급식 공지")] == ["급식 알레르기 유발 식품 안내"]
+
+def test_unmatched_query_falls_back_to_latest(handler):
+    answer = handler.get_notice_info("수영대회 공지 알려줘")
+    assert answer.startswith("📢 관련된 공지사항을 찾지 못해 최근 공지사항을 안내해 드려요:")
+    assert "급식 알레르기 유발 식품 안내 (2025.08.25)" in answer
+
+def test_reload_indexes_new_notice_for_every_thread(handler):
+    make_notice_db(handler.db_path, [("운동회 일정 안내", "가을 운동회를 엽니다.", "2025.09.01")])
+    assert handler.reload_if_changed()
+    
+    results = []
+    thread = threading.Thread(target=lambda: results.append(handler.search("운동회")))
+    thread.start()
+    thread.join()
+    
+    assert [notice.title for notice in handler.search("운동회")] == ["운동회 일정 안내"]
+    assert [notice.title for notice in results[0]] == ["운동회 일정 안내"]
\ No newline at end of file
@@ -0,0 +1,44 @@
+import json
+from logic.paraphrase_table import build_table, load_paraphrases, paraphrase
+
+def test_paraphrase_by_ending():
+    assert paraphrase("방과후 신청 있나요?")[:2] == ["방과후 신청 있어요", "방과후 신청 있어"]
+    # 받침에 따라 "이야"/"야"
+    assert paraphrase("급식비는 얼마인가요?")[0] == "급식비는 얼마야"
+    assert paraphrase("개학일이 언제인가요?")[0] == "개학일이 언제야"
+    assert paraphrase("보건실이 몇 층 교실인가요?")[0] == "보건실이 몇 층 교실이야"
+    assert paraphrase("학사일정") == ["학사일정 알려줘", "학사일정 알려주세요", "학사일정 궁금해요"]
+    # 물음표로 끝나는 명사형 질문은 바꾸지 않음
+    assert paraphrase("학사일정?") == []
+
+def test_build_table_drops_phrases_matching_another_question():
+    # 두 질문이 서로의 말투라 어느 질문인지 모호한 표현만 남게 됨
+    table = build_table(["전학 서류 있나요?", "전학 서류 있어요?", "학사일정"])
+    assert "전학 서류 있나요?" not in table
+    assert "전학 서류 있어요?" not in table
+    assert table["학사일정"] == ["학사일정 알려줘", "학사일정 알려주세요", "학사일정 궁금해요"]
+
+def test_build_table_drops_phrases_shared_by_two_questions():
+    pairs = [
+        {"utterance": "체험학습 신청", "question": "현장체험학습 신청서는 어디 있나요?"},
+        {"utterance": "체험학습 신청!", "question": "체험학습 보고서는 어디 있나요?"},
+        {"utterance": "학사 일정표", "question": "학사일정"},
+        {"utterance": "학사일정 알려줘요!", "question": "학사일정"},
+        {"utterance": "무시되는 발화", "question": "없는 질문"},
+    ]
+    table = build_table(["현장체험학습 신청서는 어디 있나요?", "체험학습 보고서는 어디 있나요?", "학사일정"], pairs)
+    
+    assert all("체험학습 신청" not in phrases for phrases in table.values())
+    assert all("체험학습 신청!" not in phrases for phrases in table.values())
+    assert table["학사일정"][-2:] == ["학사 일정표", "학사일정 알려줘요!"]
+    assert "없는 질문" not in table
+
+def test_build_table_dedupes_by_normalized_form():
+    pairs = [{"utterance": "학사일정  알려줘!", "question": "학사일정"}]
+    assert build_table(["학사일정"], pairs)["학사일정"] == ["학사일정 알려줘", "학사일정 알려주세요", "학사일정 궁금해요"]
+
+def test_load_paraphrases(tmp_path):
+    path = tmp_path / "paraphrases.json"
+    path.write_text(json.dumps({"학사일정": ["학사일정 알려줘"]}, ensure_ascii=False), encoding="utf-8")
+    assert load_paraphrases(str(path)) == {"학사일정": ["학사일정 알려줘"]}
+    assert load_paraphrases(str(tmp_path / "missing.json")) == {}
\ No newline at end of file
@@ -0,0 +1,31 @@
+from logic.qa_handler import QAHandler
+from logic.qa_index import QAIndex
+from logic.school_db import PACKAGE_DB_PATH
+
+class SwappingIndex:
+    """self.index를 읽을 때마다 다른 색인을 돌려주는 속성 (재로드 도중을 흉내)"""
+    
+    def __init__(self, first, second):
+        self.indexes = [first, second]
+        self.reads = 0
+    
+    def __get__(self, handler, owner):
+        self.reads += 1
+        return self.indexes[min(self.reads - 1, 1)]
+
+def test_batch_uses_one_index_for_every_stage(monkeypatch):
+    handler = QAHandler(db_path=PACKAGE_DB_PATH, index_dir=None, paraphrase_path="")
+    current = handler.index
+    # 재로드 뒤의 색인은 행이 하나도 없다고 가정
+    empty = QAIndex.build([("없는 질문", "없는 답변", "", "")], current.analyzer, handler.max_features)
+    
+    user_input = "전학 서류"
+    expected = handler.find_matches([user_input])
+    assert expected[0][1] == "keyword"
+    
+    del handler.__dict__["index"]
+    swapping = SwappingIndex(current, empty)
+    monkeypatch.setattr(QAHandler, "index", swapping, raising=False)
+    
+    assert handler.find_matches([user_input]) == expected
+    assert swapping.reads == 1
\ No newline at end of file
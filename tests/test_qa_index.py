@@ -0,0 +1,98 @@
+import os
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from logic.korean_text import get_analyzer
+from logic.qa_handler import QAHandler
+from logic.qa_index import QAIndex
+from logic.retrieval import SubstringIndex
+from logic.school_db import PACKAGE_DB_PATH
+
+ROWS = [
+    ("급식 시간은 언제인가요?", "점심은 12시 10분부터입니다.", "", "초등"),
+    ("보건실 연락처", "보건실 번호는 031-000-0000입니다.", "", "초등"),
+    ("방과후 신청은 어떻게 하나요?", "가정통신문을 확인해 주세요.", "", "초등"),
+]
+
+def test_snapshot_round_trip(tmp_path):
+    built = QAIndex.build(ROWS, "char", 5000)
+    built.save(str(tmp_path))
+    
+    loaded = QAIndex.load(str(tmp_path), ROWS, "char", 5000)
+    assert loaded is not None
+    assert loaded.key == built.key
+    assert loaded.vocabulary == built.vocabulary
+    # 메모리 매핑으로 읽은 배열이 학습한 값과 같아야 함
+    assert isinstance(loaded.idf, np.memmap)
+    np.testing.assert_allclose(loaded.idf, built.idf)
+    
+    queries = ["급식 몇 시", "보건실 전화번호"]
+    np.testing.assert_allclose(loaded.transform(queries).toarray(), built.transform(queries).toarray())
+    np.testing.assert_allclose(loaded.vectors.toarray(), built.vectors.toarray())
+
+def test_snapshot_key_changes_with_rows(tmp_path):
+    QAIndex.build(ROWS, "char", 5000).save(str(tmp_path))
+    assert QAIndex.load(str(tmp_path), ROWS[:2], "char", 5000) is None
+    assert QAIndex.load(str(tmp_path), ROWS, "word", 5000) is None
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    built = QAIndex.build(ROWS, "char", 5000)
+    built.save(str(tmp_path))
+    os.remove(os.path.join(str(tmp_path), built.key, "idf.npy"))
+    assert QAIndex.load(str(tmp_path), ROWS, "char", 5000) is None
+
+def test_unwritable_snapshot_dir_keeps_serving():
+    handler = QAHandler(db_path=PACKAGE_DB_PATH, index_dir="/proc/nonexistent/qa_index", paraphrase_path="")
+    assert handler.index is not None
+    assert handler.find_matches(["보건실 연락처"])[0]
+def _real_rows(tmp_path):
+    handler = QAHandler(db_path=PACKAGE_DB_PATH, index_dir=str(tmp_path), paraphrase_path="")
+    return handler.qa_data
+
+QUERIES = ["급식 시간이 언제야", "보건실 전화번호 알려줘", "방과후 신청 방법", "졸업식은 어디서 해요", "xyz"]
+
+@pytest.mark.parametrize("analyzer", ["word", "char"])
+def test_transform_matches_tfidf_vectorizer(tmp_path, analyzer):
+    rows = _real_rows(tmp_path)
+    index = QAIndex.build(rows, analyzer, 1000)
+    
+    # 이전 경로: 요청마다 학습된 TfidfVectorizer로 변환
+    vectorizer = TfidfVectorizer(max_features=1000, analyzer=get_analyzer(analyzer))
+    vectorizer.fit([qa[0] for qa in rows])
+    
+    assert index.vocabulary == vectorizer.vocabulary_
+    np.testing.assert_allclose(index.transform(QUERIES).toarray(), vectorizer.transform(QUERIES).toarray())
+
+@pytest.mark.parametrize("analyzer", ["word", "char"])
+def test_inverted_index_scores_match_cosine_similarity(tmp_path, analyzer):
+    rows = _real_rows(tmp_path)
+    index = QAIndex.build(rows, analyzer, 1000)
+    
+    vectorizer = TfidfVectorizer(max_features=1000, analyzer=get_analyzer(analyzer))
+    doc_vectors = vectorizer.fit_transform([qa[0] for qa in rows])
+    
+    for query in QUERIES:
+        query_vector = vectorizer.transform([query])
+        expected = cosine_similarity(query_vector, doc_vectors)[0]
+        
+        results = index.retriever.search(index.transform([query]), k=5)
+        # 역색인은 단어를 공유하는 문서만 돌려주므로 0점 문서는 빠짐
+        top = sorted((i for i in range(len(rows)) if expected[i] > 0), key=lambda i: (-expected[i], i))[:5]
+        assert [doc for doc, _ in results] == top
+        np.testing.assert_allclose([score for _, score in results], expected[top])
+
+def test_loaded_snapshot_searches_like_built_index(tmp_path):
+    rows = _real_rows(tmp_path / "handler")
+    built = QAIndex.build(rows, "char", 1000)
+    built.save(str(tmp_path / "snapshots"))
+    loaded = QAIndex.load(str(tmp_path / "snapshots"), rows, "char", 1000)
+    assert loaded is not None
+    
+    for query in QUERIES:
+        assert loaded.retriever.search(loaded.transform([query]), k=5) == built.retriever.search(built.transform([query]), k=5)
+
+@pytest.mark.parametrize("keyword", ["급", "급식", "보건실", "신청은", "없는키워드", ""])
+def test_substring_index_matches_linear_scan(keyword):
+    texts = [qa[0].lower() for qa in ROWS] + ["급식 메뉴", "급", "식급식"]
+    assert SubstringIndex(texts).find(keyword) == [i for i, text in enumerate(texts) if keyword in text]
\ No newline at end of file
@@ -0,0 +1,124 @@
+import json
+import os
+import sqlite3
+import threading
+from logic.intent_detector import IntentDetector
+from logic.qa_handler import QAHandler
+from logic.reloader import Reloader
+
+def make_qa_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS qa_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            question TEXT, answer TEXT, additional_answer TEXT, category TEXT
+        )
+    ''')
+    conn.execute('DELETE FROM qa_data')
+    conn.executemany(
+        'INSERT INTO qa_data (question, answer, additional_answer, category) VALUES (?, ?, ?, ?)',
+        rows
+    )
+    conn.commit()
+    conn.close()
+
+ROWS = [
+    ("보건실 연락처", "보건실 번호는 031-000-0000입니다.", "", "초등"),
+    ("방과후 신청 방법", "가정통신문을 확인해 주세요.", "", "초등"),
+]
+
+class Component:
+    """reload_if_changed() 결과를 정해 둔 가짜 모듈"""
+    
+    def __init__(self, result=False, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.called = threading.Event()
+    
+    def reload_if_changed(self):
+        self.calls += 1
+        self.called.set()
+        if self.error:
+            raise self.error
+        return self.result
+
+def test_qa_reload_swaps_in_a_complete_index(tmp_path):
+    path = str(tmp_path / "qa.db")
+    make_qa_db(path, ROWS)
+    handler = QAHandler(db_path=path, index_dir=None, paraphrase_path="")
+    old_index, old_version = handler.index, handler.version
+    assert not handler.reload_if_changed()
+    
+    make_qa_db(path, ROWS + [("도서관 운영 시간", "도서관은 오후 5시까지 엽니다.", "", "초등")])
+    assert handler.reload_if_changed()
+    
+    # 새 색인은 새 행을 모두 담고, 이전 색인은 그대로 남아 조회 중인 요청이 끝까지 쓸 수 있음
+    assert handler.index is not old_index
+    assert handler.version == old_version + 1
+    assert len(handler.qa_data) == 3
+    assert old_index.rows == ROWS
+    assert handler.find_match("도서관 운영 시간")[0][0] == "도서관 운영 시간"
+
+def test_qa_reload_failure_keeps_old_index(tmp_path):
+    path = str(tmp_path / "qa.db")
+    make_qa_db(path, ROWS)
+    handler = QAHandler(db_path=path, index_dir=None, paraphrase_path="")
+    old_index, old_version = handler.index, handler.version
+    
+    conn = sqlite3.connect(path)
+    conn.execute('DROP TABLE qa_data')
+    conn.commit()
+    conn.close()
+    
+    assert not handler.reload_if_changed()
+    assert handler.index is old_index
+    assert handler.version == old_version
+    assert handler.find_match("보건실 연락처")[0][0] == "보건실 연락처"
+
+def test_broken_lexicon_keeps_previous_keywords(tmp_path):
+    path = tmp_path / "intent_lexicon.json"
+    path.write_text(json.dumps({"공지": ["공지", "협약서"]}, ensure_ascii=False), encoding="utf-8")
+    detector = IntentDetector(lexicon_path=str(path))
+    version = detector.version
+    
+    path.write_text('{"공지": ["공지", ', encoding="utf-8")
+    os.utime(path, (1, 1))
+    assert not detector.reload_if_changed()
+    assert detector.version == version
+    assert detector.detect("투명사회 협약서") == "공지"
+    
+    # 파일을 고치면 다음 확인에서 반영
+    path.write_text(json.dumps({"공지": ["공지", "정산서"]}, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, (2, 2))
+    assert detector.reload_if_changed()
+    assert detector.version == version + 1
+    assert detector.detect("정산서") == "공지"
+    assert detector.detect("협약서") != "공지"
+
+def test_reload_now_survives_failing_component():
+    reloader = Reloader(interval=0)
+    components = [Component(error=RuntimeError("boom")), Component(result=True), Component()]
+    for component in components:
+        reloader.register(component)
+    
+    assert reloader.reload_now() == 1
+    assert [component.calls for component in components] == [1, 1, 1]
+
+def test_reloader_thread_runs_until_stopped():
+    disabled = Reloader(interval=0)
+    disabled.start()
+    assert disabled._thread is None
+    
+    reloader = Reloader(interval=0.01)
+    component = Component(error=RuntimeError("boom"))
+    reloader.register(component)
+    reloader.start()
+    try:
+        # 예외가 나도 스레드는 계속 돎
+        assert component.called.wait(5)
+        component.called.clear()
+        assert component.called.wait(5)
+    finally:
+        reloader.stop()
+    assert reloader._thread is None
\ No newline at end of file
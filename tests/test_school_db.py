@@ -0,0 +1,78 @@
+import gc
+import sqlite3
+import threading
+from logic.school_db import ThreadLocalConnections
+
+class TrackingFactory:
+    """만든 연결을 모두 기억하는 연결 생성 함수"""
+    
+    def __init__(self):
+        self.created = []
+    
+    def __call__(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.created.append(conn)
+        return conn
+
+def is_closed(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("SELECT 1")
+    except sqlite3.ProgrammingError:
+        return True
+    return False
+
+def run_in_thread(target):
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+
+def test_same_thread_reuses_connection():
+    pool = ThreadLocalConnections(TrackingFactory())
+    assert pool.get() is pool.get()
+    assert len(pool) == 1
+
+def test_connection_closed_when_thread_exits():
+    factory = TrackingFactory()
+    pool = ThreadLocalConnections(factory)
+    
+    for _ in range(5):
+        run_in_thread(lambda: pool.get().execute("SELECT 1"))
+    gc.collect()
+    
+    assert len(factory.created) == 5
+    assert all(is_closed(conn) for conn in factory.created)
+    assert len(pool) == 0
+
+def test_adopt_replaces_and_closes_previous_connection():
+    factory = TrackingFactory()
+    pool = ThreadLocalConnections(factory)
+    first = pool.get()
+    second = factory()
+    
+    assert pool.adopt(second) is second
+    assert pool.get() is second
+    assert is_closed(first)
+    assert len(pool) == 1
+
+def test_close_closes_live_connections():
+    factory = TrackingFactory()
+    pool = ThreadLocalConnections(factory)
+    started, release = threading.Event(), threading.Event()
+    
+    def hold():
+        pool.get()
+        started.set()
+        release.wait()
+    
+    thread = threading.Thread(target=hold)
+    thread.start()
+    started.wait()
+    main_conn = pool.get()
+    
+    pool.close()
+    release.set()
+    thread.join()
+    
+    assert is_closed(main_conn)
+    assert all(is_closed(conn) for conn in factory.created)
+    assert len(pool) == 0
\ No newline at end of file
@@ -0,0 +1,96 @@
+import pytest
+from logic.qa_index import QAIndex
+from logic.semantic_cache import SemanticCache
+
+ROWS = [
+    ("O학년 하교 시간 몇시인가요?", "학년별 시정표를 확인해 주세요.", "", "초등"),
+    ("아이가 아파서 결석해요", "담임 선생님께 알려 주세요.", "", "초등"),
+    ("방과후 신청은 어떻게 하나요?", "가정통신문을 확인해 주세요.", "", "초등"),
+]
+
+@pytest.fixture
+def index():
+    return QAIndex.build(ROWS, "char", 5000)
+
+@pytest.mark.parametrize("cached, query", [
+    ("3학년 하교 시간 알려줘", "5학년 하교 시간 알려줘"),
+    ("아이가 열이 안 나요", "아이가 열이 나요"),
+    ("선생님이 좋대요", "선생님이 싫대요"),
+])
+def test_unknown_words_must_match(index, cached, query):
+    cache = SemanticCache(threshold=0.85)
+    cache.store(cached, "답변")
+    assert cache.lookup(query, index) is None
+
+def test_similar_question_hits(index):
+    cache = SemanticCache(threshold=0.85)
+    cache.store("방과후 신청은 어떻게 하나요", "답변")
+    assert cache.lookup("방과후 신청 어떻게 하나요?", index) == "답변"
+    assert cache.stats()["hits"] == 1
+
+def test_store_appends_rows_without_recomputing(index, monkeypatch):
+    cache = SemanticCache(threshold=0.85)
+    cache.store("방과후 신청은 어떻게 하나요", "방과후")
+    cache.lookup("아무 질문", index)
+    
+    weighed = []
+    original = cache._weigh
+    monkeypatch.setattr(cache, "_weigh", lambda text, *args, **kwargs: weighed.append(text) or original(text, *args, **kwargs))
+    cache.store("아이가 아파서 결석해요", "결석")
+    assert cache.lookup("아이 아파서 결석해요", index) == "결석"
+    # 새 질문과 조회한 질문만 계산
+    assert weighed == ["아이가 아파서 결석해요", "아이 아파서 결석해요"]
+    assert cache.lookup("방과후 신청 어떻게 하나요?", index) == "방과후"
+
+def test_evicted_rows_are_skipped(index):
+    cache = SemanticCache(threshold=0.85, max_size=1)
+    cache.store("방과후 신청은 어떻게 하나요", "방과후")
+    cache.lookup("아무 질문", index)
+    cache.store("아이가 아파서 결석해요", "결석")
+    assert cache.lookup("방과후 신청 어떻게 하나요?", index) is None
+    assert cache.lookup("아이 아파서 결석해요", index) == "결석"
+
+def test_index_change_recomputes(index):
+    cache = SemanticCache(threshold=0.85)
+    cache.store("방과후 신청은 어떻게 하나요", "방과후")
+    assert cache.lookup("방과후 신청 어떻게 하나요?", index) == "방과후"
+    
+    reloaded = QAIndex.build(ROWS[:2], "char", 5000)
+    assert cache.lookup("방과후 신청 어떻게 하나요?", reloaded) == "방과후"
+
+def test_vocabulary_stays_bounded_under_eviction(index):
+    cache = SemanticCache(threshold=0.85, max_size=4)
+    widths = []
+    for i in range(200):
+        cache.store(f"질문{i}번 알림장{i * 7}호 숙제{i * 13}", f"답변{i}")
+        # 정확히 같은 질문이 아니어서 벡터 비교까지 감
+        assert cache.lookup("방과후 신청은 어떻게 하나요", index) is None
+        widths.append(len(cache._vocabulary))
+    
+    # 남은 항목과 아직 압축하지 않은 행의 단어만 보관
+    assert max(widths) < 200
+    assert len(cache._terms) == len(cache._vocabulary) == cache._matrix.shape[1]
+    assert set(cache._unknown) <= set(cache._entries)
+    assert cache.lookup("질문199번 알림장1393호 숙제2587", index) == "답변199"
+    # 압축한 뒤에도 단어와 열 번호가 맞음
+    assert all(cache._terms[col] == term for term, col in cache._vocabulary.items())
+
+def test_expiry_follows_store_order(index, monkeypatch):
+    import time
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache = SemanticCache(threshold=0.85, ttl=100)
+    cache.store("방과후 신청은 어떻게 하나요", "방과후")
+    now[0] += 60
+    cache.store("아이가 아파서 결석해요", "결석")
+    
+    # 적중해도 저장 시각은 그대로라 먼저 저장한 항목부터 만료
+    assert cache.lookup("방과후 신청은 어떻게 하나요", index) == "방과후"
+    now[0] += 50
+    assert cache.lookup("방과후 신청은 어떻게 하나요", index) is None
+    assert cache.lookup("아이가 아파서 결석해요", index) == "결석"
+    assert list(cache._created) == ["아이가 아파서 결석해요"]
+    
+    now[0] += 60
+    assert cache.lookup("아이가 아파서 결석해요", index) is None
+    assert cache.stats()["size"] == 0
\ No newline at end of file
@@ -0,0 +1,95 @@
+import sys
+import time
+from logic.session_store import InMemorySessionStore, turn_size
+from logic.sqlite_session_store import SQLiteSessionStore
+
+def walk(store):
+    """저장된 기록을 모두 훑어 (턴 수, 메모리 바이트)를 계산합니다."""
+    turns = sum(len(session[1]) for session in store._sessions.values())
+    memory = sys.getsizeof(store._sessions) + sum(
+        sys.getsizeof(user_id) + store._session_overhead + sum(turn_size(turn) for turn in session[1])
+        for user_id, session in store._sessions.items()
+    )
+    return turns, memory
+
+def test_counters_match_full_walk():
+    store = InMemorySessionStore(max_turns=3, capacity=5, idle_ttl=3600)
+    for i in range(40):
+        store.append(f"user-{i % 7}", "질문" * (i % 5 + 1), "답변" * i, "질문")
+        stats = store.stats()
+        assert (stats["turns"], stats["memory_bytes"]) == walk(store)
+    
+    assert store.stats()["users"] == 5
+    assert store.evictions > 0
+    
+    store.clear("user-3")
+    store.clear("unknown")
+    assert (store.stats()["turns"], store.memory_usage()) == walk(store)
+    
+    store.clear()
+    assert store.stats()["turns"] == 0
+    assert store.memory_usage() == sys.getsizeof(store._sessions)
+
+def test_counters_follow_expiry(monkeypatch):
+    store = InMemorySessionStore(max_turns=3, capacity=10, idle_ttl=60)
+    store.append("old", "질문", "답변", "질문")
+    store.append("idle", "질문", "답변", "질문")
+    
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert store.get_history("idle") == []
+    store.append("old", "새 질문", "새 답변", "질문")
+    
+    assert store.get_history("old")[0].user == "새 질문"
+    assert store.expirations == 1
+    assert (store.stats()["turns"], store.memory_usage()) == walk(store)
+
+def test_sqlite_stats_counts_are_cached(tmp_path):
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"), stats_interval=3600)
+    try:
+        store.append("user-1", "질문", "답변", "질문")
+        store.flush()
+        assert (store.stats()["users"], store.stats()["turns"]) == (1, 1)
+        
+        store.append("user-2", "질문", "답변", "질문")
+        store.flush()
+        # 주기 안에서는 보관한 결과를 사용
+        assert store.stats()["users"] == 1
+        
+        store.stats_interval = 0
+        assert (store.stats()["users"], store.stats()["turns"]) == (2, 2)
+    finally:
+        store.close()
+
+def walk_sqlite(store):
+    """SQLite 저장소의 읽기 캐시와 저장 대기 턴을 모두 훑어 메모리 바이트를 계산합니다."""
+    total = sys.getsizeof(store._cache) + sys.getsizeof(store._pending)
+    total += sum(turn_size(turn) for _, turn in store._pending)
+    for user_id, entry in store._cache.items():
+        total += sys.getsizeof(user_id) + sys.getsizeof(entry) + sys.getsizeof(entry[1])
+        total += sum(turn_size(turn) for turn in entry[1])
+    return total
+
+def test_sqlite_memory_counter_matches_full_walk(tmp_path):
+    # 저장 스레드가 중간에 저장하지 않도록 주기를 길게 (저장은 테스트에서 직접)
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"), max_turns=3, cache_size=4,
+                               flush_interval=3600)
+    try:
+        for i in range(30):
+            user_id = f"user-{i % 6}"
+            store.append(user_id, "질문" * (i % 5 + 1), "답변" * i, "질문")
+            assert store.memory_usage() == walk_sqlite(store)
+            # 읽으면 캐시에 들어가고, 캐시가 넘치면 오래된 사용자가 빠짐
+            store.get_history(user_id)
+            assert store.stats()["memory_bytes"] == walk_sqlite(store)
+        
+        assert len(store._cache) == 4
+        store.flush()
+        assert store.memory_usage() == walk_sqlite(store)
+        
+        store.clear("user-5")
+        assert store.memory_usage() == walk_sqlite(store)
+        store.clear()
+        assert store.memory_usage() == sys.getsizeof(store._cache) + sys.getsizeof(store._pending)
+    finally:
+        store.close()
\ No newline at end of file
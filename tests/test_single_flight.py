@@ -0,0 +1,65 @@
+import threading
+import time
+from logic.single_flight import SingleFlight
+
+def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls, results = [], []
+    
+    def fn():
+        calls.append(1)
+        release.wait()
+        return "답변"
+    
+    def caller():
+        results.append(flight.do("같은 질문", fn))
+    
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    # 모든 호출이 진행 중인 호출에 합류할 때까지 기다린 뒤 결과를 내보냄
+    while flight.stats()["shared"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert all(result == "답변" for result, _ in results)
+    assert flight.stats() == {"in_flight": 0, "calls": 1, "shared": 4}
+
+def test_error_is_shared_and_next_call_runs_again():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+    
+    def failing():
+        release.wait()
+        raise ValueError("빈 응답")
+    
+    def caller():
+        try:
+            flight.do("질문", failing)
+        except ValueError as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while flight.stats()["shared"] < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert len(errors) == 3
+    # 실패한 호출의 키는 지워지므로 다음 호출은 새로 실행
+    assert flight.do("질문", lambda: "다시 시도") == ("다시 시도", False)
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+    assert flight.stats()["calls"] == 2
\ No newline at end of file
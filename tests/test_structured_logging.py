@@ -0,0 +1,114 @@
+import json
+import logging
+import queue
+import random
+import pytest
+from logic import structured_logging
+from logic.structured_logging import JsonFormatter, _DroppingQueueHandler, _SamplingFilter, log_event
+
+class ListHandler(logging.Handler):
+    """받은 레코드를 목록에 모으는 핸들러"""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+@pytest.fixture
+def make_logger(request):
+    """다른 테스트의 wasuk 로거 설정과 섞이지 않는 전용 로거를 만듭니다."""
+    def make(*handlers):
+        logger = logging.getLogger(f"test_structured_logging.{request.node.name}")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        for handler in handlers:
+            logger.addHandler(handler)
+        request.addfinalizer(lambda: [logger.removeHandler(handler) for handler in handlers])
+        return logger
+    return make
+
+def test_sampling_filter_applies_rate_only_to_sampled_info(make_logger, monkeypatch):
+    handler = ListHandler()
+    handler.addFilter(_SamplingFilter(0.25))
+    logger = make_logger(handler)
+    
+    # random() 값이 sample_rate보다 작을 때만 통과
+    draws = iter([0.1, 0.5, 0.2, 0.9])
+    monkeypatch.setattr(structured_logging.random, "random", lambda: next(draws))
+    for i in range(4):
+        log_event(logger, "webhook.response", sampled=True, i=i)
+    assert [record.fields["i"] for record in handler.records] == [0, 2]
+    
+    # 샘플링하지 않는 로그와 경고 이상은 항상 통과 (random을 부르지 않음)
+    monkeypatch.setattr(structured_logging.random, "random", lambda: pytest.fail("random() called"))
+    log_event(logger, "startup.ready")
+    log_event(logger, "webhook.error", level=logging.WARNING, sampled=True)
+    log_event(logger, "webhook.error", level=logging.ERROR, sampled=True)
+    assert [record.getMessage() for record in handler.records[2:]] == ["startup.ready", "webhook.error", "webhook.error"]
+
+def test_sampling_rate_is_roughly_respected(make_logger, monkeypatch):
+    handler = ListHandler()
+    handler.addFilter(_SamplingFilter(0.1))
+    logger = make_logger(handler)
+    monkeypatch.setattr(structured_logging.random, "random", random.Random(1234).random)
+    
+    for _ in range(2000):
+        log_event(logger, "webhook.response", sampled=True)
+    assert 120 < len(handler.records) < 280
+
+def test_queue_full_drops_records_without_blocking(make_logger):
+    log_queue = queue.Queue(maxsize=2)
+    handler = _DroppingQueueHandler(log_queue)
+    logger = make_logger(handler)
+    
+    for i in range(5):
+        log_event(logger, "webhook.response", i=i)
+    
+    assert handler.dropped == 3
+    assert [log_queue.get_nowait().fields["i"] for _ in range(2)] == [0, 1]
+    
+    # 큐에 자리가 나면 다시 넣음
+    log_event(logger, "webhook.response", i=5)
+    assert log_queue.get_nowait().fields["i"] == 5
+    assert handler.dropped == 3
+
+def test_queued_record_has_final_message(make_logger):
+    log_queue = queue.Queue()
+    logger = make_logger(_DroppingQueueHandler(log_queue))
+    
+    logger.info("user %s", "alice")
+    record = log_queue.get_nowait()
+    assert record.msg == "user alice"
+    assert record.args is None
+
+def test_json_formatter_truncates_long_fields(make_logger):
+    handler = ListHandler()
+    logger = make_logger(handler)
+    log_event(logger, "gpt.response", text="가" * 30, count=3, ok=True, missing=None, items=[1, 2])
+    
+    entry = json.loads(JsonFormatter(max_field_chars=10).format(handler.records[0]))
+    assert entry["event"] == "gpt.response"
+    assert entry["level"] == "INFO"
+    assert entry["text"] == "가" * 10 + "…(+20자)"
+    assert (entry["count"], entry["ok"], entry["missing"], entry["items"]) == (3, True, None, "[1, 2]")
+
+def test_json_formatter_includes_truncated_exception(make_logger):
+    handler = ListHandler()
+    logger = make_logger(handler)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        log_event(logger, "gpt.error", level=logging.ERROR, exc_info=True)
+    
+    entry = json.loads(JsonFormatter(max_field_chars=1000).format(handler.records[0]))
+    assert entry["exception"].startswith("Traceback")
+    assert "RuntimeError: boom" in entry["exception"]
+
+def test_log_event_skips_disabled_levels(make_logger):
+    handler = ListHandler()
+    logger = make_logger(handler)
+    logger.setLevel(logging.WARNING)
+    log_event(logger, "webhook.response")
+    assert handler.records == []
\ No newline at end of file
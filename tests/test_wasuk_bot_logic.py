@@ -0,0 +1,114 @@
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pytest
+from logic import meal_handler
+from logic.meal_handler import format_meal_display
+from logic.meal_ingest import UPSERT_SQL, ensure_schema
+from logic.wasuk_bot_logic import WasukBotLogic
+
+class FixedDatetime(datetime):
+    """2025년 5월 14일(수)로 고정한 datetime"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 5, 14, 9, 0)
+
+def set_menu(path, date, menu):
+    conn = sqlite3.connect(path)
+    ensure_schema(conn)
+    conn.execute(UPSERT_SQL, (date, "중식", menu, format_meal_display(date, "중식", menu)))
+    conn.commit()
+    conn.close()
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "school_data.db")
+    set_menu(db_path, "2025-05-14", "잡곡밥\n미역국")
+    monkeypatch.setenv("SCHOOL_DB_PATH", db_path)
+    monkeypatch.setenv("RELOAD_INTERVAL", "0")
+    monkeypatch.setenv("SESSION_BACKEND", "memory")
+    monkeypatch.setattr(meal_handler, "datetime", FixedDatetime)
+    bot = WasukBotLogic()
+    bot.meal_handler.refresh_interval = 0
+    return bot
+
+def test_meal_answer_is_cached(bot):
+    first = bot.process_message("5월 14일 급식", "user-1")
+    second = bot.process_message("5월 14일 급식!", "user-2")
+    
+    assert second.text == first.text
+    assert bot.response_cache.stats()["hits"] == 1
+
+def test_meal_reload_invalidates_cached_answer(bot):
+    assert "미역국" in bot.process_message("5월 14일 급식", "user-1").text
+    
+    set_menu(bot.meal_handler.db_path, "2025-05-14", "카레라이스\n배추김치")
+    assert bot.meal_handler.reload_if_changed()
+    
+    answer = bot.process_message("5월 14일 급식", "user-1").text
+    assert "카레라이스" in answer
+    assert "미역국" not in answer
+    assert bot.response_cache.stats()["hits"] == 0
+@pytest.fixture
+def lazy_bot(tmp_path, monkeypatch):
+    # 색인 스냅샷과 GPT 답변 캐시는 임시 디렉터리에 만듦
+    monkeypatch.setenv("RELOAD_INTERVAL", "0")
+    monkeypatch.setenv("SESSION_BACKEND", "memory")
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    monkeypatch.setenv("QA_INDEX_DIR", str(tmp_path / "qa_index"))
+    monkeypatch.setenv("GPT_CACHE_PATH", str(tmp_path / "gpt_cache.db"))
+    return WasukBotLogic()
+
+def test_components_are_built_on_first_use(lazy_bot):
+    assert not any(lazy_bot.component_status().values())
+    assert not lazy_bot.ready
+    
+    # 캐시 키 계산과 인사 응답만으로는 무거운 모듈을 만들지 않음
+    lazy_bot._response_cache_key("오늘 급식")
+    lazy_bot.process_message("안녕", "user-1")
+    assert not any(lazy_bot.component_status().values())
+    
+    lazy_bot.process_message("전학 절차 알려줘", "user-1")
+    status = lazy_bot.component_status()
+    assert status["qa_handler"]
+    assert not status["meal_handler"] and not status["notice_handler"]
+
+def test_concurrent_first_use_builds_once(lazy_bot, monkeypatch):
+    calls = []
+    original = WasukBotLogic._create_meal_handler
+    
+    def slow_create(self):
+        calls.append(1)
+        time.sleep(0.05)
+        return original(self)
+    
+    monkeypatch.setattr(WasukBotLogic, "_create_meal_handler", slow_create)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        handlers = list(pool.map(lambda _: lazy_bot.meal_handler, range(8)))
+    
+    assert len(calls) == 1
+    assert all(handler is handlers[0] for handler in handlers)
+
+def test_warm_up_makes_bot_ready(lazy_bot):
+    lazy_bot.start_warm_up()
+    lazy_bot._warm_up_thread.join(30)
+    
+    assert lazy_bot.ready
+    assert all(lazy_bot.component_status().values())
+    # 데이터 모듈은 만들어질 때 한 번씩 재로드 대상으로 등록됨
+    modules = [lazy_bot.qa_handler, lazy_bot.meal_handler, lazy_bot.notice_handler]
+    assert [c for c in lazy_bot.reloader._components if c is not lazy_bot.intent_detector] == modules
+
+def test_warm_up_failure_leaves_component_unbuilt(lazy_bot, monkeypatch):
+    def broken(self):
+        raise RuntimeError("no notices")
+    
+    monkeypatch.setattr(WasukBotLogic, "_create_notice_handler", broken)
+    lazy_bot.warm_up()
+    
+    status = lazy_bot.component_status()
+    assert not status["notice_handler"]
+    assert status["qa_handler"] and status["meal_handler"]
+    assert not lazy_bot.ready
\ No newline at end of file